@@ -88,6 +88,13 @@ class AssetIssueHandler(EntityIssueHandler):
         """
         return self.__ASSET_FIELDS_MAPPING.keys()
 
+    @property
+    def _shotgun_entity_type(self):
+        """
+        Return the Shotgun Entity type this handler accepts events for.
+        """
+        return "Asset"
+
     def _get_jira_issue_field_for_shotgun_field(self, shotgun_entity_type, shotgun_field):
         """
         Returns the Jira Issue field id to use to sync the given Shotgun Entity
@@ -381,6 +388,8 @@ class AssetIssueHandler(EntityIssueHandler):
         if exclude_shotgun_fields is None:
             exclude_shotgun_fields = []
 
+        # Retrieve the Issue edit meta data once for all the fields.
+        jira_fields = self._jira.get_jira_issue_edit_meta(jira_issue)
         issue_data = {}
         for sg_field, jira_field in self.__ASSET_FIELDS_MAPPING.iteritems():
             if sg_field in exclude_shotgun_fields:
@@ -407,7 +416,8 @@ class AssetIssueHandler(EntityIssueHandler):
                     sg_field,
                     added,
                     removed,
-                    new_value
+                    new_value,
+                    jira_fields=jira_fields,
                 )
                 if jira_field:
                     issue_data[jira_field] = jira_value
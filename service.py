@@ -60,7 +60,10 @@ def status(pid_file):
     return pid
 
 
-def start(pid_file, port_number, settings, log_file=None):
+def start(
+    pid_file, port_number, settings, log_file=None, max_threads=1, async_workers=0,
+    queue_file=None, coalesce_window=0, warm_up=False, idle_timeout=30
+):
     """
     Start the service.
 
@@ -69,6 +72,19 @@ def start(pid_file, port_number, settings, log_file=None):
     :param str settings: Full path to settings file for the web app.
     :param str log_file: An optional log file to use for the daemon output. By
                          default the daemon uses a syslog handler.
+    :param int max_threads: The maximum number of requests the web app can
+                            process concurrently.
+    :param int async_workers: An optional number of background workers used by
+                              the web app to process events asynchronously.
+    :param str queue_file: An optional full path to a file used by the web app
+                           to persist events queued in asynchronous mode.
+    :param float coalesce_window: An optional number of seconds the web app waits
+                                  for other changes to a Shotgun Entity before
+                                  syncing it.
+    :param bool warm_up: If `True` the web app sets up all syncers before
+                         accepting requests.
+    :param float idle_timeout: An optional number of seconds the web app keeps
+                               connections open without receiving a request.
     """
     keep_fds = []
     if log_file:
@@ -87,7 +103,13 @@ def start(pid_file, port_number, settings, log_file=None):
             import webapp
             webapp.run_server(
                 port=port_number,
-                settings=settings
+                settings=settings,
+                max_threads=max_threads,
+                async_workers=async_workers,
+                queue_file=queue_file,
+                coalesce_window=coalesce_window,
+                warm_up=warm_up,
+                idle_timeout=idle_timeout,
             )
         except Exception as e:
             logger.exception(e)
@@ -160,6 +182,43 @@ def main():
         help="Full path to settings file.",
         required=True
     )
+    parser.add_argument(
+        "--max_threads",
+        type=int,
+        default=1,
+        help="The maximum number of requests to process concurrently.",
+    )
+    parser.add_argument(
+        "--async_workers",
+        type=int,
+        default=0,
+        help="Accept events immediately and process them in the background "
+             "with the given number of workers.",
+    )
+    parser.add_argument(
+        "--queue_file",
+        help="Full path to a file where to persist events accepted in "
+             "asynchronous mode, so they can be processed after a restart.",
+    )
+    parser.add_argument(
+        "--coalesce_window",
+        type=float,
+        default=0,
+        help="A number of seconds to wait for other changes to a Shotgun Entity "
+             "before syncing it, allowing to sync multiple changes at once.",
+    )
+    parser.add_argument(
+        "--warm_up",
+        action="store_true",
+        help="Setup all syncers before accepting requests.",
+    )
+    parser.add_argument(
+        "--idle_timeout",
+        type=float,
+        default=30,
+        help="The number of seconds connections are kept open without "
+             "receiving a request, 0 to close them after each request.",
+    )
     parser.add_argument(
         "action",
         choices=["start", "stop", "restart", "status"],
@@ -173,6 +232,12 @@ def main():
             args.port,
             os.path.abspath(args.settings),
             args.log_file,
+            args.max_threads,
+            args.async_workers,
+            args.queue_file and os.path.abspath(args.queue_file),
+            args.coalesce_window,
+            args.warm_up,
+            args.idle_timeout,
         )
     elif args.action == "stop":
         stop(args.pid_file)
@@ -189,6 +254,12 @@ def main():
             args.port,
             os.path.abspath(args.settings),
             args.log_file,
+            args.max_threads,
+            args.async_workers,
+            args.queue_file and os.path.abspath(args.queue_file),
+            args.coalesce_window,
+            args.warm_up,
+            args.idle_timeout,
         )
 
 
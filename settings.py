@@ -29,6 +29,9 @@ SHOTGUN = {
     "script_name": os.environ.get("SGJIRA_SG_SCRIPT_NAME"),
     "script_key": os.environ.get("SGJIRA_SG_SCRIPT_KEY"),
     "http_proxy": None,  # If set, the Shotgun connection is done through this proxy.
+    # The maximum number of Shotgun connections used concurrently, 1 if not set.
+    # This should be the number of events processed concurrently.
+    "pool_size": None,
 }
 # Jira site and credentials, the user name needs to be an email address or
 # the user login name, e.g. ford_escort for "Ford Escort".
@@ -36,6 +39,32 @@ JIRA = {
     "site": os.environ.get("SGJIRA_JIRA_SITE"),
     "user": os.environ.get("SGJIRA_JIRA_USER"),
     "secret": os.environ.get("SGJIRA_JIRA_USER_SECRET"),
+    # Optional connection settings, default values are used if not set.
+    # The maximum number of connections kept open with the Jira site. This
+    # should be at least the number of events processed concurrently.
+    "pool_size": None,
+    # The number of times failed requests are retried.
+    "max_retries": None,
+    # Number of seconds to wait for a connection or for a response.
+    "connect_timeout": None,
+    "read_timeout": None,
+    # Whether connections are kept open between requests.
+    "keep_alive": True,
+    # The maximum number of requests sent per second, and the number of
+    # requests which can be sent at once, not limited if not set.
+    "rate_limit": None,
+    "rate_limit_burst": None,
+    # The number of times requests rejected because of Jira rate limits are
+    # retried, 5 if not set.
+    "rate_limit_retries": None,
+}
+
+# Optional bridge settings.
+BRIDGE = {
+    # If set, Jira fields and Shotgun schemas are saved in this file and loaded
+    # from it at startup, allowing the bridge to start faster. Relative paths
+    # are relative to this settings file.
+    "schema_cache_file": None,
 }
 
 # Define logging
@@ -6,5 +6,6 @@
 #
 
 from .bridge import Bridge
+from .event_queue import EventQueue
 from .syncer import Syncer
 from .task_issue_syncer import TaskIssueSyncer
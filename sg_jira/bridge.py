@@ -11,25 +11,303 @@ import logging
 import logging.config
 import importlib
 import urllib
+import threading
+import time
+import Queue
 
 from .shotgun_session import ShotgunSession
 from .jira_session import JiraSession
 from .constants import ALL_SETTINGS_KEYS
 from .constants import LOGGING_SETTINGS_KEY, SYNC_SETTINGS_KEY
 from .constants import SHOTGUN_SETTINGS_KEY, JIRA_SETTINGS_KEY
-from .utils import utf8_to_unicode
+from .constants import BRIDGE_SETTINGS_KEY
+from .schema_cache import SchemaCache
+from .utils import utf8_to_unicode, run_in_parallel
 
 logger = logging.getLogger(__name__)
 # Ensure basic logging is always enabled
 logging.basicConfig(format="%(levelname)s:%(name)s:%(message)s")
 
 
+class DispatchedCall(object):
+    """
+    A call dispatched with a :class:`Dispatcher`, allowing to wait for its result.
+    """
+    def __init__(
+        self, method, args, kwargs, callback=None, key=None, coalesce_key=None,
+        coalesce_method=None
+    ):
+        """
+        :param method: A callable.
+        :param args: A list of arguments for the callable.
+        :param kwargs: A dictionary of keyword arguments for the callable.
+        :param callback: Optional callable called with the result and the error,
+                         if any, once the call completed.
+        :param key: Optional hashable key used to dispatch the call.
+        :param coalesce_key: Optional hashable key, calls with the same key and
+                             the same keyword arguments can be coalesced into
+                             a single call.
+        :param coalesce_method: Optional callable used to perform coalesced
+                                calls, called with the list of arguments of
+                                each coalesced call and their keyword arguments.
+        """
+        super(DispatchedCall, self).__init__()
+        self._method = method
+        self._args = args
+        self._kwargs = kwargs
+        self._callback = callback
+        self.key = key
+        self.coalesce_key = coalesce_key
+        self._coalesce_method = coalesce_method
+        self._done = threading.Event()
+        self._result = None
+        self._error = None
+
+    @property
+    def done(self):
+        """
+        Return `True` if the call completed, `False` otherwise.
+        """
+        return self._done.is_set()
+
+    def can_coalesce(self, call):
+        """
+        Return `True` if the given call can be coalesced with this one, `False`
+        otherwise.
+
+        Calls can be coalesced if they have the same coalescing key and the same
+        keyword arguments, since only one set of keyword arguments is passed to
+        the coalescing method.
+
+        :param call: A :class:`DispatchedCall` instance.
+        """
+        return (
+            self.coalesce_key is not None
+            and call.coalesce_key == self.coalesce_key
+            and call._kwargs == self._kwargs
+        )
+
+    def run(self):
+        """
+        Perform the call, store its result and call the callback, if any.
+        """
+        result = None
+        error = None
+        try:
+            result = self._method(*self._args, **self._kwargs)
+        except Exception as e:
+            error = e
+        self._complete(result, error)
+
+    @classmethod
+    def run_coalesced(cls, calls):
+        """
+        Perform the given calls with a single call to the coalescing method of
+        the first call.
+
+        All calls are completed with the result of the coalesced call.
+
+        :param calls: A list of :class:`DispatchedCall` instances which can be
+                      coalesced with the first one.
+        """
+        if len(calls) == 1:
+            calls[0].run()
+            return
+        result = None
+        error = None
+        try:
+            result = calls[0]._coalesce_method(
+                [call._args for call in calls], **calls[0]._kwargs
+            )
+        except Exception as e:
+            error = e
+        for call in calls:
+            call._complete(result, error)
+
+    def _complete(self, result, error):
+        """
+        Store the given result and error and call the callback, if any.
+        """
+        self._result = result
+        self._error = error
+        self._done.set()
+        if self._callback:
+            try:
+                self._callback(self._result, self._error)
+            except Exception as e:
+                logger.exception(e)
+
+    def result(self, timeout=None):
+        """
+        Wait for the call to complete and return its result.
+
+        :param float timeout: Optional maximum number of seconds to wait.
+        :returns: The value returned by the call.
+        :raises RuntimeError: if the call did not complete in the given time.
+        :raises: The exception raised by the call, if any.
+        """
+        if not self._done.wait(timeout):
+            raise RuntimeError("Dispatched call did not complete in time")
+        if self._error:
+            raise self._error
+        return self._result
+
+
+class Dispatcher(object):
+    """
+    Dispatch calls to a pool of worker threads.
+
+    Each worker processes an ordered lane of calls, and calls are routed to lanes
+    from a key: calls with the same key are processed in the order they were
+    dispatched, while calls with different keys can be processed in parallel.
+
+    If a coalescing window is set, calls with a coalescing key are collected
+    for this amount of time from the first one, and all of them are performed
+    with a single call. Calls with other keys are still collected and performed
+    in the meantime.
+    """
+    def __init__(self, workers, coalesce_window=0):
+        """
+        Start the given number of worker threads.
+
+        :param int workers: The number of worker threads, which is also the
+                            number of lanes.
+        :param float coalesce_window: Optional number of seconds to wait for
+                                      calls which can be coalesced.
+        :raises ValueError: if the number of workers is not valid.
+        """
+        super(Dispatcher, self).__init__()
+        if workers < 1:
+            raise ValueError(
+                "Invalid number of workers %s, it must be at least 1" % workers
+            )
+        self._coalesce_window = coalesce_window
+        self._lanes = []
+        for i in range(workers):
+            lane = Queue.Queue()
+            worker = threading.Thread(
+                target=self._process_lane,
+                args=(lane,),
+                name="sg_jira_dispatcher_%d" % i,
+            )
+            worker.daemon = True
+            worker.start()
+            self._lanes.append(lane)
+
+    def dispatch(
+        self, key, method, args=None, kwargs=None, callback=None,
+        coalesce_key=None, coalesce_method=None
+    ):
+        """
+        Dispatch a call to the given method on the lane for the given key.
+
+        :param key: A hashable key, e.g. a tuple with a Shotgun Entity type and id.
+        :param method: A callable.
+        :param args: Optional list of arguments for the callable.
+        :param kwargs: Optional dictionary of keyword arguments for the callable.
+        :param callback: Optional callable called from the worker thread with
+                         the result and the error, if any, once the call completed.
+        :param coalesce_key: Optional hashable key, calls with the same key and
+                             the same keyword arguments dispatched within the
+                             coalescing window are coalesced. Calls with the
+                             same coalescing key must have the same lane key.
+        :param coalesce_method: A callable performing coalesced calls, called
+                                with the list of arguments of each call.
+        :returns: A :class:`DispatchedCall` instance.
+        """
+        call = DispatchedCall(
+            method, args or [], kwargs or {}, callback, key, coalesce_key, coalesce_method
+        )
+        self._lanes[hash(key) % len(self._lanes)].put(call)
+        return call
+
+    def _process_lane(self, lane):
+        """
+        Process calls from the given lane until a `None` call is retrieved.
+
+        :param lane: A :class:`Queue.Queue` instance.
+        """
+        # Calls being collected for coalescing, indexed by coalescing key, with
+        # the time at which they should be performed.
+        groups = {}
+        # The coalescing key of the group being collected for each call key.
+        group_keys = {}
+        # Calls retrieved while a group is collected for their key, which can't
+        # be coalesced with it, indexed by call key. They are processed once
+        # the group was performed, so calls for a given key are still performed
+        # in order.
+        waiting = {}
+
+        def process(call):
+            """
+            Perform the given call, or add it to a group of calls to coalesce.
+            """
+            coalesce_key = group_keys.get(call.key)
+            if coalesce_key is not None:
+                calls = groups[coalesce_key][1]
+                if not waiting.get(call.key) and calls[0].can_coalesce(call):
+                    calls.append(call)
+                else:
+                    waiting.setdefault(call.key, []).append(call)
+                return
+            if call.coalesce_key is None or self._coalesce_window <= 0:
+                call.run()
+                return
+            groups[call.coalesce_key] = (time.time() + self._coalesce_window, [call])
+            group_keys[call.key] = call.coalesce_key
+
+        def perform(coalesce_key):
+            """
+            Perform the group of calls with the given coalescing key, and then
+            the calls waiting for it.
+            """
+            calls = groups.pop(coalesce_key)[1]
+            del group_keys[calls[0].key]
+            DispatchedCall.run_coalesced(calls)
+            for call in waiting.pop(calls[0].key, []):
+                process(call)
+
+        while True:
+            timeout = None
+            if groups:
+                timeout = max(0, min(group[0] for group in groups.values()) - time.time())
+            try:
+                call = lane.get(timeout=timeout)
+            except Queue.Empty:
+                pass
+            else:
+                if call is None:
+                    # Perform all pending calls before stopping.
+                    while groups:
+                        perform(min(groups, key=lambda key: groups[key][0]))
+                    return
+                process(call)
+            now = time.time()
+            for coalesce_key in sorted(groups, key=lambda key: groups[key][0]):
+                # Groups might have been performed and replaced meanwhile.
+                if coalesce_key in groups and groups[coalesce_key][0] <= now:
+                    perform(coalesce_key)
+
+    def close(self):
+        """
+        Stop the worker threads once all pending calls were processed.
+        """
+        for lane in self._lanes:
+            lane.put(None)
+
+
 class Bridge(object):
     """
     A bridge between Shotgun and Jira.
 
     The bridge handles connections to the Shotgun and Jira servers and dispatches
     sync events.
+
+    A bridge can be shared between multiple threads, sync events being processed
+    concurrently. Sync events can be dispatched to a pool of worker threads with
+    :meth:`dispatch_in_jira` and :meth:`dispatch_in_shotgun`: events for a
+    given Shotgun Entity or Jira resource are processed in order, events for
+    different Entities or resources are processed in parallel.
     """
     def __init__(
         self,
@@ -41,10 +319,23 @@ class Bridge(object):
         jira_secret,
         sync_settings=None,
         sg_http_proxy=None,
+        schema_cache_file=None,
+        sg_pool_size=None,
+        jira_pool_size=None,
+        jira_max_retries=None,
+        jira_connect_timeout=None,
+        jira_read_timeout=None,
+        jira_keep_alive=True,
+        jira_rate_limit=None,
+        jira_rate_limit_burst=None,
+        jira_rate_limit_retries=None,
     ):
         """
         Instatiate a new bridge between the given SG site and Jira site.
 
+        If a schema cache file is set, the Jira fields and Shotgun schemas
+        saved in it are used at startup and revalidated in the background.
+
         :param str sg_site: A Shotgun site url.
         :param str sg_script: A Shotgun script user name.
         :param str sg_script_key: The script user key for the Shotgun script.
@@ -55,27 +346,156 @@ class Bridge(object):
         :param sync_settings: A dictionary where keys are settings names.
         :param str sg_http_proxy: Optional, a http proxy to use for the Shotgun
                                   connection, or None.
+        :param str schema_cache_file: Optional, full path to a file used to save
+                                      Jira fields and Shotgun schemas, or None.
+        :param int sg_pool_size: Optional, the maximum number of Shotgun
+                                 connections used concurrently, or None.
+        :param int jira_pool_size: Optional, the maximum number of connections
+                                   kept open with the Jira site, or None.
+        :param int jira_max_retries: Optional, the number of times failed Jira
+                                     requests are retried, or None.
+        :param float jira_connect_timeout: Optional, the number of seconds to
+                                           wait for a connection to the Jira
+                                           site, or None.
+        :param float jira_read_timeout: Optional, the number of seconds to wait
+                                        for a response from the Jira site, or
+                                        None.
+        :param bool jira_keep_alive: Optional, whether connections to the Jira
+                                     site are kept open between requests.
+        :param float jira_rate_limit: Optional, the maximum number of requests
+                                      sent per second to the Jira site, or None.
+        :param int jira_rate_limit_burst: Optional, the maximum number of
+                                          requests which can be sent at once to
+                                          the Jira site, or None.
+        :param int jira_rate_limit_retries: Optional, the maximum number of
+                                            times requests rejected by the Jira
+                                            site because of its rate limits are
+                                            retried, or None.
         """
         super(Bridge, self).__init__()
-        self._shotgun = ShotgunSession(
-            sg_site,
-            script_name=sg_script,
-            api_key=sg_script_key,
-            http_proxy=sg_http_proxy,
-        )
-        self._shotgun.add_user_agent("sg_jira_sync")
-
-        self._jira = JiraSession(
-            jira_site,
-            auth=(
-                jira_user,
-                jira_secret
-            ),
-        )
+
+        def connect_shotgun():
+            shotgun = ShotgunSession(
+                sg_site,
+                script_name=sg_script,
+                api_key=sg_script_key,
+                http_proxy=sg_http_proxy,
+                pool_size=sg_pool_size,
+            )
+            shotgun.add_user_agent("sg_jira_sync")
+            return shotgun
+
+        jira_options = {}
+        if jira_max_retries is not None:
+            jira_options["max_retries"] = jira_max_retries
+        if jira_connect_timeout is not None or jira_read_timeout is not None:
+            jira_options["timeout"] = (jira_connect_timeout, jira_read_timeout)
+
+        def connect_jira():
+            return JiraSession(
+                jira_site,
+                auth=(
+                    jira_user,
+                    jira_secret
+                ),
+                pool_size=jira_pool_size,
+                keep_alive=jira_keep_alive,
+                rate_limit=jira_rate_limit,
+                rate_limit_burst=jira_rate_limit_burst,
+                rate_limit_retries=jira_rate_limit_retries,
+                **jira_options
+            )
+
+        # Shotgun and Jira are independent: connecting to and setting them up
+        # concurrently makes the bridge start in the time taken by the slowest
+        # site rather than in the time taken by both.
+        self._shotgun, self._jira = run_in_parallel([connect_shotgun, connect_jira])
         self._sync_settings = sync_settings or {}
         self._syncers = {}
-        self._jira.setup()
-        self._shotgun.setup()
+        # Syncers are instantiated on demand and can be requested from multiple
+        # threads.
+        self._syncers_lock = threading.Lock()
+        self._syncer_locks = {}
+        self._dispatcher = None
+        self._schema_cache = None
+        if schema_cache_file:
+            self._schema_cache = SchemaCache(schema_cache_file, sg_site, jira_site)
+        self._setup_sessions()
+
+    def _setup_sessions(self):
+        """
+        Setup the Jira and Shotgun sessions, using the schema cache snapshot
+        if one is available.
+        """
+        snapshot = self._schema_cache.load() if self._schema_cache else None
+        if snapshot:
+            jira_fields_map, shotgun_schemas = snapshot
+            self._shotgun.set_field_schemas(shotgun_schemas)
+            try:
+                run_in_parallel([
+                    lambda: self._jira.setup(jira_fields_map),
+                    self._shotgun.setup,
+                ])
+            except RuntimeError as e:
+                # The snapshot might be outdated, retrieve everything again.
+                logger.warning(
+                    "Ignoring schema cache file %s: %s" % (self._schema_cache.path, e)
+                )
+                self._shotgun.clear_cached_field_schema()
+                snapshot = None
+        if not snapshot:
+            run_in_parallel([self._jira.setup, self._shotgun.setup])
+            self.save_schema_cache()
+            return
+        thread = threading.Thread(
+            target=self.revalidate_schema_cache,
+            name="sg_jira_schema_cache",
+        )
+        thread.daemon = True
+        thread.start()
+
+    def save_schema_cache(self):
+        """
+        Save the current Jira fields and Shotgun schemas to the schema cache
+        file, if one is used.
+        """
+        if not self._schema_cache:
+            return
+        self._schema_cache.save(
+            self._jira.jira_fields_map,
+            self._shotgun.field_schemas,
+        )
+
+    def revalidate_schema_cache(self):
+        """
+        Retrieve Jira fields and Shotgun schemas, replacing the values loaded
+        from the schema cache file if they changed.
+
+        This is called in a background thread when values were loaded from the
+        schema cache file at startup.
+        """
+        try:
+            jira_fields_map = self._jira.retrieve_jira_fields_map()
+            current_schemas = self._shotgun.field_schemas
+            shotgun_schemas = self._shotgun.retrieve_field_schemas(
+                current_schemas.keys()
+            )
+            if (
+                jira_fields_map == self._jira.jira_fields_map
+                and shotgun_schemas == current_schemas
+            ):
+                logger.debug("Schema cache is up to date")
+                return
+            logger.info("Schema cache is outdated, updating it")
+            # Schemas retrieved since we started are kept.
+            current_schemas = self._shotgun.field_schemas
+            current_schemas.update(shotgun_schemas)
+            self._shotgun.set_field_schemas(current_schemas)
+            self._jira.setup(jira_fields_map)
+            self.save_schema_cache()
+        except Exception as e:
+            logger.error("Unable to revalidate schema cache: %s" % e)
+            logger.debug("%s" % e, exc_info=True)
 
     @classmethod
     def get_bridge(cls, settings_file):
@@ -125,6 +545,16 @@ class Bridge(object):
         if not sync_settings:
             raise ValueError("Missing sync settings in %s" % settings_file_path)
 
+        # Bridge settings are optional
+        bridge_settings = settings[BRIDGE_SETTINGS_KEY] or {}
+        schema_cache_file = bridge_settings.get("schema_cache_file")
+        if schema_cache_file:
+            # Relative paths are relative to the settings file.
+            schema_cache_file = os.path.join(
+                os.path.dirname(settings_file_path),
+                schema_cache_file,
+            )
+
         logger.info("Successfully read settings from %s" % settings_file_path)
         try:
             return cls(
@@ -136,6 +566,16 @@ class Bridge(object):
                 jira_settings["secret"],
                 sync_settings,
                 sg_http_proxy=shotgun_settings.get("http_proxy"),
+                schema_cache_file=schema_cache_file,
+                sg_pool_size=shotgun_settings.get("pool_size"),
+                jira_pool_size=jira_settings.get("pool_size"),
+                jira_max_retries=jira_settings.get("max_retries"),
+                jira_connect_timeout=jira_settings.get("connect_timeout"),
+                jira_read_timeout=jira_settings.get("read_timeout"),
+                jira_keep_alive=jira_settings.get("keep_alive", True),
+                jira_rate_limit=jira_settings.get("rate_limit"),
+                jira_rate_limit_burst=jira_settings.get("rate_limit_burst"),
+                jira_rate_limit_retries=jira_settings.get("rate_limit_retries"),
             )
         except Exception as e:
             logger.exception(e)
@@ -228,6 +668,19 @@ class Bridge(object):
         """
         return self._sync_settings.keys()
 
+    def clear_caches(self):
+        """
+        Clear all cached Shotgun and Jira values, forcing them to be retrieved
+        again when needed.
+
+        This can be used after changes were made in Shotgun or Jira configurations,
+        e.g. Project or field changes, without restarting the bridge.
+        """
+        logger.info("Clearing all cached values")
+        self._jira.clear_caches()
+        self._shotgun.clear_cached_field_schema()
+        self._shotgun.clear_cached_entities()
+
     def get_syncer(self, name):
         """
         Returns a :class:`Syncer` instance for the given settings name.
@@ -235,50 +688,240 @@ class Bridge(object):
         :param str: A settings name.
         :raises ValueError: for invalid settings.
         """
-        if name not in self._syncers:
-            # Create the syncer from the settings
-            sync_settings = self._sync_settings.get(name)
-            if sync_settings is None:
-                raise ValueError("Missing sync settings for %s" % name)
-            if not isinstance(sync_settings, dict):
-                raise ValueError(
-                    "Invalid sync settings for %s, it must be dictionary." % name
+        syncer = self._syncers.get(name)
+        if syncer:
+            return syncer
+        # Syncers for different settings can be created concurrently.
+        with self._syncers_lock:
+            syncer_lock = self._syncer_locks.setdefault(name, threading.Lock())
+        with syncer_lock:
+            # Check again in case the syncer was created by another thread
+            # while we were waiting for the lock.
+            if name not in self._syncers:
+                self._syncers[name] = self._create_syncer(name)
+                # Setting up the syncer might have retrieved additional
+                # Shotgun schemas.
+                self.save_schema_cache()
+        return self._syncers[name]
+
+    def get_manifest(self, name):
+        """
+        Return a manifest describing the Shotgun events accepted by the syncer
+        for the given settings name.
+
+        The manifest can be used by event senders to discard events which would
+        be rejected, before sending them.
+
+        :param str name: A settings name.
+        :returns: A dictionary with a "shotgun_fields" key whose value is a
+                  dictionary where keys are Shotgun Entity types and values
+                  lists of Shotgun field names, or `None` if events for any
+                  Shotgun field could be accepted.
+        :raises ValueError: for invalid settings.
+        """
+        return {
+            "shotgun_fields": self.get_syncer(name).get_accepted_shotgun_fields(),
+        }
+
+    def warm_up(self):
+        """
+        Instantiate and setup syncers for all sync settings, in parallel.
+
+        Syncers are otherwise instantiated when the first event for their
+        settings is processed. Warming up the bridge avoids delaying this
+        event and reports misconfigurations immediately.
+
+        :raises RuntimeError: if any syncer can't be setup.
+        """
+        def setup_syncer(name):
+            try:
+                self.get_syncer(name)
+            except Exception as e:
+                raise RuntimeError(
+                    "Unable to setup syncers for %s: %s" % (name, e)
                 )
-            # Retrieve the syncer
-            syncer_name = sync_settings.get("syncer")
-            if not syncer_name:
-                raise ValueError("Missing `syncer` setting for %s" % name)
-            if "." not in syncer_name:
-                raise ValueError(
-                    "Invalid `syncer` setting %s for %s: "
-                    "it must be a <module path>.<class name>" % (
-                        syncer_name,
-                        name
-                    )
+
+        names = sorted(self.sync_settings_names)
+        run_in_parallel(
+            [lambda name=name: setup_syncer(name) for name in names],
+            thread_name="sg_jira_warm_up",
+        )
+        logger.info("Syncers ready for %s" % ", ".join(names))
+
+    def _create_syncer(self, name):
+        """
+        Instantiate and setup a :class:`Syncer` for the given settings name.
+
+        :param str: A settings name.
+        :returns: A :class:`Syncer` instance.
+        :raises ValueError: for invalid settings.
+        """
+        # Create the syncer from the settings
+        sync_settings = self._sync_settings.get(name)
+        if sync_settings is None:
+            raise ValueError("Missing sync settings for %s" % name)
+        if not isinstance(sync_settings, dict):
+            raise ValueError(
+                "Invalid sync settings for %s, it must be dictionary." % name
+            )
+        # Retrieve the syncer
+        syncer_name = sync_settings.get("syncer")
+        if not syncer_name:
+            raise ValueError("Missing `syncer` setting for %s" % name)
+        if "." not in syncer_name:
+            raise ValueError(
+                "Invalid `syncer` setting %s for %s: "
+                "it must be a <module path>.<class name>" % (
+                    syncer_name,
+                    name
                 )
-            module_name, class_name = syncer_name.rsplit(".", 1)
-            module = importlib.import_module(module_name)
-            try:
-                syncer_class = getattr(module, class_name)
-            except AttributeError as e:
-                logger.debug("%s" % e, exc_info=True)
-                raise ValueError(
-                    "Unable to retrieve a %s class from module %s" % (
-                        class_name,
-                        module,
-                    )
+            )
+        module_name, class_name = syncer_name.rsplit(".", 1)
+        module = importlib.import_module(module_name)
+        try:
+            syncer_class = getattr(module, class_name)
+        except AttributeError as e:
+            logger.debug("%s" % e, exc_info=True)
+            raise ValueError(
+                "Unable to retrieve a %s class from module %s" % (
+                    class_name,
+                    module,
                 )
-            # Retrieve the settings for the syncer, if any
-            settings = sync_settings.get("settings") or {}
-            # Instantiate the syncer with our standard parameters and any
-            # additional settings as parameters.
-            self._syncers[name] = syncer_class(
-                name=name,
-                bridge=self,
-                **settings
             )
-            self._syncers[name].setup()
-        return self._syncers[name]
+        # Retrieve the settings for the syncer, if any
+        settings = sync_settings.get("settings") or {}
+        # Instantiate the syncer with our standard parameters and any
+        # additional settings as parameters.
+        syncer = syncer_class(
+            name=name,
+            bridge=self,
+            **settings
+        )
+        syncer.setup()
+        return syncer
+
+    def start_dispatcher(self, workers, coalesce_window=0):
+        """
+        Start dispatching sync events to the given number of worker threads.
+
+        Until a dispatcher is started, dispatched sync events are processed
+        immediately from the calling thread.
+
+        If a coalescing window is set, Shotgun events for a given Entity
+        dispatched within this window are processed together with
+        :meth:`sync_events_in_jira`.
+
+        :param int workers: The number of worker threads to use.
+        :param float coalesce_window: Optional number of seconds to wait for
+                                      Shotgun events to coalesce.
+        :raises RuntimeError: if a dispatcher was already started.
+        """
+        if self._dispatcher:
+            raise RuntimeError("A dispatcher was already started")
+        self._dispatcher = Dispatcher(workers, coalesce_window)
+
+    def stop_dispatcher(self):
+        """
+        Stop the dispatcher, if any, once all pending sync events were processed.
+        """
+        if self._dispatcher:
+            self._dispatcher.close()
+            self._dispatcher = None
+
+    def dispatch_in_jira(
+        self, settings_name, entity_type, entity_id, event, callback=None, **kwargs
+    ):
+        """
+        Dispatch a sync of the given Shotgun Entity to Jira.
+
+        Syncs for a given Shotgun Entity are performed in the order they
+        were dispatched. Syncs coalesced by the dispatcher all get the result of
+        :meth:`sync_events_in_jira`.
+
+        :param str settings_name: The name of the settings to use for this sync.
+        :param str entity_type: The Shotgun Entity type to sync.
+        :param int entity_id: The id of the Shotgun Entity to sync.
+        :param event: A dictionary with the event meta data for the change.
+        :param callback: Optional callable called with the result of
+                         :meth:`sync_in_jira` and the error, if any, once the
+                         sync completed.
+        :returns: A :class:`DispatchedCall` instance.
+        """
+        return self._dispatch(
+            ("sg2jira", entity_type, entity_id),
+            self.sync_in_jira,
+            [settings_name, entity_type, entity_id, event],
+            kwargs,
+            callback,
+            coalesce_key=(settings_name, entity_type, entity_id),
+            coalesce_method=self._sync_coalesced_in_jira,
+        )
+
+    def dispatch_in_shotgun(
+        self, settings_name, resource_type, resource_id, event, callback=None, **kwargs
+    ):
+        """
+        Dispatch a sync of the given Jira Resource to Shotgun.
+
+        Syncs for a given Jira Resource are performed in the order they
+        were dispatched.
+
+        :param str settings_name: The name of the settings to use for this sync.
+        :param str resource_type: The type of Jira resource sync, e.g. Issue.
+        :param str resource_id: The id of the Jira resource to sync.
+        :param event: A dictionary with the event meta data for the change.
+        :param callback: Optional callable called with the result of
+                         :meth:`sync_in_shotgun` and the error, if any, once the
+                         sync completed.
+        :returns: A :class:`DispatchedCall` instance.
+        """
+        return self._dispatch(
+            ("jira2sg", resource_type, resource_id),
+            self.sync_in_shotgun,
+            [settings_name, resource_type, resource_id, event],
+            kwargs,
+            callback,
+        )
+
+    def _dispatch(
+        self, key, method, args, kwargs, callback, coalesce_key=None, coalesce_method=None
+    ):
+        """
+        Dispatch a call to the given method with the current dispatcher, or
+        perform it immediately if no dispatcher was started.
+
+        :returns: A :class:`DispatchedCall` instance.
+        """
+        dispatcher = self._dispatcher
+        if dispatcher:
+            return dispatcher.dispatch(
+                key, method, args, kwargs, callback, coalesce_key, coalesce_method
+            )
+        call = DispatchedCall(method, args, kwargs, callback)
+        call.run()
+        return call
+
+    def _sync_coalesced_in_jira(self, calls_args, **kwargs):
+        """
+        Sync coalesced Shotgun events to Jira.
+
+        :param calls_args: A list of argument lists for :meth:`sync_in_jira`,
+                           all for the same settings and Shotgun Entity.
+        :returns: The result of :meth:`sync_events_in_jira`.
+        """
+        settings_name, entity_type, entity_id = calls_args[0][:3]
+        logger.debug(
+            "Coalesced %d events for Shotgun %s (%s)" % (
+                len(calls_args), entity_type, entity_id
+            )
+        )
+        return self.sync_events_in_jira(
+            settings_name,
+            entity_type,
+            entity_id,
+            [call_args[3] for call_args in calls_args],
+            **kwargs
+        )
 
     def sync_in_jira(self, settings_name, entity_type, entity_id, event, **kwargs):
         """
@@ -296,6 +939,8 @@ class Bridge(object):
             # Shotgun events might contain utf-8 encoded strings, convert them
             # to unicode before processing.
             safe_event = utf8_to_unicode(event)
+            # The Entity was changed in Shotgun, don't trust cached values for it.
+            self._shotgun.invalidate_cached_entity(entity_type, entity_id)
             syncer = self.get_syncer(settings_name)
             # See comment in Syncer class: we assume copmlicated logic can be
             # handled in a single handler, so we don't have to support multiple
@@ -314,6 +959,49 @@ class Bridge(object):
             raise
         return synced
 
+    def sync_events_in_jira(self, settings_name, entity_type, entity_id, events, **kwargs):
+        """
+        Sync the given list of changes for the given Shotgun Entity to Jira.
+
+        Consecutive events accepted by the same handler are processed together,
+        allowing handlers to merge changes.
+
+        :param str settings_name: The name of the settings to use for this sync.
+        :param str entity_type: The Shotgun Entity type to sync.
+        :param int entity_id: The id of the Shotgun Entity to sync.
+        :param events: A list of dictionaries with the event meta data for the
+                       changes, in the order they happened.
+        :returns: True if the Entity was actually synced in Jira, False if
+                  syncing was skipped for any reason.
+        """
+        synced = False
+        try:
+            # The Entity was changed in Shotgun, don't trust cached values for it.
+            self._shotgun.invalidate_cached_entity(entity_type, entity_id)
+            syncer = self.get_syncer(settings_name)
+            # Group consecutive events accepted by the same handler.
+            groups = []
+            for event in events:
+                # Shotgun events might contain utf-8 encoded strings, convert them
+                # to unicode before processing.
+                safe_event = utf8_to_unicode(event)
+                handler = syncer.accept_shotgun_event(entity_type, entity_id, safe_event)
+                if not handler:
+                    continue
+                if groups and groups[-1][0] is handler:
+                    groups[-1][1].append(safe_event)
+                else:
+                    groups.append((handler, [safe_event]))
+            for handler, handler_events in groups:
+                self._shotgun.set_session_uuid(handler_events[-1].get("session_uuid"))
+                if handler.process_shotgun_events(entity_type, entity_id, handler_events):
+                    synced = True
+        except Exception as e:
+            # Catch the exception to log it and let it bubble up
+            logger.exception(e)
+            raise
+        return synced
+
     def sync_in_shotgun(self, settings_name, resource_type, resource_id, event, **kwargs):
         """
         Sync the given Jira Resource to Shotgun.
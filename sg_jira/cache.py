@@ -0,0 +1,127 @@
+# Copyright 2018 Autodesk, Inc.  All rights reserved.
+#
+# Use of this software is subject to the terms of the Autodesk license agreement
+# provided at the time of installation or download, or which otherwise accompanies
+# this software in either electronic or hard copy form.
+#
+
+import collections
+import threading
+import time
+
+
+class TTLCache(object):
+    """
+    A thread safe cache where entries expire after a given amount of time.
+
+    If a maximum size is set, the least recently used entries are discarded
+    when the cache is full.
+    """
+
+    def __init__(self, ttl, max_size=None):
+        """
+        Instantiate a new cache.
+
+        :param float ttl: The default number of seconds entries are kept.
+        :param int max_size: Optional maximum number of entries.
+        """
+        super(TTLCache, self).__init__()
+        self._ttl = ttl
+        self._max_size = max_size
+        # Keys are ordered from the least to the most recently used, values are
+        # (expiration time, value) tuples.
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Return the number of entries which did not expire.
+        """
+        with self._lock:
+            self._purge()
+            return len(self._entries)
+
+    def __contains__(self, key):
+        """
+        Return `True` if a valid entry exists for the given key.
+        """
+        with self._lock:
+            return self._get_entry(key) is not None
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for the given key.
+
+        :param key: A hashable key.
+        :param default: The value to return if no valid entry exists for the key.
+        """
+        with self._lock:
+            entry = self._get_entry(key)
+            if entry is None:
+                return default
+            # Flag the entry as the most recently used.
+            del self._entries[key]
+            self._entries[key] = entry
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        """
+        Cache the given value for the given key.
+
+        :param key: A hashable key.
+        :param value: The value to cache.
+        :param float ttl: Optional number of seconds the entry is kept, the cache
+                          default value is used if not set.
+        """
+        if ttl is None:
+            ttl = self._ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + ttl, value)
+            if self._max_size and len(self._entries) > self._max_size:
+                self._purge()
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """
+        Discard the entry for the given key, if any.
+
+        :param key: A hashable key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Discard all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _get_entry(self, key):
+        """
+        Return the entry for the given key, discarding it if it expired.
+
+        Must be called with the lock acquired.
+
+        :returns: An (expiration time, value) tuple or `None`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del self._entries[key]
+            return None
+        return entry
+
+    def _purge(self):
+        """
+        Discard all expired entries.
+
+        Must be called with the lock acquired.
+        """
+        now = time.time()
+        for key, entry in self._entries.items():
+            if entry[0] <= now:
+                del self._entries[key]
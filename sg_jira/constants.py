@@ -10,13 +10,15 @@ LOGGING_SETTINGS_KEY = "LOGGING"
 SHOTGUN_SETTINGS_KEY = "SHOTGUN"
 JIRA_SETTINGS_KEY = "JIRA"
 SYNC_SETTINGS_KEY = "SYNC"
+BRIDGE_SETTINGS_KEY = "BRIDGE"
 
 # List of all the keys we retrieve from settings
 ALL_SETTINGS_KEYS = [
     LOGGING_SETTINGS_KEY,
     SHOTGUN_SETTINGS_KEY,
     JIRA_SETTINGS_KEY,
-    SYNC_SETTINGS_KEY
+    SYNC_SETTINGS_KEY,
+    BRIDGE_SETTINGS_KEY,
 ]
 
 # Names of the Jira custom fields used to store a reference to a linked Shotgun
@@ -54,3 +56,62 @@ SG_ENTITY_SPECIAL_NAME_FIELDS = {
 # Jira search methods use some paging
 # this is the max number of results to get per "page".
 JIRA_RESULT_PAGING = 2000
+
+# Number of seconds Jira Projects are cached for.
+JIRA_PROJECT_CACHE_TTL = 600
+
+# Number of seconds Jira create and edit meta data and workflow transitions
+# are cached for.
+JIRA_META_CACHE_TTL = 600
+
+# Number of seconds Jira users matched from an email address are cached for.
+JIRA_USER_CACHE_TTL = 600
+
+# Number of seconds failures to match a Jira user from an email address are
+# cached for.
+JIRA_USER_NEGATIVE_CACHE_TTL = 60
+
+# Maximum number of Jira users lookups which are cached.
+JIRA_USER_CACHE_SIZE = 1000
+
+# Number of seconds after which the index of assignable users of a Jira Project
+# is refreshed in the background.
+JIRA_USER_INDEX_TTL = 3600
+
+# Minimum number of seconds between refreshes of the index of assignable users
+# of a Jira Project when an email address can't be matched, e.g. for Shotgun
+# users without a Jira account.
+JIRA_USER_INDEX_MISS_REFRESH_DELAY = 900
+
+# Number of seconds Shotgun Entities consolidated from Shotgun are cached for.
+SHOTGUN_ENTITY_CACHE_TTL = 300
+
+# Maximum number of Shotgun Entities which are cached.
+SHOTGUN_ENTITY_CACHE_SIZE = 5000
+
+# Shotgun fields whose values are never cached: the bridge relies on them to
+# link Shotgun Entities to Jira, and events for them are not forwarded to the
+# bridge if its handlers do not accept them, so cached values could be stale.
+# Values of fields from linked Entities, e.g. "project.Project.name", are
+# never cached either.
+SHOTGUN_UNCACHED_FIELDS = [SHOTGUN_JIRA_ID_FIELD, SHOTGUN_SYNC_IN_JIRA_FIELD]
+
+# Version of the format used to save Jira fields and Shotgun schemas snapshots.
+# Snapshots saved with another version are ignored.
+SCHEMA_CACHE_VERSION = 1
+
+# Number of seconds after which cached Shotgun schemas are refreshed in the
+# background.
+SHOTGUN_SCHEMA_CACHE_TTL = 3600
+
+# Default maximum number of times a Jira request rejected with a 429 "Too Many
+# Requests" error is retried.
+JIRA_RATE_LIMIT_RETRIES = 5
+
+# Number of seconds to wait before retrying a Jira request rejected with a 429
+# error without a Retry-After header, doubled for each retry.
+JIRA_RATE_LIMIT_BACKOFF = 1
+
+# Maximum number of seconds to wait before retrying a Jira request rejected
+# with a 429 error.
+JIRA_RATE_LIMIT_MAX_WAIT = 60
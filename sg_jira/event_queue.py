@@ -0,0 +1,151 @@
+# Copyright 2018 Autodesk, Inc.  All rights reserved.
+#
+# Use of this software is subject to the terms of the Autodesk license agreement
+# provided at the time of installation or download, or which otherwise accompanies
+# this software in either electronic or hard copy form.
+#
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class EventQueue(object):
+    """
+    A FIFO queue of events backed by a SQLite database.
+
+    Events are kept in the database until they are acknowledged with :meth:`ack`,
+    providing at least once delivery: events which were retrieved but not
+    acknowledged before the process stopped are delivered again when a new
+    queue is instantiated with the same database file.
+
+    A queue can be shared between threads. Events must be JSON serializable.
+    """
+
+    def __init__(self, path=None):
+        """
+        Instantiate a new queue.
+
+        :param str path: Optional full path to the database file. If not set,
+                         an in memory database is used and events do not
+                         survive a restart.
+        """
+        self._path = path or ":memory:"
+        # The connection is shared between threads, access to it is serialized
+        # with our own lock.
+        self._connection = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if path:
+            # Write ahead logging allows fast appends, and with this mode a
+            # "normal" synchronous level is safe against corruption.
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "event TEXT NOT NULL)"
+        )
+        self._condition = threading.Condition()
+        # The id of the last event retrieved from the queue. Pending events are
+        # retrieved in the order they were added.
+        self._last_id = 0
+        self._closed = False
+        pending = len(self)
+        if pending:
+            logger.info(
+                "Replaying %d pending events from %s" % (pending, self._path)
+            )
+
+    def __len__(self):
+        """
+        Return the number of events which were not acknowledged yet.
+        """
+        with self._condition:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM events"
+            ).fetchone()[0]
+
+    def put(self, event):
+        """
+        Add the given event to the queue.
+
+        :param event: A JSON serializable event.
+        :returns: The id of the queued event.
+        :raises RuntimeError: if the queue is closed.
+        """
+        data = json.dumps(event)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Can't add events to a closed queue")
+            cursor = self._connection.execute(
+                "INSERT INTO events (event) VALUES (?)", (data,)
+            )
+            self._condition.notify()
+            return cursor.lastrowid
+
+    def get(self, timeout=None):
+        """
+        Retrieve the next event from the queue, waiting for an event to be
+        available if needed.
+
+        Retrieved events stay in the queue until they are acknowledged.
+
+        :param float timeout: Optional maximum number of seconds to wait for
+                              an event.
+        :returns: A tuple with the event id and the event, or `None` if the queue
+                  was closed or if no event was available in the given time.
+        """
+        end_time = None
+        if timeout is not None:
+            end_time = time.time() + timeout
+        with self._condition:
+            while not self._closed:
+                row = self._connection.execute(
+                    "SELECT id, event FROM events WHERE id > ? ORDER BY id LIMIT 1",
+                    (self._last_id,)
+                ).fetchone()
+                if row:
+                    self._last_id = row[0]
+                    return row[0], json.loads(row[1])
+                if end_time is None:
+                    self._condition.wait()
+                else:
+                    remaining = end_time - time.time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+        return None
+
+    def ack(self, event_id):
+        """
+        Acknowledge the given event, removing it from the queue.
+
+        :param int event_id: An event id, as returned by :meth:`get`.
+        """
+        with self._condition:
+            if self._closed:
+                # Unacknowledged events will be replayed.
+                return
+            self._connection.execute(
+                "DELETE FROM events WHERE id = ?", (event_id,)
+            )
+
+    def close(self):
+        """
+        Close the queue, waking up all threads waiting for events.
+
+        Events which were not acknowledged are kept in the database.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._connection.close()
+            self._condition.notify_all()
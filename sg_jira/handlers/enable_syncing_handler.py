@@ -58,6 +58,16 @@ class EnableSyncingHandler(SyncHandler):
         for handler in self._secondary_handlers:
             handler.setup()
 
+    def get_accepted_shotgun_fields(self):
+        """
+        Only accept events for the Task "Sync In Jira" field, combined handlers
+        accept events for the fields they sync.
+
+        :returns: A dictionary where keys are Shotgun Entity types and values
+                  lists of Shotgun field names.
+        """
+        return {"Task": [SHOTGUN_SYNC_IN_JIRA_FIELD]}
+
     def accept_shotgun_event(self, entity_type, entity_id, event):
         """
         Accept or reject the given event for the given Shotgun Entity.
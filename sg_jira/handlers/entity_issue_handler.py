@@ -167,6 +167,56 @@ class EntityIssueHandler(SyncHandler):
             data,
         )
 
+    def _merge_shotgun_field_changes(self, events):
+        """
+        Merge the field changes from the given list of Shotgun events.
+
+        Multiple changes to a given field are merged into a single change:
+        the last value is kept for fields set directly, values added and removed
+        are merged for list fields.
+
+        :param events: A list of Shotgun event dictionaries, in the order they
+                       were received.
+        :returns: A list of tuples with a Shotgun field name and a dictionary
+                  with the merged change, with `added`, `removed` and `new_value`
+                  keys, in the order the fields were first changed.
+        """
+        def value_key(value):
+            # Shotgun Entities are compared with their type and id, other
+            # values directly.
+            if isinstance(value, dict):
+                return value.get("type"), value.get("id")
+            return value
+
+        changes = []
+        changes_by_field = {}
+        for event in events:
+            meta = event["meta"]
+            field = meta["attribute_name"]
+            change = changes_by_field.get(field)
+            if change is None:
+                change = {"added": None, "removed": None, "new_value": None}
+                changes_by_field[field] = change
+                changes.append((field, change))
+            if meta.get("added") is None and meta.get("removed") is None:
+                change["new_value"] = meta.get("new_value")
+                continue
+            added = change["added"] or []
+            removed = change["removed"] or []
+            for value in meta.get("added") or []:
+                key = value_key(value)
+                removed = [x for x in removed if value_key(x) != key]
+                if key not in [value_key(x) for x in added]:
+                    added.append(value)
+            for value in meta.get("removed") or []:
+                key = value_key(value)
+                added = [x for x in added if value_key(x) != key]
+                if key not in [value_key(x) for x in removed]:
+                    removed.append(value)
+            change["added"] = added
+            change["removed"] = removed
+        return changes
+
     def _get_jira_issue_field_sync_value(
         self,
         jira_project,
@@ -176,6 +226,7 @@ class EntityIssueHandler(SyncHandler):
         added=None,
         removed=None,
         new_value=None,
+        jira_fields=None,
     ):
         """
         Retrieve the Jira Issue field and the value to set from the given Shotgun
@@ -193,6 +244,12 @@ class EntityIssueHandler(SyncHandler):
         :param added: A list of Shotgun values added to the given field.
         :param removed: A list of Shotgun values removed from the given field.
         :param new_value: A Shotgun value the given field was set to.
+        :param jira_fields: Optional edit meta data for the given Jira Issue, as
+                            returned by
+                            :meth:`~sg_jira.jira_session.JiraSession.get_jira_issue_edit_meta`.
+                            It is retrieved if not set. Callers syncing
+                            multiple fields should retrieve it once and pass
+                            it for each field.
 
         :returns: A tuple with a Jira field id and a Jira value usable for an
                   update. The returned field id is `None` if no valid field or
@@ -217,7 +274,8 @@ class EntityIssueHandler(SyncHandler):
             return None, None
 
         # Retrieve edit meta data for the issue
-        jira_fields = self._jira.get_jira_issue_edit_meta(jira_issue)
+        if jira_fields is None:
+            jira_fields = self._jira.get_jira_issue_edit_meta(jira_issue)
 
         # Bail out if the target Jira field is not editable
         if jira_field not in jira_fields:
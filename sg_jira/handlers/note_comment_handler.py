@@ -54,6 +54,13 @@ class NoteCommentHandler(SyncHandler):
         """
         return self.__NOTE_FIELDS_MAPPING.keys()
 
+    @property
+    def _shotgun_entity_type(self):
+        """
+        Return the Shotgun Entity type this handler accepts events for.
+        """
+        return "Note"
+
     def _compose_jira_comment_body(self, shotgun_note):
         """
         Return a body value to update a Jira comment from the given Shotgun Note.
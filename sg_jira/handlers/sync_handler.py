@@ -113,6 +113,50 @@ class SyncHandler(object):
         """
         pass
 
+    @property
+    def _shotgun_entity_type(self):
+        """
+        Can be re-implemented in deriving classes only accepting events for a
+        Shotgun Entity type and the fields returned by
+        :meth:`_supported_shotgun_fields_for_shotgun_event`, to return this
+        Entity type.
+
+        This base implementation returns `None`.
+        """
+        return None
+
+    def _supported_shotgun_fields_for_shotgun_event(self):
+        """
+        Return the list of Shotgun fields that this handler can process for a
+        Shotgun to Jira event.
+
+        Must be re-implemented in deriving classes re-implementing
+        :attr:`_shotgun_entity_type`.
+        """
+        raise NotImplementedError
+
+    def get_accepted_shotgun_fields(self):
+        """
+        Return the Shotgun fields for which events can be accepted by this
+        handler.
+
+        This is published by the bridge so irrelevant events can be discarded
+        before being sent to it. This base implementation returns the fields
+        returned by :meth:`_supported_shotgun_fields_for_shotgun_event` for
+        handlers with a Shotgun Entity type, or `None`, meaning that events
+        for any Shotgun field could be accepted.
+
+        :returns: A dictionary where keys are Shotgun Entity types and values
+                  lists of Shotgun field names, or `None`.
+        """
+        if not self._shotgun_entity_type:
+            return None
+        return {
+            self._shotgun_entity_type: list(
+                self._supported_shotgun_fields_for_shotgun_event()
+            ),
+        }
+
     def accept_shotgun_event(self, entity_type, entity_id, event):
         """
         Accept or reject the given event for the given Shotgun Entity.
@@ -137,6 +181,28 @@ class SyncHandler(object):
         """
         raise NotImplementedError
 
+    def process_shotgun_events(self, entity_type, entity_id, events):
+        """
+        Process the given list of Shotgun events for the given Shotgun Entity.
+
+        Events are in the order they were received and were all accepted by
+        this handler. Deriving classes can re-implement this method to process
+        multiple events more efficiently than one at a time.
+
+        This base implementation processes each event with :meth:`process_shotgun_event`.
+
+        :param str entity_type: The Shotgun Entity type to sync.
+        :param int entity_id: The id of the Shotgun Entity to sync.
+        :param events: A list of dictionaries with the events for the changes.
+        :returns: True if at least one event was successfully processed, False
+                  if the sync didn't happen for any reason.
+        """
+        synced = False
+        for event in events:
+            if self.process_shotgun_event(entity_type, entity_id, event):
+                synced = True
+        return synced
+
     def accept_jira_event(self, resource_type, resource_id, event):
         """
         Accept or reject the given event for the given Jira resource.
@@ -226,8 +292,11 @@ class SyncHandler(object):
                 shotgun_field,
                 {"valid_values": all_allowed}
             )
-            # Clear the schema to take into account the change we just made.
-            self._shotgun.clear_cached_field_schema(shotgun_entity["type"])
+            # Refresh the field schema to take into account the change we just made.
+            self._shotgun.refresh_cached_field_schema(
+                shotgun_entity["type"],
+                shotgun_field,
+            )
             return value
 
         if data_type == "status_list":
@@ -302,6 +371,7 @@ class SyncHandler(object):
                             )
                         )
                         del current_sg_value[i]
+            missing_list = []
             for added in added_list:
                 # Check if the value is already there
                 self._logger.debug("Trying to add %s to Shotgun %s value %s" % (
@@ -322,13 +392,17 @@ class SyncHandler(object):
                         )
                         break
                 else:
-                    # We need to retrieve a matching Entity from Shotgun and
-                    # add it to the list, if we found one.
-                    sg_value = self._shotgun.match_entity_by_name(
-                        added,
-                        allowed_entities,
-                        consolidated["project"]
-                    )
+                    missing_list.append(added)
+            if missing_list:
+                # We need to retrieve matching Entities from Shotgun and add
+                # them to the list, if we found some.
+                sg_values = self._shotgun.match_entities_by_name(
+                    missing_list,
+                    allowed_entities,
+                    consolidated["project"]
+                )
+                for added in missing_list:
+                    sg_value = sg_values.get(added)
                     if sg_value:
                         self._logger.debug(
                             "Adding %s to Shotgun value %s since Jira "
@@ -88,6 +88,13 @@ class TaskIssueHandler(EntityIssueHandler):
         """
         return self.__TASK_FIELDS_MAPPING.keys()
 
+    @property
+    def _shotgun_entity_type(self):
+        """
+        Return the Shotgun Entity type this handler accepts events for.
+        """
+        return "Task"
+
     def accept_shotgun_event(self, entity_type, entity_id, event):
         """
         Accept or reject the given event for the given Shotgun Entity.
@@ -134,6 +141,24 @@ class TaskIssueHandler(EntityIssueHandler):
         :returns: True if the event was successfully processed, False if the
                   sync didn't happen for any reason.
         """
+        return self.process_shotgun_events(entity_type, entity_id, [event])
+
+    def process_shotgun_events(self, entity_type, entity_id, events):
+        """
+        Process the given list of Shotgun events for the given Shotgun Entity.
+
+        Changes for fields which can be directly set in Jira are merged and
+        applied with a single Jira Issue update, unless they are interleaved
+        with changes which can't be set directly, like status changes: changes
+        are always applied in the order the fields were first changed.
+
+        :param str entity_type: The Shotgun Entity type to sync.
+        :param int entity_id: The id of the Shotgun Entity to sync.
+        :param events: A list of dictionaries with the events meta data for
+                       the changes.
+        :returns: True if at least one change was successfully synced, False
+                  if the sync didn't happen for any reason.
+        """
         task_fields = [
             "content",
             "task_assignees",
@@ -174,7 +199,7 @@ class TaskIssueHandler(EntityIssueHandler):
                     entity_type,
                     entity_id,
                     sg_entity["project"],
-                    event,
+                    events[-1],
                 )
             )
             return False
@@ -222,11 +247,11 @@ class TaskIssueHandler(EntityIssueHandler):
                 {SHOTGUN_JIRA_ID_FIELD: jira_issue.key}
             )
 
-        sg_field = event["meta"]["attribute_name"]
+        changes = self._merge_shotgun_field_changes(events)
 
         # Note: we don't accept events for the SHOTGUN_SYNC_IN_JIRA_FIELD field
         # but we process them. Accepting the event is done by a higher level handler.
-        if sg_field == SHOTGUN_SYNC_IN_JIRA_FIELD:
+        if SHOTGUN_SYNC_IN_JIRA_FIELD in [sg_field for sg_field, change in changes]:
             # If sg_sync_in_jira was turned on, sync all supported values
             # Note: if the Issue was just created, we might be syncing some
             # values a second time. This seems safer than checking which fields
@@ -240,69 +265,104 @@ class TaskIssueHandler(EntityIssueHandler):
             )
             return True
 
-        # Otherwise, handle the attribute change
-        self._logger.info("Syncing Shotgun %s.%s (%d) to Jira %s %s" % (
-            entity_type,
-            sg_field,
-            entity_id,
-            jira_issue.fields.issuetype.name,
-            jira_issue.key
-        ))
-        self._logger.debug("Shotgun event: %s" % event)
-
-        try:
-            # Note: the returned jira_field will be None for the special cases handled
-            # below.
-            jira_field, jira_value = self._get_jira_issue_field_sync_value(
-                jira_project,
-                jira_issue,
-                sg_entity["type"],
+        # Otherwise, handle the attribute changes
+        self._logger.debug("Shotgun events: %s" % events)
+        synced = False
+        issue_data = {}
+        # The Issue edit meta data is retrieved once for all the changes, and
+        # again after a status change since it can change which fields are
+        # editable.
+        jira_fields = None
+        for sg_field, change in changes:
+            self._logger.info("Syncing Shotgun %s.%s (%d) to Jira %s %s" % (
+                entity_type,
                 sg_field,
-                event["meta"].get("added"),
-                event["meta"].get("removed"),
-                event["meta"].get("new_value"),
-            )
-        except InvalidShotgunValue as e:
-            self._logger.warning(
-                "Unable to update Jira %s %s: %s" % (
-                    jira_issue.fields.issuetype.name,
-                    jira_issue.key,
-                    e,
-                )
-            )
-            self._logger.debug("%s" % e, exc_info=True)
-            return False
-
-        if jira_field:
-            self._logger.debug("Updating %s to %s in Jira for %s" % (
-                jira_field,
-                jira_value,
-                jira_issue
+                entity_id,
+                jira_issue.fields.issuetype.name,
+                jira_issue.key
             ))
-            jira_issue.update(fields={jira_field: jira_value})
-            return True
+            if (
+                jira_fields is None
+                and self._get_jira_issue_field_for_shotgun_field(entity_type, sg_field)
+            ):
+                jira_fields = self._jira.get_jira_issue_edit_meta(jira_issue)
+            try:
+                # Note: the returned jira_field will be None for the special cases handled
+                # below.
+                jira_field, jira_value = self._get_jira_issue_field_sync_value(
+                    jira_project,
+                    jira_issue,
+                    sg_entity["type"],
+                    sg_field,
+                    change["added"],
+                    change["removed"],
+                    change["new_value"],
+                    jira_fields=jira_fields,
+                )
+            except InvalidShotgunValue as e:
+                self._logger.warning(
+                    "Unable to update Jira %s %s: %s" % (
+                        jira_issue.fields.issuetype.name,
+                        jira_issue.key,
+                        e,
+                    )
+                )
+                self._logger.debug("%s" % e, exc_info=True)
+                continue
+            if jira_field:
+                issue_data[jira_field] = jira_value
+                continue
 
-        # Special cases not handled by a direct update
-        if sg_field == "sg_status_list":
-            shotgun_status = event["meta"]["new_value"]
-            return self._sync_shotgun_status_to_jira(
-                jira_issue,
-                shotgun_status,
-                "Updated from Shotgun %s (%d) moving to %s" % (
-                    entity_type,
-                    entity_id,
-                    shotgun_status
+            # Special cases not handled by a direct update: apply the changes
+            # merged so far first, so changes are applied in order.
+            if self._update_jira_issue(jira_issue, issue_data):
+                synced = True
+                issue_data = {}
+            if sg_field == "sg_status_list":
+                shotgun_status = change["new_value"]
+                if self._sync_shotgun_status_to_jira(
+                    jira_issue,
+                    shotgun_status,
+                    "Updated from Shotgun %s (%d) moving to %s" % (
+                        entity_type,
+                        entity_id,
+                        shotgun_status
+                    )
+                ):
+                    synced = True
+                    # Reload the Issue with its new status, the edit meta data
+                    # is retrieved again for following changes.
+                    jira_issue = self.get_jira_issue(jira_issue.key) or jira_issue
+                    jira_fields = None
+            elif sg_field == "addressings_cc":
+                self._sync_shotgun_cced_changes_to_jira(
+                    jira_issue,
+                    change["added"],
+                    change["removed"],
                 )
+                synced = True
 
-            )
-        if sg_field == "addressings_cc":
-            self._sync_shotgun_cced_changes_to_jira(
-                jira_issue,
-                event["meta"]["added"],
-                event["meta"]["removed"],
-            )
-            return True
-        return False
+        if self._update_jira_issue(jira_issue, issue_data):
+            synced = True
+        return synced
+
+    def _update_jira_issue(self, jira_issue, issue_data):
+        """
+        Update the given Jira Issue with the given data, if any.
+
+        :param jira_issue: A :class:`jira.Issue` instance.
+        :param issue_data: A dictionary where keys are Jira field ids and values
+                           the values to set.
+        :returns: `True` if the Issue was updated, `False` otherwise.
+        """
+        if not issue_data:
+            return False
+        self._logger.debug("Updating %s in Jira for %s" % (
+            issue_data,
+            jira_issue
+        ))
+        jira_issue.update(fields=issue_data)
+        return True
 
     def _get_jira_issue_field_for_shotgun_field(self, shotgun_entity_type, shotgun_field):
         """
@@ -342,6 +402,8 @@ class TaskIssueHandler(EntityIssueHandler):
         if exclude_shotgun_fields is None:
             exclude_shotgun_fields = []
 
+        # Retrieve the Issue edit meta data once for all the fields.
+        jira_fields = self._jira.get_jira_issue_edit_meta(jira_issue)
         issue_data = {}
         for sg_field, jira_field in self.__TASK_FIELDS_MAPPING.iteritems():
             if sg_field in exclude_shotgun_fields:
@@ -369,7 +431,8 @@ class TaskIssueHandler(EntityIssueHandler):
                     sg_field,
                     added,
                     removed,
-                    new_value
+                    new_value,
+                    jira_fields=jira_fields,
                 )
                 if jira_field:
                     issue_data[jira_field] = jira_value
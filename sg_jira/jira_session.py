@@ -6,12 +6,21 @@
 #
 
 import logging
+import threading
+import time
 
 from jira import JIRAError
 import jira
 
 from .constants import JIRA_SHOTGUN_TYPE_FIELD, JIRA_SHOTGUN_ID_FIELD, JIRA_SHOTGUN_URL_FIELD
 from .constants import JIRA_RESULT_PAGING
+from .constants import JIRA_PROJECT_CACHE_TTL, JIRA_META_CACHE_TTL
+from .constants import JIRA_USER_CACHE_TTL, JIRA_USER_NEGATIVE_CACHE_TTL
+from .constants import JIRA_USER_CACHE_SIZE, JIRA_USER_INDEX_TTL
+from .constants import JIRA_USER_INDEX_MISS_REFRESH_DELAY
+from .constants import JIRA_RATE_LIMIT_RETRIES
+from .cache import TTLCache
+from .rate_limit import RateLimitedAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +36,32 @@ class JiraSession(jira.client.JIRA):
 
         Connect to the given Jira site with given parameters.
 
+        Additionally to the :class:`jira.JIRA` parameters, e.g. `timeout` or
+        `max_retries`, the following keyword parameters are accepted:
+
+        - `pool_size`: the maximum number of connections kept open with the
+          Jira site, allowing that many concurrent requests without opening
+          new connections. The :mod:`requests` default is used if not set.
+        - `keep_alive`: if `False`, connections are closed after each request,
+          `True` by default.
+        - `rate_limit`: the maximum number of requests sent per second. The
+          rate is not limited if not set.
+        - `rate_limit_burst`: the maximum number of requests which can be sent
+          at once without being rate limited.
+        - `rate_limit_retries`: the maximum number of times a request rejected
+          by Jira with a 429 "Too Many Requests" error is retried, 5 by
+          default. Retries honor the `Retry-After` delay returned by Jira.
+
         :param str jira_site: A Jira site url.
         :raises RuntimeError: on Jira connection errors.
         """
+        pool_size = kwargs.pop("pool_size", None)
+        keep_alive = kwargs.pop("keep_alive", True)
+        rate_limit = kwargs.pop("rate_limit", None)
+        rate_limit_burst = kwargs.pop("rate_limit_burst", None)
+        rate_limit_retries = kwargs.pop("rate_limit_retries", None)
+        if rate_limit_retries is None:
+            rate_limit_retries = JIRA_RATE_LIMIT_RETRIES
         try:
             super(JiraSession, self).__init__(
                 jira_site, *args, **kwargs
@@ -54,20 +86,93 @@ class JiraSession(jira.client.JIRA):
                 "Unable to connect to %s. See the log for details." % jira_site
             )
         logger.info("Connected to %s." % jira_site)
+        self._setup_http_session(
+            pool_size,
+            keep_alive,
+            rate_limit,
+            rate_limit_burst,
+            rate_limit_retries,
+        )
 
         # A dictionary where keys are Jira field name and values are their field id.
         self._jira_fields_map = {}
-
-    def setup(self):
+        # Jira Projects indexed by their key.
+        self._jira_projects_cache = TTLCache(JIRA_PROJECT_CACHE_TTL)
+        # Create meta data fields indexed by Project key and Issue type id.
+        self._jira_create_meta_cache = TTLCache(JIRA_META_CACHE_TTL)
+        # Edit meta data fields indexed by Project key, Issue type id and
+        # status id.
+        self._jira_edit_meta_cache = TTLCache(JIRA_META_CACHE_TTL)
+        # Transitions indexed by Project key, Issue type id and status id.
+        self._jira_transitions_cache = TTLCache(JIRA_META_CACHE_TTL)
+        # Jira users, or None if no user could be found, indexed by lower case
+        # email address, Project key and assignment flag.
+        self._jira_users_cache = TTLCache(
+            JIRA_USER_CACHE_TTL,
+            max_size=JIRA_USER_CACHE_SIZE,
+        )
+        # Assignable users indexes, with the time they were built, indexed by
+        # Project key.
+        self._jira_users_indexes = {}
+        self._jira_users_indexes_lock = threading.Lock()
+        # Project keys for which assignable users are being indexed in the
+        # background.
+        self._refreshing_jira_users_indexes = set()
+        # Events set when the first index of assignable users of a Project is
+        # built, indexed by Project key.
+        self._building_jira_users_indexes = {}
+
+    def _setup_http_session(
+        self,
+        pool_size,
+        keep_alive,
+        rate_limit=None,
+        rate_limit_burst=None,
+        rate_limit_retries=JIRA_RATE_LIMIT_RETRIES,
+    ):
+        """
+        Configure the HTTP session used for Jira requests.
+
+        :param int pool_size: The maximum number of connections kept open with
+                              the Jira site, or `None` to use the default value.
+        :param bool keep_alive: Whether connections are kept open between
+                                requests.
+        :param float rate_limit: Optional maximum number of requests per second.
+        :param int rate_limit_burst: Optional maximum number of requests which
+                                     can be sent at once.
+        :param int rate_limit_retries: The maximum number of times a request
+                                       rejected with a 429 error is retried.
+        """
+        adapter_kwargs = {
+            "rate_limit": rate_limit,
+            "burst": rate_limit_burst,
+            "max_retries_on_429": rate_limit_retries,
+        }
+        if pool_size:
+            # Use a single pool per scheme and host, with enough connections
+            # for all requests which can be issued concurrently.
+            adapter_kwargs["pool_connections"] = 1
+            adapter_kwargs["pool_maxsize"] = pool_size
+        # The same adapter is used for all schemes so the rate limit is shared.
+        adapter = RateLimitedAdapter(**adapter_kwargs)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
+    def setup(self, jira_fields_map=None):
         """
         Check the Jira site and cache site level values.
 
+        :param jira_fields_map: Optional mapping from lower case Jira field
+                                names to their id, e.g. loaded from a
+                                snapshot. It is retrieved from Jira if not set.
         :raises RuntimeError: if the Jira site was not correctly configured to
                  be used with this bridge.
         """
-        # Build a mapping from Jira field names to their id for fast lookup.
-        for jira_field in self.fields():
-            self._jira_fields_map[jira_field["name"].lower()] = jira_field["id"]
+        if jira_fields_map is None:
+            jira_fields_map = self.retrieve_jira_fields_map()
+        self._jira_fields_map = jira_fields_map
         self._jira_shotgun_type_field = self.get_jira_issue_field_id(
             JIRA_SHOTGUN_TYPE_FIELD.lower()
         )
@@ -86,6 +191,25 @@ class JiraSession(jira.client.JIRA):
                 "Missing required custom Jira field %s" % JIRA_SHOTGUN_URL_FIELD
             )
 
+    def retrieve_jira_fields_map(self):
+        """
+        Retrieve all Jira fields and return a mapping from their name to their
+        id for fast lookup.
+
+        :returns: A dictionary where keys are lower case Jira field names and
+                  values are their id.
+        """
+        return dict(
+            (jira_field["name"].lower(), jira_field["id"]) for jira_field in self.fields()
+        )
+
+    @property
+    def jira_fields_map(self):
+        """
+        Return the mapping from lower case Jira field names to their id.
+        """
+        return dict(self._jira_fields_map)
+
     def get_jira_issue_field_id(self, name):
         """
         Return the Jira field id for the Issue field with the given name.
@@ -126,6 +250,80 @@ class JiraSession(jira.client.JIRA):
         """
         return self._jira_shotgun_url_field
 
+    def get_jira_project(self, project_key):
+        """
+        Retrieve the Jira Project with the given key, if any.
+
+        Jira Projects are cached: all Projects are retrieved and cached the first
+        time a Project is requested, and Projects missing from the cache are
+        retrieved individually.
+
+        :param str project_key: A Jira Project key, e.g. 'PRJ'.
+        :returns: A :class:`jira.resources.Project` instance or None.
+        """
+        jira_project = self._jira_projects_cache.get(project_key)
+        if jira_project:
+            return jira_project
+        if not len(self._jira_projects_cache):
+            logger.debug("Caching all Jira Projects")
+            for jira_project in self.projects():
+                self._jira_projects_cache.set(jira_project.key, jira_project)
+            jira_project = self._jira_projects_cache.get(project_key)
+            if jira_project:
+                return jira_project
+        # The Project could have been created after the cache was populated,
+        # or the cache could have expired.
+        logger.debug("Retrieving Jira Project %s" % project_key)
+        try:
+            jira_project = self.project(project_key)
+        except JIRAError as e:
+            # Jira raises a 404 error if it can't find the Project: catch the
+            # error and let the method return None in that case.
+            if e.status_code == 404:
+                return None
+            raise
+        self._jira_projects_cache.set(jira_project.key, jira_project)
+        return jira_project
+
+    def clear_cached_jira_projects(self, project_key=None):
+        """
+        Clear all cached Jira Projects or just the given Jira Project.
+
+        :param str project_key: A Jira Project key or None.
+        """
+        if project_key:
+            logger.debug("Clearing cached Jira Project %s" % project_key)
+            self._jira_projects_cache.invalidate(project_key)
+        else:
+            logger.debug("Clearing all cached Jira Projects")
+            self._jira_projects_cache.clear()
+
+    def clear_cached_jira_meta_data(self):
+        """
+        Clear all cached Jira create and edit meta data and workflow transitions.
+        """
+        logger.debug("Clearing all cached Jira meta data")
+        self._jira_create_meta_cache.clear()
+        self._jira_edit_meta_cache.clear()
+        self._jira_transitions_cache.clear()
+
+    def clear_cached_jira_users(self):
+        """
+        Clear all cached Jira users lookups.
+        """
+        logger.debug("Clearing all cached Jira users")
+        self._jira_users_cache.clear()
+        with self._jira_users_indexes_lock:
+            self._jira_users_indexes.clear()
+
+    def clear_caches(self):
+        """
+        Clear all cached Jira values which can change while the bridge is running.
+        """
+        self.clear_cached_jira_projects()
+        self.clear_cached_jira_meta_data()
+        self.clear_cached_jira_users()
+
     def sanitize_jira_update_value(self, jira_value, jira_field_schema):
         """
         Perform sanity checks for the given Jira value and ensure it can be used
@@ -239,6 +437,13 @@ class JiraSession(jira.client.JIRA):
         .. note:: Due to problems with user searching in Jira, this method always
                   returns assignable users for the time being.
 
+        .. note:: Users are cached per Project and, if they can't be found with
+                  a direct search, matched from an index of users assignable
+                  in the Project. For a given Issue, this can return a user
+                  who is not assignable to this particular Issue, e.g. because
+                  of its security level, in which case Jira rejects the
+                  assignment.
+
         :param user_email: An email address as a string.
         :param jira_project: A :class:`jira.resources.Project` instance or None.
         :param jira_issue: A :class:`jira.Issue` instance or None.
@@ -257,6 +462,52 @@ class JiraSession(jira.client.JIRA):
         if not user_email:
             return None
 
+        # Users are cached per Project, so lookups for different Issues in the
+        # same Project share cached results. Failed lookups are cached as well,
+        # but for a shorter time: users might be added to Jira, and these
+        # lookups are the most expensive ones since all assignable users are
+        # retrieved.
+        if jira_project:
+            project_key = jira_project.key
+        else:
+            project_key = jira_issue.fields.project.key
+        cache_key = (user_email.lower(), project_key, for_assignment)
+        not_cached = object()
+        jira_user = self._jira_users_cache.get(cache_key, not_cached)
+        if jira_user is not not_cached:
+            logger.debug("Using cached Jira user %s for %s" % (jira_user, user_email))
+            return jira_user
+
+        jira_user = self._find_jira_user(
+            user_email,
+            jira_project=jira_project,
+            jira_issue=jira_issue,
+            for_assignment=for_assignment,
+        )
+        if jira_user:
+            self._jira_users_cache.set(cache_key, jira_user)
+        else:
+            self._jira_users_cache.set(
+                cache_key, None, ttl=JIRA_USER_NEGATIVE_CACHE_TTL
+            )
+        return jira_user
+
+    def _find_jira_user(self, user_email, jira_project=None, jira_issue=None, for_assignment=False):
+        """
+        Look up in Jira an assignable user or with browse permission for the
+        given Project or Issue, with the given email address.
+
+        The direct search is scoped to the Issue, if any, but the fallback
+        index of assignable users is scoped to the Issue's Project.
+
+        :param user_email: An email address as a string.
+        :param jira_project: A :class:`jira.resources.Project` instance or None.
+        :param jira_issue: A :class:`jira.Issue` instance or None.
+        :param for_assignment: A boolean, if `False` the user just needs to have read
+                            permission. If `True` the user needs to be suitable for
+                            Issue assignments.
+        :returns: A :class:`jira.resources.User` instance or None.
+        """
         if for_assignment:
             search_method = self.search_assignable_users_for_issues
         else:
@@ -267,8 +518,9 @@ class JiraSession(jira.client.JIRA):
             search_method = self.search_assignable_users_for_issues
 
         # Note: There is a Jira bug that prevents searching by email address from working on
-        # some instances. In this case, we fall back on paging through ALL results to
-        # ensure don't incorrectly miss matching the user.
+        # some instances. In this case, we fall back on an index of ALL assignable
+        # users for the Project to ensure we don't incorrectly miss matching the user.
+        # Assignable users are checked at the Project level for this fallback.
         # See: https://jira.atlassian.com/browse/JRASERVER-61772
         # See: https://jira.atlassian.com/browse/JRACLOUD-61772
 
@@ -302,41 +554,26 @@ class JiraSession(jira.client.JIRA):
             logger.debug("Found Jira Assignee %s" % jira_assignee)
             return jira_assignee
 
-        # Because of the bug mentioned above, fall back on matching users ourself.
+        # Because of the bug mentioned above, fall back on matching users ourself
+        # from an index of all assignable users for the Project.
+        if jira_project:
+            project_key = jira_project.key
+        else:
+            project_key = jira_issue.fields.project.key
         logger.debug(
-            "No assignable users found matching %s. Searching all assignable users "
-            "manually" % user_email
+            "No assignable users found matching %s. Looking up assignable users "
+            "for Project %s" % (user_email, project_key)
         )
-        uemail = user_email.lower()
-        start_idx = 0
-        logger.debug("Querying all assignable users starting at #%d" % start_idx)
-        jira_users = search_method(
-            None,
-            project=jira_project,
-            issueKey=jira_issue.key if jira_issue else None,
-            maxResults=JIRA_RESULT_PAGING,
-            startAt=start_idx,
-        )
-        while jira_users:
-            for jira_user in jira_users:
-                if jira_user.emailAddress and jira_user.emailAddress.lower() == uemail:
-                    jira_assignee = jira_user
-                    break
-            if jira_assignee:
-                break
-            else:
-                start_idx += len(jira_users)
-                logger.debug(
-                    "Querying all assignable users starting at #%d" % start_idx
-                )
-                jira_users = search_method(
-                    None,
-                    project=jira_project,
-                    issueKey=jira_issue.key if jira_issue else None,
-                    maxResults=JIRA_RESULT_PAGING,
-                    startAt=start_idx,
-                )
-                logger.debug("Found %s users" % (len(jira_users)))
+        built_at, jira_users_index = self._get_assignable_users_index(project_key)
+        jira_assignee = jira_users_index.get(user_email.lower())
+        if (
+            not jira_assignee
+            and time.time() - built_at > JIRA_USER_INDEX_MISS_REFRESH_DELAY
+        ):
+            # The user might have been added to Jira since the index was built.
+            # Misses are common, e.g. for Shotgun users without a Jira account,
+            # so the index is not rebuilt more often than this delay.
+            self._refresh_assignable_users_index(project_key)
 
         if not jira_assignee:
             if jira_issue:
@@ -357,6 +594,124 @@ class JiraSession(jira.client.JIRA):
         logger.debug("Found Jira Assignee %s" % jira_assignee)
         return jira_assignee
 
+    def _get_assignable_users_index(self, project_key):
+        """
+        Return an index of all assignable users for the given Jira Project.
+
+        The index is built on first use and then refreshed in the background
+        when it becomes stale, the stale index being returned in the meantime.
+        Concurrent first uses for the same Project wait for a single build.
+
+        :param str project_key: A Jira Project key.
+        :returns: A tuple with the time the index was built and a dictionary
+                  where keys are lower case email addresses and values are
+                  :class:`jira.resources.User` instances.
+        """
+        while True:
+            with self._jira_users_indexes_lock:
+                entry = self._jira_users_indexes.get(project_key)
+                if entry is not None:
+                    break
+                built = self._building_jira_users_indexes.get(project_key)
+                if built is None:
+                    built = threading.Event()
+                    self._building_jira_users_indexes[project_key] = built
+                    building = True
+                else:
+                    building = False
+            if not building:
+                # Another thread is building the index, wait for it and check
+                # again: the build might have failed.
+                built.wait()
+                continue
+            try:
+                return self._build_assignable_users_index(project_key)
+            finally:
+                with self._jira_users_indexes_lock:
+                    del self._building_jira_users_indexes[project_key]
+                built.set()
+        if time.time() - entry[0] > JIRA_USER_INDEX_TTL:
+            self._refresh_assignable_users_index(project_key)
+        return entry
+
+    def _refresh_assignable_users_index(self, project_key):
+        """
+        Rebuild the index of assignable users for the given Jira Project in a
+        background thread, unless it is already being rebuilt.
+
+        :param str project_key: A Jira Project key.
+        """
+        with self._jira_users_indexes_lock:
+            if project_key in self._refreshing_jira_users_indexes:
+                return
+            self._refreshing_jira_users_indexes.add(project_key)
+
+        def refresh():
+            try:
+                self._build_assignable_users_index(project_key)
+            except Exception as e:
+                # Keep using the current index.
+                logger.warning(
+                    "Unable to refresh assignable users for Jira Project %s: %s" % (
+                        project_key, e
+                    )
+                )
+                logger.debug("%s" % e, exc_info=True)
+            finally:
+                with self._jira_users_indexes_lock:
+                    self._refreshing_jira_users_indexes.discard(project_key)
+
+        thread = threading.Thread(
+            target=refresh,
+            name="sg_jira_users_index_%s" % project_key,
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _build_assignable_users_index(self, project_key):
+        """
+        Build and store the index of all assignable users for the given Jira
+        Project, paging through them.
+
+        :param str project_key: A Jira Project key.
+        :returns: A tuple with the time the index was built and a dictionary
+                  where keys are lower case email addresses and values are
+                  :class:`jira.resources.User` instances.
+        """
+        built_at = time.time()
+        jira_users_index = {}
+        start_idx = 0
+        while True:
+            logger.debug(
+                "Querying all assignable users for Jira Project %s starting at #%d" % (
+                    project_key, start_idx
+                )
+            )
+            jira_users = self.search_assignable_users_for_issues(
+                None,
+                project=project_key,
+                maxResults=JIRA_RESULT_PAGING,
+                startAt=start_idx,
+            )
+            if not jira_users:
+                break
+            for jira_user in jira_users:
+                if jira_user.emailAddress:
+                    # Keep the first user found for a given email address.
+                    jira_users_index.setdefault(
+                        jira_user.emailAddress.lower(), jira_user
+                    )
+            start_idx += len(jira_users)
+        logger.debug(
+            "Indexed %d assignable users for Jira Project %s" % (
+                len(jira_users_index), project_key
+            )
+        )
+        entry = (built_at, jira_users_index)
+        with self._jira_users_indexes_lock:
+            self._jira_users_indexes[project_key] = entry
+        return entry
+
     def set_jira_issue_status(self, jira_issue, jira_status_name, comment):
         """
         Attempt to change the Jira Issue status to the given value.
@@ -376,81 +731,69 @@ class JiraSession(jira.client.JIRA):
             ))
             return True
 
-        # Retrieve available transitions for the issue including fields on the
-        # transition screen.
-        jira_transitions = self.transitions(
-            jira_issue,
-            expand="transitions.fields"
-        )
-        for tra in jira_transitions:
-            # Match a transition with the expected status name
-            if tra["to"]["name"] == jira_status_name:
-                logger.debug(
-                    "Found transition for Jira Issue %s to %s: %s" % (
-                        jira_issue,
-                        jira_status_name,
-                        tra,
-                    )
+        transition = self.get_jira_issue_transitions(jira_issue).get(jira_status_name)
+        if transition:
+            tra, required_fields = transition
+            logger.debug(
+                "Found transition for Jira Issue %s to %s: %s" % (
+                    jira_issue,
+                    jira_status_name,
+                    tra,
                 )
-                # Iterate over any fields for transition and find required fields
-                # that don't have a default value. Set the value using our defaults.
-                # NOTE: This only supports text fields right now.
-                fields = {}
-                if "fields" in tra:
-                    for field_name, details in tra["fields"].iteritems():
-                        # If field is required, it doesn't currently have a value and
-                        # there is no default value provided by Jira, use our hardcoded
-                        # default value.
-                        # Eventually, this should be moved to a flexible framework for clients
-                        # to customize on their own like Hooks.
-                        # Note: This is not reliable. The "fields" key we get back from the
-                        # transitions call above only includes fields on the transition screen
-                        # and each field's "required" key refers to whether the field is
-                        # globally set as required. However, you can set a validator
-                        # on the transition that requires a globally optional field be non-empty.
-                        # The field will still show up as "required=False" since the field isn't
-                        # configured as a globally required field.
-                        if details["required"] and (
-                            not getattr(jira_issue.fields, field_name)
-                            and not details.get("hasDefaultValue")
-                        ):
-                            # The resolution field is often required in transitions. We don't
-                            # currently support configuring this so we use the first
-                            # allowed value.
-                            if details["schema"]["type"] == "resolution":
-                                fields[field_name] = details["allowedValues"][0]
-                                logger.debug(
-                                    "Setting resolution to first allowedValue: %s" %
-                                    details["allowedValues"][0]
-                                )
-                            # Text fields are just filled with our default value to satisfy
-                            # the requirement.
-                            elif details["schema"]["type"] == "text":
-                                fields[field_name] = comment
-
-                # We add a comment by default in case it is required by the transition validator.
-                # Note that the comment will only be saved if it is visible on a transition
-                # screen.
-                params = {
-                    "comment": comment,
-                }
-                # If there are any required text fields we have
-                # provided values for, then add the "fields" param. When "fields" is specified,
-                # all other keyword params are ignored (including the comment param setup above).
-                if fields:
-                    params["fields"] = fields
-
-                logger.info("Transitioning Issue %s to '%s' with params: %s" % (
-                    jira_issue.key,
-                    tra["name"],
-                    params
-                ))
+            )
+            # Set values for required fields without a default value using our
+            # defaults, if the Issue doesn't have a value for them.
+            # NOTE: This only supports text fields right now.
+            fields = {}
+            for field_name, details in required_fields:
+                if getattr(jira_issue.fields, field_name):
+                    continue
+                # The resolution field is often required in transitions. We don't
+                # currently support configuring this so we use the first
+                # allowed value.
+                if details["schema"]["type"] == "resolution":
+                    fields[field_name] = details["allowedValues"][0]
+                    logger.debug(
+                        "Setting resolution to first allowedValue: %s" %
+                        details["allowedValues"][0]
+                    )
+                # Text fields are just filled with our default value to satisfy
+                # the requirement.
+                elif details["schema"]["type"] == "text":
+                    fields[field_name] = comment
+
+            # We add a comment by default in case it is required by the transition validator.
+            # Note that the comment will only be saved if it is visible on a transition
+            # screen.
+            params = {
+                "comment": comment,
+            }
+            # If there are any required text fields we have
+            # provided values for, then add the "fields" param. When "fields" is specified,
+            # all other keyword params are ignored (including the comment param setup above).
+            if fields:
+                params["fields"] = fields
+
+            logger.info("Transitioning Issue %s to '%s' with params: %s" % (
+                jira_issue.key,
+                tra["name"],
+                params
+            ))
+            try:
                 self.transition_issue(
                     jira_issue,
                     tra["id"],
                     **params
                 )
-                return True
+            except JIRAError:
+                # Transitions can have conditions which depend on the Issue
+                # itself, don't trust cached transitions for its workflow
+                # state anymore.
+                self._jira_transitions_cache.invalidate(
+                    self._get_jira_issue_workflow_key(jira_issue)
+                )
+                raise
+            return True
 
         logger.warning(
             "Couldn't find a Jira transition with %s as target for Issue %s" % (
@@ -458,9 +801,57 @@ class JiraSession(jira.client.JIRA):
                 jira_issue.key
             )
         )
-        logger.debug("Available transitions are %s" % jira_transitions)
+        logger.debug(
+            "Available transitions are %s" % self.get_jira_issue_transitions(jira_issue)
+        )
         return False
 
+    def get_jira_issue_transitions(self, jira_issue):
+        """
+        Return the transitions available for the given Jira Issue, indexed by
+        their target status name.
+
+        Transitions are cached per Project, Issue type and status.
+
+        :param jira_issue: A :class:`jira.Issue` instance.
+        :returns: A dictionary where keys are Jira status names and values are
+                  tuples with a Jira transition dictionary and a list of
+                  (field name, field details) tuples for the fields required
+                  by the transition which don't have a default value.
+        """
+        cache_key = self._get_jira_issue_workflow_key(jira_issue)
+        jira_transitions = self._jira_transitions_cache.get(cache_key)
+        if jira_transitions is not None:
+            return jira_transitions
+        jira_transitions = {}
+        # Retrieve available transitions for the issue including fields on the
+        # transition screen.
+        for tra in self.transitions(jira_issue, expand="transitions.fields"):
+            # Only keep the first transition with a given target status.
+            if tra["to"]["name"] in jira_transitions:
+                continue
+            # Iterate over any fields for transition and find required fields
+            # that don't have a default value.
+            required_fields = []
+            for field_name, details in tra.get("fields", {}).iteritems():
+                # If field is required and there is no default value provided
+                # by Jira, we will use our hardcoded default value if the Issue
+                # doesn't have a value for it.
+                # Eventually, this should be moved to a flexible framework for clients
+                # to customize on their own like Hooks.
+                # Note: This is not reliable. The "fields" key we get back from the
+                # transitions call above only includes fields on the transition screen
+                # and each field's "required" key refers to whether the field is
+                # globally set as required. However, you can set a validator
+                # on the transition that requires a globally optional field be non-empty.
+                # The field will still show up as "required=False" since the field isn't
+                # configured as a globally required field.
+                if details["required"] and not details.get("hasDefaultValue"):
+                    required_fields.append((field_name, details))
+            jira_transitions[tra["to"]["name"]] = (tra, required_fields)
+        self._jira_transitions_cache.set(cache_key, jira_transitions)
+        return jira_transitions
+
     def create_issue_from_data(self, jira_project, issue_type, data):
         """
         Create an Issue from the given data.
@@ -478,34 +869,9 @@ class JiraSession(jira.client.JIRA):
         :raises ValueError: if invalid and unfixable data is provided.
         """
         jira_issue_type = self.issue_type_by_name(issue_type)
-        # Retrieve creation meta data for the project / issue type
-        # Note: there is a new simpler Project type in Jira where createmeta is not
-        # available.
-        # https://confluence.atlassian.com/jirasoftwarecloud/working-with-agility-boards-945104895.html
-        # https://community.developer.atlassian.com/t/jira-cloud-next-gen-projects-and-connect-apps/23681/14
-        # It seems a Project `simplified` key can help distinguish between old
-        # school projects and new simpler projects.
-        # TODO: cache the retrieved data to avoid multiple requests to the server
-        create_meta_data = self.createmeta(
-            jira_project,
-            issuetypeIds=jira_issue_type.id,
-            expand="projects.issuetypes.fields"
+        fields_createmeta = self.get_jira_issue_create_meta(
+            jira_project, jira_issue_type
         )
-        # We asked for a single project / single issue type, so we can just pick
-        # the first entry, if it exists.
-        if not create_meta_data["projects"] or not create_meta_data["projects"][0]["issuetypes"]:
-            logger.debug("Create meta data for Project %s Issue type %s: %s" % (
-                jira_project,
-                jira_issue_type.id,
-                create_meta_data
-            ))
-            raise RuntimeError(
-                "Unable to retrieve create meta data for Project %s Issue type %s."  % (
-                    jira_project,
-                    jira_issue_type.id,
-                )
-            )
-        fields_createmeta = create_meta_data["projects"][0]["issuetypes"][0]["fields"]
 
         # Make a shallow copy so we can add/delete keys
         data = dict(data)
@@ -562,17 +928,82 @@ class JiraSession(jira.client.JIRA):
 
         return self.create_issue(fields=data)
 
+    def get_jira_issue_create_meta(self, jira_project, jira_issue_type):
+        """
+        Return the create metadata for the given Jira Project and Issue type.
+
+        Create metadata is cached per Project and Issue type.
+
+        :param jira_project: A :class:`jira.resources.Project` instance.
+        :param jira_issue_type: A :class:`jira.resources.IssueType` instance.
+        :returns: The create metadata `fields` property for the Issue type.
+        :raises RuntimeError: if the create metadata can't be retrieved.
+        """
+        cache_key = (jira_project.key, jira_issue_type.id)
+        fields_createmeta = self._jira_create_meta_cache.get(cache_key)
+        if fields_createmeta is not None:
+            return fields_createmeta
+        # Retrieve creation meta data for the project / issue type
+        # Note: there is a new simpler Project type in Jira where createmeta is not
+        # available.
+        # https://confluence.atlassian.com/jirasoftwarecloud/working-with-agility-boards-945104895.html
+        # https://community.developer.atlassian.com/t/jira-cloud-next-gen-projects-and-connect-apps/23681/14
+        # It seems a Project `simplified` key can help distinguish between old
+        # school projects and new simpler projects.
+        create_meta_data = self.createmeta(
+            jira_project,
+            issuetypeIds=jira_issue_type.id,
+            expand="projects.issuetypes.fields"
+        )
+        # We asked for a single project / single issue type, so we can just pick
+        # the first entry, if it exists.
+        if not create_meta_data["projects"] or not create_meta_data["projects"][0]["issuetypes"]:
+            logger.debug("Create meta data for Project %s Issue type %s: %s" % (
+                jira_project,
+                jira_issue_type.id,
+                create_meta_data
+            ))
+            raise RuntimeError(
+                "Unable to retrieve create meta data for Project %s Issue type %s."  % (
+                    jira_project,
+                    jira_issue_type.id,
+                )
+            )
+        fields_createmeta = create_meta_data["projects"][0]["issuetypes"][0]["fields"]
+        self._jira_create_meta_cache.set(cache_key, fields_createmeta)
+        return fields_createmeta
+
+    def _get_jira_issue_workflow_key(self, jira_issue):
+        """
+        Return a key identifying the workflow state of the given Jira Issue.
+
+        :param jira_issue: A :class:`jira.Issue` instance.
+        :returns: A (Project key, Issue type id, status id) tuple.
+        """
+        fields = jira_issue.fields
+        status = getattr(fields, "status", None)
+        return (
+            fields.project.key,
+            getattr(fields.issuetype, "id", None),
+            getattr(status, "id", None),
+        )
+
     def get_jira_issue_edit_meta(self, jira_issue):
         """
         Return the edit metadata for the given Jira Issue.
 
+        Edit metadata is cached per Project, Issue type and status.
+
         :param jira_issue: A :class:`jira.Issue`.
         :returns: The Jira Issue edit metadata `fields` property.
         :raises RuntimeError: if the edit metadata can't be retrieved for the
                  given Issue.
         """
+        cache_key = self._get_jira_issue_workflow_key(jira_issue)
+        jira_edit_fields = self._jira_edit_meta_cache.get(cache_key)
+        if jira_edit_fields is not None:
+            return jira_edit_fields
         # Retrieve edit meta data for the issue
-        # TODO: cache the retrieved data to avoid multiple requests to the server
         edit_meta_data = self.editmeta(jira_issue)
         jira_edit_fields = edit_meta_data.get("fields")
         if not jira_edit_fields:
@@ -582,4 +1013,5 @@ class JiraSession(jira.client.JIRA):
                     jira_issue.key
                 )
             )
+        self._jira_edit_meta_cache.set(cache_key, jira_edit_fields)
         return jira_edit_fields
@@ -0,0 +1,210 @@
+# Copyright 2018 Autodesk, Inc.  All rights reserved.
+#
+# Use of this software is subject to the terms of the Autodesk license agreement
+# provided at the time of installation or download, or which otherwise accompanies
+# this software in either electronic or hard copy form.
+#
+
+from email.utils import parsedate_tz, mktime_tz
+import logging
+import threading
+import time
+
+import requests
+
+from .constants import JIRA_RATE_LIMIT_BACKOFF, JIRA_RATE_LIMIT_MAX_WAIT
+from .constants import JIRA_RATE_LIMIT_RETRIES
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket(object):
+    """
+    A thread safe token bucket limiting the rate of requests.
+
+    Tokens are added at a constant rate, up to a maximum burst size, and a
+    token is consumed for each request.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Instantiate a new token bucket.
+
+        :param float rate: The number of tokens added per second.
+        :param int burst: Optional maximum number of tokens, allowing that many
+                          requests to be issued at once. The rate rounded up is
+                          used if not set.
+        :raises ValueError: if the rate or the burst size is invalid.
+        """
+        super(TokenBucket, self).__init__()
+        if rate <= 0:
+            raise ValueError("Invalid rate %s, it must be positive" % rate)
+        if burst is None:
+            burst = max(1, int(rate + 0.5))
+        if burst < 1:
+            raise ValueError("Invalid burst size %s, it must be at least 1" % burst)
+        self._rate = float(rate)
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last_time = time.time()
+        # Tokens are not delivered before this time.
+        self._paused_until = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Consume a token, waiting until one is available.
+
+        :returns: The number of seconds spent waiting.
+        """
+        waited = 0
+        while True:
+            with self._lock:
+                now = time.time()
+                delay = self._paused_until - now
+                if delay <= 0:
+                    self._tokens = min(
+                        self._burst,
+                        self._tokens + (now - self._last_time) * self._rate
+                    )
+                    self._last_time = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self._rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, delay):
+        """
+        Stop delivering tokens for the given number of seconds.
+
+        Tokens in the bucket are discarded, so requests resume at the bucket
+        rate when the pause is over.
+
+        :param float delay: A number of seconds.
+        """
+        with self._lock:
+            now = time.time()
+            self._paused_until = max(self._paused_until, now + delay)
+            self._tokens = 0
+            self._last_time = self._paused_until
+
+
+def get_retry_after(response):
+    """
+    Return the number of seconds to wait before retrying a request, from the
+    `Retry-After` header of the given response.
+
+    :param response: A :class:`requests.Response` instance.
+    :returns: A number of seconds or `None` if the header is not set or is
+              invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0, float(value))
+    except ValueError:
+        pass
+    # The value can be a HTTP date.
+    parsed = parsedate_tz(value)
+    if not parsed:
+        return None
+    return max(0, mktime_tz(parsed) - time.time())
+
+
+class RateLimitedAdapter(requests.adapters.HTTPAdapter):
+    """
+    A :class:`requests.adapters.HTTPAdapter` limiting the rate of requests
+    with a :class:`TokenBucket` and retrying requests rejected with a 429
+    "Too Many Requests" error.
+
+    Retries wait for the delay given by the `Retry-After` header or, if not
+    set, for an exponentially increasing delay. All requests sent through the
+    adapter are held while waiting.
+    """
+
+    def __init__(
+        self,
+        rate_limit=None,
+        burst=None,
+        max_retries_on_429=JIRA_RATE_LIMIT_RETRIES,
+        **kwargs
+    ):
+        """
+        Instantiate a new adapter.
+
+        Additionally to the :class:`requests.adapters.HTTPAdapter` parameters,
+        the following keyword parameters are accepted:
+
+        :param float rate_limit: Optional maximum number of requests per second.
+                                 The rate is not limited if not set.
+        :param int burst: Optional maximum number of requests which can be
+                          issued at once without being rate limited.
+        :param int max_retries_on_429: The maximum number of times a request
+                                       rejected with a 429 error is retried.
+        """
+        super(RateLimitedAdapter, self).__init__(**kwargs)
+        self._bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self._max_retries_on_429 = max_retries_on_429
+        # Requests are held until this time after a 429 error if there is no
+        # token bucket.
+        self._paused_until = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        """
+        Send the given prepared request, waiting for the rate limit and
+        retrying it if rejected with a 429 error.
+
+        :param request: A :class:`requests.PreparedRequest` instance.
+        :returns: A :class:`requests.Response` instance.
+        """
+        attempt = 0
+        while True:
+            self._wait()
+            response = super(RateLimitedAdapter, self).send(request, **kwargs)
+            if response.status_code != 429 or attempt >= self._max_retries_on_429:
+                return response
+            delay = get_retry_after(response)
+            if delay is None:
+                delay = JIRA_RATE_LIMIT_BACKOFF * 2 ** attempt
+            delay = min(delay, JIRA_RATE_LIMIT_MAX_WAIT)
+            attempt += 1
+            logger.warning(
+                "Rate limited on %s %s, retrying [%d/%d] in %.1fs" % (
+                    request.method,
+                    request.url,
+                    attempt,
+                    self._max_retries_on_429,
+                    delay,
+                )
+            )
+            # Release the connection before waiting.
+            response.close()
+            self._pause(delay)
+
+    def _wait(self):
+        """
+        Wait until a request can be sent.
+        """
+        if self._bucket:
+            self._bucket.acquire()
+            return
+        with self._lock:
+            delay = self._paused_until - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _pause(self, delay):
+        """
+        Hold all requests for the given number of seconds.
+
+        :param float delay: A number of seconds.
+        """
+        if self._bucket:
+            self._bucket.pause(delay)
+            return
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.time() + delay)
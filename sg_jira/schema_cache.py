@@ -0,0 +1,128 @@
+# Copyright 2018 Autodesk, Inc.  All rights reserved.
+#
+# Use of this software is subject to the terms of the Autodesk license agreement
+# provided at the time of installation or download, or which otherwise accompanies
+# this software in either electronic or hard copy form.
+#
+
+import json
+import logging
+import os
+import threading
+
+from .constants import SCHEMA_CACHE_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaCache(object):
+    """
+    A snapshot of the Jira fields map and of Shotgun field schemas stored in
+    a JSON file, allowing a bridge to start without retrieving them.
+
+    Snapshots are versioned and bound to a Shotgun site and a Jira site: a
+    snapshot saved with a different version or for other sites is ignored.
+    """
+
+    def __init__(self, path, shotgun_site, jira_site):
+        """
+        Instantiate a new schema cache.
+
+        :param str path: Full path to the JSON file.
+        :param str shotgun_site: The Shotgun site url.
+        :param str jira_site: The Jira site url.
+        """
+        super(SchemaCache, self).__init__()
+        self._path = path
+        self._shotgun_site = shotgun_site
+        self._jira_site = jira_site
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        """
+        Return the full path to the JSON file.
+        """
+        return self._path
+
+    def load(self):
+        """
+        Load the snapshot from the JSON file.
+
+        :returns: A tuple with a Jira fields map and a dictionary of Shotgun
+                  field schemas indexed by Entity type, or `None` if no valid
+                  snapshot is available.
+        """
+        if not os.path.exists(self._path):
+            return None
+        try:
+            with open(self._path, "r") as f:
+                snapshot = json.load(f)
+        except (IOError, ValueError) as e:
+            logger.warning(
+                "Ignoring invalid schema cache file %s: %s" % (self._path, e)
+            )
+            return None
+        if not isinstance(snapshot, dict):
+            logger.warning("Ignoring invalid schema cache file %s" % self._path)
+            return None
+        if snapshot.get("version") != SCHEMA_CACHE_VERSION:
+            logger.info(
+                "Ignoring schema cache file %s with version %s" % (
+                    self._path, snapshot.get("version")
+                )
+            )
+            return None
+        if (
+            snapshot.get("shotgun_site") != self._shotgun_site
+            or snapshot.get("jira_site") != self._jira_site
+        ):
+            logger.info(
+                "Ignoring schema cache file %s saved for %s and %s" % (
+                    self._path,
+                    snapshot.get("shotgun_site"),
+                    snapshot.get("jira_site"),
+                )
+            )
+            return None
+        logger.info("Loaded schemas from %s" % self._path)
+        return snapshot.get("jira_fields") or {}, snapshot.get("shotgun_schemas") or {}
+
+    def save(self, jira_fields_map, shotgun_schemas):
+        """
+        Save the given Jira fields map and Shotgun field schemas to the JSON
+        file.
+
+        Errors are logged and not raised: a missing snapshot just slows down
+        the next start.
+
+        :param jira_fields_map: A dictionary where keys are lower case Jira
+                                field names and values are their id.
+        :param shotgun_schemas: A dictionary where keys are Shotgun Entity
+                                types and values their field schemas.
+        """
+        snapshot = {
+            "version": SCHEMA_CACHE_VERSION,
+            "shotgun_site": self._shotgun_site,
+            "jira_site": self._jira_site,
+            "jira_fields": jira_fields_map,
+            "shotgun_schemas": shotgun_schemas,
+        }
+        # Write to a temporary file and rename it, so an interrupted write
+        # can't leave a truncated snapshot.
+        tmp_path = "%s.tmp" % self._path
+        with self._lock:
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(snapshot, f)
+                if os.name == "nt" and os.path.exists(self._path):
+                    # Renaming to an existing file is not allowed on Windows.
+                    os.remove(self._path)
+                os.rename(tmp_path, self._path)
+            except (IOError, OSError, TypeError, ValueError) as e:
+                logger.warning(
+                    "Unable to save schema cache file %s: %s" % (self._path, e)
+                )
+                logger.debug("%s" % e, exc_info=True)
+                return
+        logger.debug("Saved schemas to %s" % self._path)
@@ -5,11 +5,20 @@
 # this software in either electronic or hard copy form.
 #
 
+import contextlib
+import copy
 import logging
+import threading
+import time
+import Queue
 import shotgun_api3
 
 from .constants import SG_ENTITY_SPECIAL_NAME_FIELDS
 from .constants import SHOTGUN_JIRA_ID_FIELD
+from .constants import SHOTGUN_ENTITY_CACHE_TTL, SHOTGUN_ENTITY_CACHE_SIZE
+from .constants import SHOTGUN_UNCACHED_FIELDS
+from .constants import SHOTGUN_SCHEMA_CACHE_TTL
+from .cache import TTLCache
 from .utils import utf8_to_unicode, unicode_to_utf8
 
 logger = logging.getLogger(__name__)
@@ -22,49 +31,79 @@ class ShotgunSession(object):
 
     Ensures all the values we get from Shotgun are unicode and not utf-8 encoded
     strings. Utf-8 encodes unicode values before sending them to Shotgun.
-    """
 
-    # The list of Shotgun methods we need to wrap.
-    _WRAP_SHOTGUN_METHODS = [
-        "authenticate_human_user",
-        "create",
-        "find_one",
-        "find",
-        "update",
-        "batch",
-        "upload",
-        "upload_thumbnail",
-        "upload_filmstrip_thumbnail",
-        "download_attachment",
-        "get_attachment_download_url",
-        "schema_entity_read",
-        "schema_field_create",
-        "schema_field_delete",
-        "schema_field_read",
-        "schema_field_update",
-        "schema_read",
-        "share_thumbnail",
-    ]
+    A session can be used from multiple threads: a :class:`shotgun_api3.shotgun.Shotgun`
+    instance is not thread safe, so each call to Shotgun checks out a connection
+    from a pool which is not used by any other thread. The session uuid is set
+    per thread.
+    """
 
     def __init__(self, base_url, script_name=None, *args, **kwargs):
         """
         Instantiate a :class:`shotgun_api3.shotgun.Shotgun` with the sanitized parameters.
+
+        Additionally to the :class:`shotgun_api3.shotgun.Shotgun` parameters,
+        a `pool_size` keyword parameter can be set to the maximum number of
+        Shotgun connections used concurrently, 1 by default.
+
+        :raises ValueError: if the pool size is not at least 1.
         """
         # Note: we use composition rather than inheritance to wrap the Shotgun
         # instance. Otherwise we would have to redefine all the methods we need
         # to wrap with some very similar code which would encode all params,
         # blindly call the original method, decode and return the result.
-
-        safe_args = unicode_to_utf8(args)
-        safe_kwargs = unicode_to_utf8(kwargs)
-        self._shotgun = shotgun_api3.Shotgun(
+        pool_size = kwargs.pop("pool_size", None) or 1
+        if pool_size < 1:
+            raise ValueError(
+                "Invalid Shotgun connection pool size %s, it must be at least 1" % pool_size
+            )
+        self._pool_size = pool_size
+        # Parameters used to create Shotgun connections.
+        self._connection_args = (
             unicode_to_utf8(base_url),
             unicode_to_utf8(script_name),
-            *safe_args,
-            **safe_kwargs
-        )
-
+        ) + unicode_to_utf8(args)
+        self._connection_kwargs = unicode_to_utf8(kwargs)
+        # All the Shotgun connections created so far, and the ones which are
+        # not currently used. Connections are created on demand, up to the
+        # pool size.
+        self._connections = []
+        self._idle_connections = Queue.LifoQueue()
+        self._connections_lock = threading.Lock()
+        self._user_agents = []
+        # Per thread data, e.g. the session uuid used for Shotgun calls.
+        self._thread_data = threading.local()
+        # The first connection is used to retrieve Shotgun attributes which
+        # are not methods we wrap.
+        self._shotgun = self._create_connection()
+        self._idle_connections.put(self._shotgun)
+
+        # Shotgun schemas with unicode strings indexed by Entity type, with the
+        # time at which they should be refreshed.
         self._shotgun_schemas = {}
+        self._shotgun_schemas_refresh_times = {}
+        # Entity types for which schemas are being refreshed in the background.
+        self._refreshing_schemas = set()
+        # Guards the cached schemas, their refresh times and the Entity types
+        # being refreshed. Schemas are never read from Shotgun while it is held.
+        self._schemas_lock = threading.Lock()
+        # Field values retrieved from Shotgun indexed by Entity type and id.
+        self._entities_cache = TTLCache(
+            SHOTGUN_ENTITY_CACHE_TTL,
+            max_size=SHOTGUN_ENTITY_CACHE_SIZE,
+        )
+        # Cached Entities are invalidated while values are being read from
+        # Shotgun by other threads: invalidations are numbered, and the number
+        # of the last invalidation of each Entity is kept while reads started
+        # before it are in progress, so values they read are not cached.
+        self._entities_lock = threading.Lock()
+        self._entities_invalidation_count = 0
+        # Last invalidation numbers indexed by Entity type and id, `None` for
+        # all Entities.
+        self._invalidated_entities = {}
+        # Number of reads in progress indexed by the invalidation number when
+        # they started.
+        self._entities_reads = {}
         # Retrieve our current login, this does not seem to be available from
         # the connection?
         self._shotgun_user = self.find_one(
@@ -74,6 +113,60 @@ class ShotgunSession(object):
         )
         logger.info("Connected to %s." % base_url)
 
+    def _create_connection(self):
+        """
+        Create a new Shotgun connection and add it to the pool.
+
+        Must be called with the connections lock acquired, except from the
+        constructor.
+
+        :returns: A :class:`shotgun_api3.shotgun.Shotgun` instance.
+        """
+        connection = shotgun_api3.Shotgun(
+            *self._connection_args,
+            **self._connection_kwargs
+        )
+        for user_agent in self._user_agents:
+            connection.add_user_agent(user_agent)
+        self._connections.append(connection)
+        return connection
+
+    @contextlib.contextmanager
+    def _checkout_connection(self):
+        """
+        Context manager providing a Shotgun connection which is not used by
+        any other thread, waiting for one to be available if needed.
+
+        The session uuid set for the current thread is set on the connection.
+        """
+        try:
+            connection = self._idle_connections.get_nowait()
+        except Queue.Empty:
+            connection = None
+            with self._connections_lock:
+                if len(self._connections) < self._pool_size:
+                    connection = self._create_connection()
+            if connection is None:
+                connection = self._idle_connections.get()
+        try:
+            connection.set_session_uuid(
+                getattr(self._thread_data, "session_uuid", None)
+            )
+            yield connection
+        finally:
+            self._idle_connections.put(connection)
+
+    def add_user_agent(self, user_agent):
+        """
+        Add the given user agent to all Shotgun connections.
+
+        :param str user_agent: A user agent string, e.g. "my_app".
+        """
+        with self._connections_lock:
+            self._user_agents.append(user_agent)
+            for connection in self._connections:
+                connection.add_user_agent(user_agent)
+
     @property
     def current_user(self):
         """
@@ -83,6 +176,17 @@ class ShotgunSession(object):
         """
         return self._shotgun_user
 
+    def set_session_uuid(self, session_uuid):
+        """
+        Set the session uuid used for Shotgun calls made from the current thread.
+
+        Changes made in Shotgun with a session uuid are reported in real time
+        to the Shotgun web pages using the same uuid.
+
+        :param str session_uuid: A session uuid or `None`.
+        """
+        self._thread_data.session_uuid = session_uuid
+
     def setup(self):
         """
         Check the Shotgun site and cache site level values.
@@ -128,20 +232,164 @@ class ShotgunSession(object):
         """
         Return the Shotgun schema for the given Entity field.
 
-        .. note:: Shotgun schemas are cached and the bridge needs to be restarted
-                  if schemas are changed in Shotgun.
+        .. note:: Shotgun schemas are cached and refreshed in the background
+                  once they are older than ``SHOTGUN_SCHEMA_CACHE_TTL``
+                  seconds.
 
         :param str entity_type: A Shotgun Entity type.
         :param str field_name: A Shotgun field name, e.g. 'sg_my_precious'.
         :returns: The Shotgun schema for the given field as a dictionary or `None`.
         """
-        if entity_type not in self._shotgun_schemas:
-            self._shotgun_schemas[entity_type] = self._shotgun.schema_field_read(
-                entity_type
-            )
-        field = self._shotgun_schemas[entity_type].get(field_name)
+        field = self._get_entity_schema(entity_type).get(field_name)
         return field
 
+    def _get_entity_schema(self, entity_type):
+        """
+        Return the cached Shotgun schema for the given Entity type, reading it
+        if needed.
+
+        A background refresh is started if the cached schema is stale, the
+        stale schema being returned in the meantime.
+
+        :param str entity_type: A Shotgun Entity type.
+        :returns: A dictionary where keys are field names and values their
+                  schema.
+        """
+        with self._schemas_lock:
+            entity_schema = self._shotgun_schemas.get(entity_type)
+            refresh_time = self._shotgun_schemas_refresh_times.get(entity_type, 0)
+        if entity_schema is None:
+            return self._read_entity_schema(entity_type)
+        if time.time() > refresh_time:
+            self._refresh_entity_schema(entity_type)
+        return entity_schema
+
+    def _read_entity_schema(self, entity_type):
+        """
+        Read the Shotgun schema for the given Entity type and cache it.
+
+        :param str entity_type: A Shotgun Entity type.
+        :returns: A dictionary where keys are field names and values their
+                  schema.
+        """
+        with self._checkout_connection() as connection:
+            entity_schema = utf8_to_unicode(connection.schema_field_read(entity_type))
+        # Cached schemas are replaced as a whole and never modified, so they
+        # can be used without holding the lock once retrieved.
+        with self._schemas_lock:
+            self._shotgun_schemas[entity_type] = entity_schema
+            self._shotgun_schemas_refresh_times[entity_type] = (
+                time.time() + SHOTGUN_SCHEMA_CACHE_TTL
+            )
+        return entity_schema
+
+    def _refresh_entity_schema(self, entity_type):
+        """
+        Read the Shotgun schema for the given Entity type in a background thread,
+        unless it is already being read.
+
+        :param str entity_type: A Shotgun Entity type.
+        """
+        with self._schemas_lock:
+            if entity_type in self._refreshing_schemas:
+                return
+            self._refreshing_schemas.add(entity_type)
+
+        def refresh():
+            try:
+                logger.debug("Refreshing cached Shotgun schema for %s" % entity_type)
+                self._read_entity_schema(entity_type)
+            except Exception as e:
+                # Keep using the current schema.
+                logger.warning(
+                    "Unable to refresh Shotgun schema for %s: %s" % (entity_type, e)
+                )
+                logger.debug("%s" % e, exc_info=True)
+            finally:
+                with self._schemas_lock:
+                    self._refreshing_schemas.discard(entity_type)
+
+        thread = threading.Thread(
+            target=refresh,
+            name="sg_jira_schema_%s" % entity_type,
+        )
+        thread.daemon = True
+        thread.start()
+
+    def refresh_cached_field_schema(self, entity_type, field_name):
+        """
+        Read the Shotgun schema for the given Entity field again, e.g. after
+        changing it, and update the cached schema for the Entity type with it.
+
+        Nothing is done if no schema is cached for the Entity type.
+
+        :param str entity_type: A Shotgun Entity type.
+        :param str field_name: A Shotgun field name, e.g. 'sg_my_precious'.
+        """
+        with self._schemas_lock:
+            if entity_type not in self._shotgun_schemas:
+                return
+        logger.debug(
+            "Refreshing cached Shotgun schema for %s.%s" % (entity_type, field_name)
+        )
+        with self._checkout_connection() as connection:
+            field_schema = utf8_to_unicode(
+                connection.schema_field_read(entity_type, field_name)
+            )
+        with self._schemas_lock:
+            # Merge into the current schema, which might have been replaced
+            # or cleared while the field was read.
+            entity_schema = self._shotgun_schemas.get(entity_type)
+            if entity_schema is None:
+                return
+            entity_schema = dict(entity_schema)
+            entity_schema.update(field_schema)
+            self._shotgun_schemas[entity_type] = entity_schema
+
+    @property
+    def field_schemas(self):
+        """
+        Return all cached Shotgun field schemas.
+
+        :returns: A dictionary where keys are Shotgun Entity types and values
+                  are their field schemas.
+        """
+        with self._schemas_lock:
+            return dict(self._shotgun_schemas)
+
+    def set_field_schemas(self, field_schemas):
+        """
+        Replace all cached Shotgun field schemas with the given ones, e.g.
+        loaded from a snapshot.
+
+        :param field_schemas: A dictionary where keys are Shotgun Entity types
+                              and values are their field schemas.
+        """
+        field_schemas = utf8_to_unicode(field_schemas)
+        refresh_time = time.time() + SHOTGUN_SCHEMA_CACHE_TTL
+        with self._schemas_lock:
+            self._shotgun_schemas_refresh_times = dict(
+                (entity_type, refresh_time) for entity_type in field_schemas
+            )
+            self._shotgun_schemas = field_schemas
+
+    def retrieve_field_schemas(self, entity_types):
+        """
+        Retrieve the field schemas for the given Shotgun Entity types from
+        Shotgun, without caching them.
+
+        :param entity_types: A list of Shotgun Entity types.
+        :returns: A dictionary where keys are Shotgun Entity types and values
+                  are their field schemas.
+        """
+        field_schemas = {}
+        for entity_type in entity_types:
+            with self._checkout_connection() as connection:
+                field_schemas[entity_type] = utf8_to_unicode(
+                    connection.schema_field_read(entity_type)
+                )
+        return field_schemas
+
     def clear_cached_field_schema(self, entity_type=None):
         """
         Clear all cached Shotgun schema or just the cached schema for the given
@@ -151,11 +399,120 @@ class ShotgunSession(object):
         """
         if entity_type:
             logger.debug("Clearing cached Shotgun schema for %s" % entity_type)
-            if entity_type in self._shotgun_schemas:
-                del self._shotgun_schemas[entity_type]
         else:
             logger.debug("Clearing all cached Shotgun schemas")
-            self._shotgun_schemas = {}
+        with self._schemas_lock:
+            if entity_type:
+                self._shotgun_schemas.pop(entity_type, None)
+                self._shotgun_schemas_refresh_times.pop(entity_type, None)
+            else:
+                self._shotgun_schemas = {}
+                self._shotgun_schemas_refresh_times = {}
+
+    def invalidate_cached_entity(self, entity_type, entity_id):
+        """
+        Discard cached values for the given Shotgun Entity.
+
+        :param str entity_type: A Shotgun Entity type.
+        :param int entity_id: A Shotgun Entity id.
+        """
+        self._invalidate_entities((entity_type, entity_id))
+
+    def clear_cached_entities(self):
+        """
+        Clear all cached Shotgun Entities.
+        """
+        logger.debug("Clearing all cached Shotgun Entities")
+        self._invalidate_entities(None)
+
+    def _invalidate_entities(self, key):
+        """
+        Discard cached values for the Shotgun Entity with the given key, or for
+        all Entities.
+
+        :param key: A tuple with a Shotgun Entity type and id, or `None` for all
+                    Entities.
+        """
+        with self._entities_lock:
+            if key is None:
+                self._entities_cache.clear()
+            else:
+                self._entities_cache.invalidate(key)
+            self._entities_invalidation_count += 1
+            if self._entities_reads:
+                self._invalidated_entities[key] = self._entities_invalidation_count
+
+    @contextlib.contextmanager
+    def _reading_entities(self):
+        """
+        Context manager for reading Shotgun Entities from Shotgun.
+
+        Provide a token to pass to :meth:`_cache_entity` with the values read,
+        so they are not cached if the Entities were invalidated in the meantime.
+        """
+        with self._entities_lock:
+            token = self._entities_invalidation_count
+            self._entities_reads[token] = self._entities_reads.get(token, 0) + 1
+        try:
+            yield token
+        finally:
+            with self._entities_lock:
+                self._entities_reads[token] -= 1
+                if not self._entities_reads[token]:
+                    del self._entities_reads[token]
+                # Forget invalidations which happened before all reads in
+                # progress started.
+                oldest = min(self._entities_reads) if self._entities_reads else None
+                for key, count in self._invalidated_entities.items():
+                    if oldest is None or count <= oldest:
+                        del self._invalidated_entities[key]
+
+    def _cache_entity(self, shotgun_entity, token):
+        """
+        Merge the field values of the given Shotgun Entity into the cache.
+
+        Values are not cached if the Entity was invalidated since they were
+        read. Values for fields listed in :const:`SHOTGUN_UNCACHED_FIELDS`
+        and for fields from linked Entities are never cached.
+
+        :param shotgun_entity: A Shotgun Entity dictionary retrieved from Shotgun.
+        :param token: The token provided by :meth:`_reading_entities` when the
+                      Entity was read.
+        """
+        key = (shotgun_entity["type"], shotgun_entity["id"])
+        values = copy.deepcopy(dict(
+            (field, value) for field, value in shotgun_entity.iteritems()
+            if field not in SHOTGUN_UNCACHED_FIELDS and "." not in field
+        ))
+        with self._entities_lock:
+            if (
+                self._invalidated_entities.get(key, 0) > token
+                or self._invalidated_entities.get(None, 0) > token
+            ):
+                logger.debug(
+                    "Not caching %s (%s) invalidated while it was read" % key
+                )
+                return
+            # Cached dictionaries are never modified, since they can be copied
+            # from other threads.
+            cached = dict(self._entities_cache.get(key) or {})
+            cached.update(values)
+            self._entities_cache.set(key, cached)
+
+    def _get_cached_entity(self, entity_type, entity_id, fields):
+        """
+        Return a copy of the cached Shotgun Entity with the given type and id
+        if values are cached for all the given fields.
+
+        :param str entity_type: A Shotgun Entity type.
+        :param int entity_id: A Shotgun Entity id.
+        :param fields: A list of Shotgun field names.
+        :returns: A Shotgun Entity dictionary or `None`.
+        """
+        cached = self._entities_cache.get((entity_type, entity_id))
+        if not cached or any(field not in cached for field in fields):
+            return None
+        return copy.deepcopy(cached)
 
     @staticmethod
     def get_entity_name_field(entity_type):
@@ -176,12 +533,8 @@ class ShotgunSession(object):
 
         :param str entity_type: A Shotgun Entity type.
         """
-        if entity_type not in self._shotgun_schemas:
-            self._shotgun_schemas[entity_type] = self._shotgun.schema_field_read(
-                entity_type
-            )
         # We only check for standard Shotgun project field
-        field_schema = self._shotgun_schemas[entity_type].get("project")
+        field_schema = self._get_entity_schema(entity_type).get("project")
         if not field_schema:
             return False
         # We don't need to check the field data type: it is not possible to
@@ -190,11 +543,35 @@ class ShotgunSession(object):
         # standard field.
         return True
 
+    def _get_consolidation_fields(self, entity_type):
+        """
+        Return the list of fields needed to handle Shotgun Entities of the
+        given type.
+
+        :param str entity_type: A Shotgun Entity type.
+        :returns: A list of Shotgun field names.
+        """
+        name_field = self.get_entity_name_field(entity_type)
+        if entity_type == "HumanUser":
+            needed_fields = [name_field, "email"]
+        elif entity_type == "Task":
+            needed_fields = [name_field, "task_assignees"]
+        else:
+            needed_fields = [name_field]
+
+        if self.is_project_entity(entity_type):
+            needed_fields.append("project")
+        return needed_fields
+
     def consolidate_entity(self, shotgun_entity, fields=None):
         """
         Consolidate the given Shotgun Entity: collect additional field values,
         ensure the Entity name is available under a "name" key.
 
+        Values retrieved from Shotgun are cached and missing values are served
+        from the cache if all of them are available. Values set in the given
+        Entity dictionary are always kept.
+
         :param shotgun_entity: A Shotgun Entity dictionary with at least its id
                                and its type.
         :param fields: An optional list of fields to add to the query.
@@ -202,19 +579,9 @@ class ShotgunSession(object):
         """
 
         # Define the fields we need to handle the Entity type.
-        needed_fields = []
         entity_type = shotgun_entity["type"]
         name_field = self.get_entity_name_field(entity_type)
-
-        if entity_type == "HumanUser":
-            needed_fields = [name_field, "email"]
-        elif entity_type == "Task":
-            needed_fields = [name_field, "task_assignees"]
-        else:
-            needed_fields = [name_field]
-
-        if self.is_project_entity(shotgun_entity["type"]):
-            needed_fields.append("project")
+        needed_fields = self._get_consolidation_fields(entity_type)
 
         if fields:
             needed_fields.extend(fields)
@@ -222,19 +589,29 @@ class ShotgunSession(object):
         # Do a Shotgun query if any field is missing
         missing = [needed for needed in needed_fields if needed not in shotgun_entity]
         if missing:
-            consolidated = self.find_one(
-                shotgun_entity["type"],
-                [["id", "is", shotgun_entity["id"]]],
-                missing + shotgun_entity.keys(),
+            consolidated = self._get_cached_entity(
+                entity_type,
+                shotgun_entity["id"],
+                missing,
             )
-            if not consolidated:
-                logger.warning(
-                    "Unable to find %s (%d) in Shotgun" % (
+            if consolidated:
+                consolidated.update(shotgun_entity)
+            else:
+                with self._reading_entities() as token:
+                    consolidated = self.find_one(
                         shotgun_entity["type"],
-                        shotgun_entity["id"],
+                        [["id", "is", shotgun_entity["id"]]],
+                        missing + shotgun_entity.keys(),
                     )
-                )
-                return None
+                    if not consolidated:
+                        logger.warning(
+                            "Unable to find %s (%d) in Shotgun" % (
+                                shotgun_entity["type"],
+                                shotgun_entity["id"],
+                            )
+                        )
+                        return None
+                    self._cache_entity(consolidated, token)
             shotgun_entity = consolidated
 
         # Ensure a consistent way to retrieve the Entity name
@@ -254,25 +631,56 @@ class ShotgunSession(object):
         :param shotgun_project: A Shotgun Project dictionary.
         :return: A Shotgun Entity dictionary or `None`.
         """
+        return self.match_entities_by_name(
+            [name], entity_types, shotgun_project
+        ).get(name)
+
+    def match_entities_by_name(self, names, entity_types, shotgun_project):
+        """
+        Retrieve Shotgun Entities with the given names from the given list of
+        Entity types.
+
+        A single Shotgun query is issued for each Entity type, until all names
+        are matched. Entity types are considered in the given order, names are
+        matched without taking the case into account.
+
+        Project Shotgun Entities are restricted to the given Shotgun Project.
+
+        :param names: A list of names to match.
+        :param entity_types: A list of Shotgun Entity types to consider.
+        :param shotgun_project: A Shotgun Project dictionary.
+        :return: A dictionary where keys are the matched names and values are
+                 consolidated Shotgun Entity dictionaries.
+        """
+        matches = {}
+        # Lower case names mapped to the names they were retrieved from.
+        remaining = dict((name.lower(), name) for name in names)
         for entity_type in entity_types:
+            if not remaining:
+                break
             name_field = self.get_entity_name_field(
                 entity_type
             )
-            filter = [[name_field, "is", name]]
-            fields = [name_field]
+            filter = [[name_field, "in", remaining.values()]]
             if self.is_project_entity(entity_type):
                 filter.append(
                     ["project", "is", shotgun_project]
                 )
-                fields.append("project")
-            sg_value = self.find_one(
-                entity_type,
-                filter,
-                fields,
-            )
-            if sg_value:
-                return self.consolidate_entity(sg_value)
-        return None
+            # Retrieve all the fields needed to consolidate the Entities.
+            with self._reading_entities() as token:
+                sg_values = self.find(
+                    entity_type,
+                    filter,
+                    self._get_consolidation_fields(entity_type),
+                )
+                for sg_value in sg_values:
+                    name = remaining.pop((sg_value[name_field] or "").lower(), None)
+                    if name is None:
+                        # Not a name we're looking for or already matched.
+                        continue
+                    self._cache_entity(sg_value, token)
+                    matches[name] = self.consolidate_entity(sg_value)
+        return matches
 
     def get_entity_page_url(self, shotgun_entity):
         """
@@ -285,6 +693,32 @@ class ShotgunSession(object):
             self.base_url, shotgun_entity["type"], shotgun_entity["id"]
         )
 
+    def _invalidate_updated_entities(self, method_name, args, kwargs):
+        """
+        Discard cached values for Shotgun Entities updated by a call to the
+        given Shotgun method with the given parameters.
+
+        :param str method_name: "update" or "batch".
+        :param args: A tuple with the call positional parameters.
+        :param kwargs: A dictionary with the call keyword parameters.
+        """
+        if method_name == "update":
+            if len(args) >= 2:
+                entities = [(args[0], args[1])]
+            else:
+                entities = [(
+                    args[0] if args else kwargs.get("entity_type"),
+                    kwargs.get("entity_id"),
+                )]
+        else:
+            requests = args[0] if args else kwargs.get("requests") or []
+            entities = [
+                (request.get("entity_type"), request.get("entity_id"))
+                for request in requests
+            ]
+        for entity_type, entity_id in entities:
+            self.invalidate_cached_entity(entity_type, entity_id)
+
     def _get_wrapped_shotgun_method(self, method_name):
         """
         Return a wrapped Shotgun method which encodes all parameters and decodes
@@ -292,12 +726,13 @@ class ShotgunSession(object):
 
         :param str method_name: A :class:`~shotgun_api3.shotgun.Shotgun` method name.
         """
-        method_to_wrap = getattr(self._shotgun, method_name)
-
         def wrapped(*args, **kwargs):
             safe_args = unicode_to_utf8(args)
             safe_kwargs = unicode_to_utf8(kwargs)
-            result = method_to_wrap(*safe_args, **safe_kwargs)
+            with self._checkout_connection() as connection:
+                result = getattr(connection, method_name)(*safe_args, **safe_kwargs)
+            if method_name in ["update", "batch"]:
+                self._invalidate_updated_entities(method_name, args, kwargs)
             return utf8_to_unicode(result)
 
         return wrapped
@@ -306,14 +741,16 @@ class ShotgunSession(object):
         """
         Called when an attribute can't be found on this class instance.
 
-        Check if the name is one of the Shotgun method names we need to wrap,
-        return a wrapped method if it is the case.
+        Return a wrapped method if the name is a
+        :class:`shotgun_api3.shotgun.Shotgun` method, so all calls to Shotgun
+        check out a connection from the pool.
         Return the :class:`shotgun_api3.shotgun.Shotgun` attribute otherwise.
 
         :param str attribute_name: The attribute name to retrieve.
         """
-        if attribute_name in self._WRAP_SHOTGUN_METHODS:
+        attribute = getattr(self._shotgun, attribute_name)
+        if callable(attribute):
             return self._get_wrapped_shotgun_method(attribute_name)
-        return getattr(self._shotgun, attribute_name)
+        return attribute
 
 
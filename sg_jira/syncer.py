@@ -76,10 +76,30 @@ class Syncer(object):
 
         :returns: A :class:`jira.resources.Project` instance or None.
         """
-        for jira_project in self.jira.projects():
-            if jira_project.key == project_key:
-                return jira_project
-        return None
+        return self.jira.get_jira_project(project_key)
+
+    def get_accepted_shotgun_fields(self):
+        """
+        Return the Shotgun fields for which events can be accepted by this
+        syncer, from the fields accepted by its handlers.
+
+        Deriving classes re-implementing :meth:`accept_shotgun_event` should
+        re-implement this method as well.
+
+        :returns: A dictionary where keys are Shotgun Entity types and values
+                  sorted lists of Shotgun field names, or `None` if events for
+                  any Shotgun field could be accepted.
+        """
+        accepted_fields = {}
+        for handler in self.handlers:
+            handler_fields = handler.get_accepted_shotgun_fields()
+            if handler_fields is None:
+                return None
+            for entity_type, fields in handler_fields.iteritems():
+                accepted_fields.setdefault(entity_type, set()).update(fields)
+        return dict(
+            (entity_type, sorted(fields)) for entity_type, fields in accepted_fields.iteritems()
+        )
 
     def accept_shotgun_event(self, entity_type, entity_id, event):
         """
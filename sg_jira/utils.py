@@ -5,6 +5,16 @@
 # this software in either electronic or hard copy form.
 #
 
+import httplib
+import logging
+import threading
+
+from jira import JIRAError
+import requests
+import shotgun_api3
+
+logger = logging.getLogger(__name__)
+
 
 def utf8_to_unicode(value):
     """
@@ -104,3 +114,74 @@ def unicode_to_utf8(value):
 
     # Nothing to do, return the value unchanged.
     return value
+
+
+def run_in_parallel(callables, thread_name="sg_jira_parallel"):
+    """
+    Call all the given callables concurrently, each one in its own thread,
+    and wait for all of them to complete.
+
+    :param callables: A list of callables which don't take any parameter.
+    :param str thread_name: Optional prefix for the threads names, suffixed
+                            with the index of their callable.
+    :returns: A list with the values returned by the callables, in the same
+              order.
+    :raises Exception: The error raised by the first callable which failed,
+             after all callables completed. Errors raised by other callables
+             are logged.
+    """
+    results = [None] * len(callables)
+    errors = [None] * len(callables)
+
+    def run(index):
+        try:
+            results[index] = callables[index]()
+        except Exception as e:
+            logger.debug("%s" % e, exc_info=True)
+            errors[index] = e
+
+    threads = []
+    for index in range(len(callables)):
+        thread = threading.Thread(
+            target=run,
+            args=(index,),
+            name="%s_%d" % (thread_name, index),
+        )
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    errors = [error for error in errors if error is not None]
+    if errors:
+        for error in errors[1:]:
+            logger.error("%s" % error)
+        raise errors[0]
+    return results
+
+
+def is_transient_error(error):
+    """
+    Return `True` if the given error is likely to be caused by a transient
+    failure, e.g. Shotgun or Jira being unreachable or overloaded, `False`
+    otherwise.
+
+    Operations which failed with a transient error can be retried later.
+
+    :param error: An exception.
+    """
+    if isinstance(error, JIRAError):
+        status_code = error.status_code
+    elif isinstance(error, shotgun_api3.ProtocolError):
+        status_code = error.errcode
+    elif isinstance(error, requests.HTTPError):
+        if error.response is None:
+            return True
+        status_code = error.response.status_code
+    elif isinstance(error, (IOError, httplib.HTTPException)):
+        # Connection errors, timeouts, socket errors...
+        return True
+    else:
+        return False
+    # Jira errors without a status code are raised for connection errors.
+    return status_code is None or status_code == 429 or status_code >= 500
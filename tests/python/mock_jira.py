@@ -6,6 +6,8 @@
 #
 
 import copy
+import requests
+from jira import JIRAError
 from jira.resources import Project as JiraProject
 from jira.resources import IssueType, Issue, User, Comment, IssueLink
 
@@ -432,6 +434,7 @@ class MockedJira(object):
     A class to mock a Jira connection and methods used by the bridge.
     """
     def __init__(self, *args, **kwargs):
+        self._session = requests.Session()
         self._projects = []
         self._createmeta = {}
         self._issues = {}
@@ -473,6 +476,16 @@ class MockedJira(object):
         """
         return self._projects
 
+    def project(self, id):
+        """
+        Mocked Jira method.
+        Return a :class:`JiraProject`.
+        """
+        for project in self._projects:
+            if project.key == id or project.id == id:
+                return project
+        raise JIRAError(status_code=404, text="No project could be found with key '%s'" % id)
+
     def createmeta(self, *args, **kwargs):
         """
         Mocked Jira method.
@@ -714,7 +727,9 @@ class MockedJira(object):
 
         if startAt == 0:
             return [User(None, None, JIRA_USER_2)] * maxResults
-        return [User(None, None, JIRA_USER)]
+        if startAt == maxResults:
+            return [User(None, None, JIRA_USER)]
+        return []
 
     def user(self, id):
         """
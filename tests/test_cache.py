@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 Autodesk, Inc.  All rights reserved.
+#
+# Use of this software is subject to the terms of the Autodesk license agreement
+# provided at the time of installation or download, or which otherwise accompanies
+# this software in either electronic or hard copy form.
+#
+
+import mock
+
+from test_base import TestBase
+from sg_jira.cache import TTLCache
+
+
+class TestCache(TestBase):
+    """
+    Test the caching utilities.
+    """
+
+    @mock.patch("time.time")
+    def test_ttl(self, mocked_time):
+        """
+        Test entries expire.
+        """
+        mocked_time.return_value = 100
+        cache = TTLCache(10)
+        cache.set("foo", "blah")
+        cache.set("bar", None, ttl=1)
+        self.assertEqual(cache.get("foo"), "blah")
+        self.assertTrue("bar" in cache)
+        self.assertEqual(cache.get("bar", "missing"), None)
+        self.assertEqual(len(cache), 2)
+        mocked_time.return_value = 101
+        self.assertFalse("bar" in cache)
+        self.assertEqual(cache.get("bar", "missing"), "missing")
+        self.assertEqual(cache.get("foo"), "blah")
+        mocked_time.return_value = 110
+        self.assertIsNone(cache.get("foo"))
+        self.assertEqual(len(cache), 0)
+
+    def test_max_size(self):
+        """
+        Test least recently used entries are discarded.
+        """
+        cache = TTLCache(10, max_size=2)
+        cache.set("foo", 1)
+        cache.set("bar", 2)
+        # Flag foo as the most recently used
+        self.assertEqual(cache.get("foo"), 1)
+        cache.set("blah", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertFalse("bar" in cache)
+        self.assertEqual(cache.get("foo"), 1)
+        self.assertEqual(cache.get("blah"), 3)
+
+    def test_invalidate(self):
+        """
+        Test discarding entries.
+        """
+        cache = TTLCache(10)
+        cache.set("foo", 1)
+        cache.set("bar", 2)
+        cache.invalidate("foo")
+        cache.invalidate("unknown")
+        self.assertFalse("foo" in cache)
+        self.assertTrue("bar" in cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
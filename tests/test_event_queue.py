@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 Autodesk, Inc.  All rights reserved.
+#
+# Use of this software is subject to the terms of the Autodesk license agreement
+# provided at the time of installation or download, or which otherwise accompanies
+# this software in either electronic or hard copy form.
+#
+
+import os
+import shutil
+import tempfile
+import threading
+
+from test_base import TestBase
+import sg_jira
+
+UNICODE_STRING = u"unicode_îéö_😀"
+
+
+class TestEventQueue(TestBase):
+    """
+    Test the persistent event queue.
+    """
+    def setUp(self):
+        super(TestEventQueue, self).setUp()
+        self._tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._tmp_dir)
+        self._queue_file = os.path.join(self._tmp_dir, "events.db")
+
+    def test_order(self):
+        """
+        Test events are retrieved in the order they were added.
+        """
+        queue = sg_jira.EventQueue()
+        for i in range(5):
+            queue.put({"id": i, "name": UNICODE_STRING})
+        self.assertEqual(len(queue), 5)
+        for i in range(5):
+            event_id, event = queue.get()
+            self.assertEqual(event, {"id": i, "name": UNICODE_STRING})
+            queue.ack(event_id)
+        self.assertEqual(len(queue), 0)
+        # Nothing available
+        self.assertIsNone(queue.get(timeout=0.01))
+        queue.close()
+
+    def test_replay(self):
+        """
+        Test events which were not acknowledged are replayed.
+        """
+        queue = sg_jira.EventQueue(self._queue_file)
+        for i in range(3):
+            queue.put({"id": i})
+        event_id, event = queue.get()
+        self.assertEqual(event, {"id": 0})
+        queue.ack(event_id)
+        # Retrieved but not acknowledged
+        event_id, event = queue.get()
+        self.assertEqual(event, {"id": 1})
+        queue.close()
+        queue = sg_jira.EventQueue(self._queue_file)
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.get()[1], {"id": 1})
+        self.assertEqual(queue.get()[1], {"id": 2})
+        queue.close()
+
+    def test_close(self):
+        """
+        Test closing a queue wakes up waiting threads.
+        """
+        queue = sg_jira.EventQueue(self._queue_file)
+        results = []
+        getter = threading.Thread(target=lambda: results.append(queue.get()))
+        getter.start()
+        queue.close()
+        getter.join(5)
+        self.assertFalse(getter.is_alive())
+        self.assertEqual(results, [None])
+        self.assertRaisesRegexp(
+            RuntimeError,
+            "Can't add events to a closed queue",
+            queue.put,
+            {"id": 1},
+        )
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 Autodesk, Inc.  All rights reserved.
+#
+# Use of this software is subject to the terms of the Autodesk license agreement
+# provided at the time of installation or download, or which otherwise accompanies
+# this software in either electronic or hard copy form.
+#
+
+import io
+
+import mock
+import requests
+
+from test_base import TestBase
+from sg_jira.rate_limit import TokenBucket, RateLimitedAdapter, get_retry_after
+
+
+class FakedClock(object):
+    """
+    A clock whose time only advances when sleeping.
+    """
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class TestRateLimit(TestBase):
+    """
+    Test the rate limiting utilities.
+    """
+    def setUp(self):
+        super(TestRateLimit, self).setUp()
+        self._clock = FakedClock()
+        for name in ["time", "sleep"]:
+            patcher = mock.patch("time.%s" % name, side_effect=getattr(self._clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _get_response(self, status_code, retry_after=None):
+        """
+        Return a response with the given status code and Retry-After header.
+        """
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = "https://jira.faked.com/rest/api/2/issue"
+        response.raw = io.BytesIO(b"")
+        if retry_after is not None:
+            response.headers["Retry-After"] = retry_after
+        return response
+
+    def test_token_bucket(self):
+        """
+        Test tokens are delivered at the expected rate.
+        """
+        self.assertRaises(ValueError, TokenBucket, 0)
+        self.assertRaises(ValueError, TokenBucket, 1, burst=0)
+        bucket = TokenBucket(2, burst=3)
+        # The burst is available right away.
+        for i in range(3):
+            self.assertEqual(bucket.acquire(), 0)
+        self.assertEqual(self._clock.sleeps, [])
+        # Then tokens are delivered at the bucket rate.
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        # Tokens are accumulated up to the burst size.
+        self._clock.now += 10
+        for i in range(3):
+            self.assertEqual(bucket.acquire(), 0)
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        # Nothing is delivered while paused.
+        bucket.pause(5)
+        self.assertAlmostEqual(bucket.acquire(), 5.5)
+
+    def test_retry_after(self):
+        """
+        Test Retry-After headers are correctly parsed.
+        """
+        self.assertIsNone(get_retry_after(self._get_response(429)))
+        self.assertEqual(get_retry_after(self._get_response(429, "12")), 12)
+        self.assertIsNone(get_retry_after(self._get_response(429, "soon")))
+        # 1000 seconds after the epoch.
+        self.assertEqual(
+            get_retry_after(self._get_response(429, "Thu, 01 Jan 1970 00:16:40 GMT")),
+            0,
+        )
+        self.assertEqual(
+            get_retry_after(self._get_response(429, "Thu, 01 Jan 1970 00:17:10 GMT")),
+            30,
+        )
+
+    @mock.patch("requests.adapters.HTTPAdapter.send", autospec=True)
+    def test_adapter_retries(self, mocked_send):
+        """
+        Test requests rejected with a 429 error are retried.
+        """
+        request = requests.Request(
+            "GET", "https://jira.faked.com/rest/api/2/issue"
+        ).prepare()
+        adapter = RateLimitedAdapter()
+        mocked_send.side_effect = [
+            self._get_response(429, "3"),
+            self._get_response(429),
+            self._get_response(200),
+        ]
+        response = adapter.send(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mocked_send.call_count, 3)
+        # Retry-After is honored, with an exponential backoff if not set.
+        self.assertEqual(self._clock.sleeps, [3, 2])
+        # The last 429 error is returned when running out of retries.
+        adapter = RateLimitedAdapter(max_retries_on_429=1)
+        mocked_send.reset_mock()
+        self._clock.sleeps = []
+        mocked_send.side_effect = [
+            self._get_response(429, "1000"),
+            self._get_response(429, "1"),
+            self._get_response(200),
+        ]
+        response = adapter.send(request)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(mocked_send.call_count, 2)
+        # Delays are capped.
+        self.assertEqual(self._clock.sleeps, [60])
+
+    @mock.patch("requests.adapters.HTTPAdapter.send", autospec=True)
+    def test_adapter_rate_limit(self, mocked_send):
+        """
+        Test requests are rate limited and held after a 429 error.
+        """
+        request = requests.Request(
+            "GET", "https://jira.faked.com/rest/api/2/issue"
+        ).prepare()
+        adapter = RateLimitedAdapter(rate_limit=4, burst=1)
+        mocked_send.side_effect = lambda *args, **kwargs: self._get_response(200)
+        for i in range(3):
+            adapter.send(request)
+        self.assertEqual(self._clock.sleeps, [0.25, 0.25])
+        self._clock.sleeps = []
+        mocked_send.side_effect = [
+            self._get_response(429, "2"),
+            self._get_response(200),
+        ]
+        adapter.send(request)
+        self.assertEqual(mocked_send.call_count, 5)
+        # Requests resume at the bucket rate after the Retry-After delay.
+        self.assertEqual(self._clock.sleeps, [0.25, 2, 0.25])
@@ -8,12 +8,18 @@
 #
 
 import os
+import httplib
+import socket
 import StringIO
 import json
 import mock
 import logging
+import threading
+import time
+import requests
 
 from test_base import TestBase
+from test_sync_base import TestSyncBase
 import webapp
 
 # Raw POST request template
@@ -36,6 +42,11 @@ class MockServer(object):
     """
     Mock some of the web server methods.
     """
+    is_asynchronous = False
+    # Close connections after each request.
+    idle_timeout = 0
+    has_pending_requests = False
+
     @property
     def sync_settings_names(self):
         return ["valid", UNICODE_STRING]
@@ -46,6 +57,9 @@ class MockServer(object):
     def sync_in_shotgun(self, *args, **kwargs):
         return True
 
+    def clear_caches(self):
+        pass
+
 
 class MockRequest(object):
     """
@@ -131,7 +145,7 @@ class TestRouting(TestBase):
             server
         )
         raw_response = handler.wfile.getvalue()
-        self.assertTrue("HTTP/1.0 200" in raw_response)
+        self.assertTrue("HTTP/1.1 200" in raw_response)
         self.assertTrue("<p>Syncing with valid settings.</p>" in raw_response)
         # POST request with invalid payload
         handler = webapp.RequestHandler(
@@ -176,7 +190,7 @@ class TestRouting(TestBase):
             server
         )
         raw_response = handler.wfile.getvalue()
-        self.assertTrue("HTTP/1.0 200" in raw_response)
+        self.assertTrue("HTTP/1.1 200" in raw_response)
         self.assertTrue("<p>Syncing with valid settings.</p>" in raw_response)
         # POST request with invalid path: a resource type and key must be provided
         handler = webapp.RequestHandler(
@@ -210,7 +224,7 @@ class TestRouting(TestBase):
             server
         )
         raw_response = handler.wfile.getvalue()
-        self.assertTrue("HTTP/1.0 200" in raw_response)
+        self.assertTrue("HTTP/1.1 200" in raw_response)
         self.assertTrue(
             ("<p>Syncing with %s settings.</p>" % UNICODE_STRING) in raw_response
         )
@@ -221,3 +235,489 @@ class TestRouting(TestBase):
         )
         raw_response = handler.wfile.getvalue()
         self.assertTrue("200 POST request successful" in raw_response)
+
+    def test_admin_route(self, mocked_finish, mocked_jira, mocked_sg):
+        """
+        Test administration requests.
+        """
+        server = MockServer()
+        with mock.patch.object(server, "clear_caches") as mocked_clear:
+            handler = webapp.RequestHandler(
+                MockRequest("/admin/clear_caches", {"foo": "blah"}),
+                ("localhost", -1),
+                server
+            )
+            raw_response = handler.wfile.getvalue()
+            self.assertTrue("200 Caches cleared" in raw_response)
+            mocked_clear.assert_called_once_with()
+            handler = webapp.RequestHandler(
+                MockRequest("/admin/foo", {"foo": "blah"}),
+                ("localhost", -1),
+                server
+            )
+            raw_response = handler.wfile.getvalue()
+            self.assertTrue("400 Invalid admin request /admin/foo" in raw_response)
+            mocked_clear.assert_called_once_with()
+
+    def test_async_route(self, mocked_finish, mocked_jira, mocked_sg):
+        """
+        Test events are queued in asynchronous mode.
+        """
+        server = MockServer()
+        server.is_asynchronous = True
+        server.queue_event = mock.Mock()
+        # POST request with an invalid settings name
+        handler = webapp.RequestHandler(
+            MockRequest("/jira2sg/default/issue/BLAH", {"foo": "blah"}),
+            ("localhost", -1),
+            server
+        )
+        raw_response = handler.wfile.getvalue()
+        self.assertTrue("400 Invalid settings name default" in raw_response)
+        server.queue_event.assert_not_called()
+        # POST request with an invalid Shotgun id
+        handler = webapp.RequestHandler(
+            MockRequest("/sg2jira/valid/Task/foo", {"foo": "blah"}),
+            ("localhost", -1),
+            server
+        )
+        raw_response = handler.wfile.getvalue()
+        self.assertTrue("Invalid Shotgun Task id foo" in raw_response)
+        server.queue_event.assert_not_called()
+        handler = webapp.RequestHandler(
+            MockRequest("/jira2sg/valid/issue/BLAH", {"foo": "blah"}),
+            ("localhost", -1),
+            server
+        )
+        raw_response = handler.wfile.getvalue()
+        self.assertTrue("202 POST request accepted" in raw_response)
+        server.queue_event.assert_called_once_with(
+            "jira2sg", "valid", "issue", "BLAH", {"foo": "blah"}, {}
+        )
+
+
+@mock.patch("shotgun_api3.Shotgun")
+class TestServer(TestSyncBase):
+    """
+    Test the web server request processing.
+    """
+    def setUp(self):
+        super(TestServer, self).setUp()
+        logging.getLogger("webapp").setLevel(logging.WARNING)
+
+    def _start_server(self, mocked_sg, **kwargs):
+        """
+        Start a server on a free port with a bridge using a mocked Shotgun.
+
+        :returns: A tuple with the server url and its bridge.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        with mock.patch("sg_jira.Bridge.get_bridge", return_value=bridge):
+            server = webapp.Server(
+                "settings.py",
+                ("localhost", 0),
+                webapp.RequestHandler,
+                **kwargs
+            )
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        def stop_server():
+            server.shutdown()
+            server.server_close()
+        self.addCleanup(stop_server)
+        self._server = server
+        return "http://localhost:%d" % server.server_address[1], bridge
+
+    def _post(self, url, results):
+        """
+        Post an empty Jira event to the given url and store the response status
+        code in the given list.
+        """
+        results.append(requests.post(url, json={}).status_code)
+
+    def _acquire(self, semaphore, timeout):
+        """
+        Acquire the given semaphore with a timeout.
+
+        :returns: `True` if the semaphore was acquired, `False` otherwise.
+        """
+        end = time.time() + timeout
+        while time.time() < end:
+            if semaphore.acquire(False):
+                return True
+            time.sleep(0.01)
+        return False
+
+    def patch_bridge(self, bridge, method_name, side_effect):
+        """
+        Patch the given bridge method with a mock using the given side effect.
+
+        :returns: The mock.
+        """
+        patcher = mock.patch.object(bridge, method_name, side_effect=side_effect)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_concurrent_requests(self, mocked_sg):
+        """
+        Test requests are processed concurrently.
+        """
+        url, bridge = self._start_server(mocked_sg, max_threads=2)
+        in_sync = threading.Semaphore(0)
+        proceed = threading.Event()
+
+        def sync_in_shotgun(*args, **kwargs):
+            in_sync.release()
+            # Block until all requests are being processed.
+            proceed.wait(5)
+            return True
+        self.patch_bridge(bridge, "sync_in_shotgun", sync_in_shotgun)
+
+        results = []
+        posts = [
+            threading.Thread(
+                target=self._post,
+                args=("%s/jira2sg/task_issue/issue/KEY-%d" % (url, i), results)
+            ) for i in range(2)
+        ]
+        for post in posts:
+            post.start()
+        # Both requests must be in the bridge at the same time.
+        for post in posts:
+            self.assertTrue(self._acquire(in_sync, 5))
+        proceed.set()
+        for post in posts:
+            post.join(5)
+        self.assertEqual(results, [200, 200])
+
+    def test_ordered_requests(self, mocked_sg):
+        """
+        Test concurrent requests for the same resource are processed in order.
+        """
+        url, bridge = self._start_server(mocked_sg, max_threads=4)
+        in_sync = threading.Semaphore(0)
+        proceed = threading.Event()
+        synced = []
+
+        def sync_in_shotgun(settings_name, resource_type, resource_id, event, **kwargs):
+            in_sync.release()
+            proceed.wait(5)
+            synced.append((resource_id, event["order"]))
+            return True
+        self.patch_bridge(bridge, "sync_in_shotgun", sync_in_shotgun)
+
+        posts = []
+        for i in range(3):
+            post = threading.Thread(
+                target=requests.post,
+                args=("%s/jira2sg/task_issue/issue/KEY-1" % url,),
+                kwargs={"json": {"order": i}},
+            )
+            post.start()
+            posts.append(post)
+            # Make sure requests are received in order: the first one is being
+            # processed, the others are waiting in the dispatcher.
+            if i == 0:
+                self.assertTrue(self._acquire(in_sync, 5))
+            else:
+                time.sleep(0.1)
+        # Only the first request is being processed
+        self.assertFalse(in_sync.acquire(False))
+        proceed.set()
+        for post in posts:
+            post.join(5)
+        self.assertEqual(synced, [("KEY-1", 0), ("KEY-1", 1), ("KEY-1", 2)])
+
+    def test_async_requests(self, mocked_sg):
+        """
+        Test events are processed in the background in asynchronous mode.
+        """
+        url, bridge = self._start_server(mocked_sg, async_workers=1)
+        proceed = threading.Event()
+        synced = threading.Event()
+
+        def sync_in_jira(*args, **kwargs):
+            # Block until the request was answered.
+            proceed.wait(5)
+            synced.set()
+            return True
+        mocked = self.patch_bridge(bridge, "sync_in_jira", sync_in_jira)
+        response = requests.post("%s/sg2jira/task_issue/Task/1" % url, json={"foo": "blah"})
+        self.assertEqual(response.status_code, 202)
+        self.assertFalse(synced.is_set())
+        proceed.set()
+        self.assertTrue(synced.wait(5))
+        mocked.assert_called_once_with(
+            "task_issue", "Task", 1, {"foo": "blah"}
+        )
+
+    def test_async_failures(self, mocked_sg):
+        """
+        Test events which failed with a transient error are kept in the queue.
+        """
+        url, bridge = self._start_server(mocked_sg, async_workers=1)
+        processed = threading.Semaphore(0)
+
+        def sync_in_jira(settings_name, entity_type, entity_id, event, **kwargs):
+            processed.release()
+            if entity_id == 1:
+                raise requests.ConnectionError("Jira is down")
+            raise ValueError("Sorry, I'm bad!")
+        self.patch_bridge(bridge, "sync_in_jira", sync_in_jira)
+        events = self._server._events
+        patcher = mock.patch.object(events, "ack", wraps=events.ack)
+        mocked_ack = patcher.start()
+        self.addCleanup(patcher.stop)
+        for entity_id in [1, 2]:
+            response = requests.post(
+                "%s/sg2jira/task_issue/Task/%d" % (url, entity_id), json={}
+            )
+            self.assertEqual(response.status_code, 202)
+        for i in range(2):
+            self.assertTrue(self._acquire(processed, 5))
+        # Only the event which can't be processed is removed from the queue.
+        end = time.time() + 5
+        while len(events) != 1 and time.time() < end:
+            time.sleep(0.01)
+        self.assertEqual(len(events), 1)
+        mocked_ack.assert_called_once()
+
+    def _raw_post(self, connection, path):
+        """
+        Post an empty Jira event to the given path with the given socket.
+
+        :returns: A :class:`httplib.HTTPResponse` instance, with its content read.
+        """
+        connection.sendall(
+            "POST %s HTTP/1.1\r\nHost: localhost\r\n"
+            "Content-Type: application/json\r\nContent-Length: 2\r\n\r\n{}" % path
+        )
+        response = httplib.HTTPResponse(connection)
+        response.begin()
+        response.read()
+        return response
+
+    def _connect(self, url):
+        """
+        Open a connection to the server with the given url.
+
+        :returns: A connected :class:`socket.socket`.
+        """
+        connection = socket.create_connection(
+            ("localhost", int(url.rsplit(":", 1)[1])), timeout=5
+        )
+        self.addCleanup(connection.close)
+        return connection
+
+    def test_persistent_connections(self, mocked_sg):
+        """
+        Test connections are kept open between requests until they are idle.
+        """
+        url, bridge = self._start_server(mocked_sg, idle_timeout=0.5)
+        self.patch_bridge(bridge, "sync_in_shotgun", lambda *args, **kwargs: True)
+        connection = self._connect(url)
+        for i in range(3):
+            response = self._raw_post(connection, "/jira2sg/task_issue/issue/KEY-%d" % i)
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.version, 11)
+            self.assertEqual(response.getheader("content-length"), "0")
+        # Requests with an unread body are handled too.
+        response = self._raw_post(connection, "/admin/clear_caches")
+        self.assertEqual(response.status, 200)
+        # The connection is closed when idle.
+        start = time.time()
+        self.assertEqual(connection.recv(1), "")
+        self.assertLess(time.time() - start, 5)
+
+    def test_idle_connections(self, mocked_sg):
+        """
+        Test idle connections don't block other connections.
+        """
+        url, bridge = self._start_server(mocked_sg, idle_timeout=30)
+        self.patch_bridge(bridge, "sync_in_shotgun", lambda *args, **kwargs: True)
+        idle = self._connect(url)
+        response = self._raw_post(idle, "/jira2sg/task_issue/issue/KEY-1")
+        self.assertEqual(response.status, 200)
+        # The single worker thread is released for the new connection.
+        start = time.time()
+        response = self._raw_post(self._connect(url), "/jira2sg/task_issue/issue/KEY-2")
+        self.assertEqual(response.status, 200)
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(idle.recv(1), "")
+
+    def test_request_bodies(self, mocked_sg):
+        """
+        Test chunked request bodies are decoded and pipelined requests are
+        handled.
+        """
+        url, bridge = self._start_server(mocked_sg, idle_timeout=30)
+        events = []
+        self.patch_bridge(
+            bridge,
+            "sync_in_shotgun",
+            lambda *args, **kwargs: events.append(args[3]) or True
+        )
+        connection = self._connect(url)
+        connection.sendall(
+            "POST /jira2sg/task_issue/issue/KEY-1 HTTP/1.1\r\nHost: localhost\r\n"
+            "Content-Type: application/json\r\nTransfer-Encoding: chunked\r\n\r\n"
+            "5;foo=bar\r\n{\"a\":\r\n3\r\n 1}\r\n0\r\nX-Trailer: 1\r\n\r\n"
+            "POST /jira2sg/task_issue/issue/KEY-2 HTTP/1.1\r\nHost: localhost\r\n"
+            "Content-Type: application/json\r\nContent-Length: 8\r\n\r\n{\"b\": 2}"
+        )
+        for i in range(2):
+            response = httplib.HTTPResponse(connection)
+            response.begin()
+            response.read()
+            self.assertEqual(response.status, 200)
+        self.assertEqual(events, [{"a": 1}, {"b": 2}])
+        # Bodies which can't be read are rejected and the connection closed.
+        connection.sendall(
+            "POST /jira2sg/task_issue/issue/KEY-3 HTTP/1.1\r\nHost: localhost\r\n"
+            "Content-Type: application/json\r\nTransfer-Encoding: gzip\r\n\r\n"
+        )
+        response = httplib.HTTPResponse(connection)
+        response.begin()
+        response.read()
+        self.assertEqual(response.status, 411)
+        self.assertEqual(response.getheader("connection"), "close")
+        self.assertEqual(connection.recv(1), "")
+        self.assertEqual(len(events), 2)
+
+    def test_no_persistent_connections(self, mocked_sg):
+        """
+        Test connections are closed after each request if there is no idle
+        timeout.
+        """
+        url, bridge = self._start_server(mocked_sg, idle_timeout=0)
+        self.patch_bridge(bridge, "sync_in_shotgun", lambda *args, **kwargs: True)
+        connection = self._connect(url)
+        response = self._raw_post(connection, "/jira2sg/task_issue/issue/KEY-1")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("connection"), "close")
+        self.assertEqual(connection.recv(1), "")
+
+    def test_batch_requests(self, mocked_sg):
+        """
+        Test batches of events are processed with a result for each event.
+        """
+        url, bridge = self._start_server(mocked_sg, max_threads=2)
+
+        def sync_in_jira(settings_name, entity_type, entity_id, event, **kwargs):
+            if event.get("fail"):
+                raise RuntimeError("Sorry, I failed!")
+            if event.get("unavailable"):
+                raise IOError("Jira is down")
+            return True
+        mocked_jira = self.patch_bridge(bridge, "sync_in_jira", sync_in_jira)
+        mocked_shotgun = self.patch_bridge(
+            bridge, "sync_in_shotgun", lambda *args, **kwargs: True
+        )
+        events = [
+            {"entity_type": "Task", "entity_id": 1},
+            {"entity_type": "Task", "entity_id": "2", "fail": True},
+            {"entity_type": "Task", "entity_id": "foo"},
+            {"foo": "blah"},
+            "blah",
+        ]
+        response = requests.post("%s/sg2jira/task_issue/batch" % url, json=events)
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([result["status"] for result in results], [200, 422, 400, 400, 400])
+        self.assertEqual(results[1]["error"], "Sorry, I failed!")
+        self.assertEqual(results[2]["error"], "Invalid Shotgun Task id foo, it must be a number.")
+        self.assertEqual(mocked_jira.call_count, 2)
+        mocked_jira.assert_any_call("task_issue", "Task", 1, events[0])
+        # Transient errors are reported with a status allowing retries.
+        response = requests.post(
+            "%s/sg2jira/task_issue/batch" % url,
+            json=[{"entity_type": "Task", "entity_id": 3, "unavailable": True}],
+        )
+        self.assertEqual(response.json()["results"], [
+            {"status": 503, "error": "Jira is down"}
+        ])
+        # Newline delimited JSON
+        response = requests.post(
+            "%s/jira2sg/task_issue/batch" % url,
+            data="\n".join([
+                json.dumps({"entity_type": "issue", "entity_key": "KEY-1"}),
+                "",
+                json.dumps({"foo": "blah"}),
+            ]),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["status"] for result in response.json()["results"]], [200, 400]
+        )
+        mocked_shotgun.assert_called_once_with(
+            "task_issue", "issue", "KEY-1", {"entity_type": "issue", "entity_key": "KEY-1"}
+        )
+        # Invalid batches
+        response = requests.post("%s/sg2jira/task_issue/batch" % url, json={"foo": "blah"})
+        self.assertEqual(response.status_code, 400)
+        response = requests.post("%s/sg2jira/foo/batch" % url, json=events)
+        self.assertEqual(response.status_code, 400)
+        response = requests.post("%s/foo/task_issue/batch" % url, json=events)
+        self.assertEqual(response.status_code, 400)
+
+    def test_async_batch_requests(self, mocked_sg):
+        """
+        Test batches of events are queued in asynchronous mode.
+        """
+        url, bridge = self._start_server(mocked_sg, async_workers=1)
+        synced = threading.Semaphore(0)
+
+        def sync_in_jira(*args, **kwargs):
+            synced.release()
+            return True
+        mocked = self.patch_bridge(bridge, "sync_in_jira", sync_in_jira)
+        response = requests.post(
+            "%s/sg2jira/task_issue/batch" % url,
+            json=[
+                {"entity_type": "Task", "entity_id": 1},
+                {"entity_type": "Task"},
+                {"entity_type": "Task", "entity_id": 2},
+            ]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["status"] for result in response.json()["results"]], [202, 400, 202]
+        )
+        for i in range(2):
+            self.assertTrue(self._acquire(synced, 5))
+        self.assertEqual(
+            [call[0][2] for call in mocked.call_args_list], [1, 2]
+        )
+
+    def test_manifest(self, mocked_sg):
+        """
+        Test retrieving the manifest of a syncer.
+        """
+        url, bridge = self._start_server(mocked_sg)
+        response = requests.get("%s/sg2jira/task_issue/manifest" % url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(response.json(), bridge.get_manifest("task_issue"))
+        # Errors are reported.
+        response = requests.get("%s/sg2jira/unknown/manifest" % url)
+        self.assertEqual(response.status_code, 400)
+        self.patch_bridge(bridge, "get_manifest", RuntimeError("Faked"))
+        response = requests.get("%s/sg2jira/task_issue/manifest" % url)
+        self.assertEqual(response.status_code, 500)
+
+    def test_invalid_max_threads(self, mocked_sg):
+        """
+        Test an invalid number of threads is rejected.
+        """
+        self.assertRaisesRegexp(
+            ValueError,
+            "Invalid maximum number of threads",
+            webapp.Server,
+            "settings.py",
+            ("localhost", 0),
+            webapp.RequestHandler,
+            max_threads=0,
+        )
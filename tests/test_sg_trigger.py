@@ -1,3 +1,5 @@
+# -*- coding: utf-8 -*-
+
 # Copyright 2018 Autodesk, Inc.  All rights reserved.
 #
 # Use of this software is subject to the terms of the Autodesk license agreement
@@ -6,6 +8,11 @@
 #
 
 import os
+import shutil
+import tempfile
+import threading
+import time
+import json as _json
 import logging
 import datetime
 import requests
@@ -47,14 +54,27 @@ EVENT = {
 }
 
 
-def mocked_requests_post(*args, **kwargs):
+def mocked_requests_post(url, json=None, **kwargs):
+    """
+    Mock requests.Session.post made by the trigger and return a Response with
+    the url and a successful result for each event.
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response._content = _json.dumps({"results": [{"status": 200}] * len(json)})
+    return response
+
+
+def mocked_requests_get(url, shotgun_fields):
     """
-    Mock requests.post made the trigger and return a Response with the url
-    and the payload.
+    Return a Response for a requests.Session.get made by the trigger, with a
+    manifest accepting the given Shotgun fields.
     """
     response = requests.Response()
-    response.url = args[0]
-    response._contents = kwargs
+    response.url = url
+    response.status_code = 200
+    response._content = _json.dumps({"shotgun_fields": shotgun_fields})
     return response
 
 
@@ -64,6 +84,42 @@ class TestSGTrigger(TestBase):
     """
     def setUp(self):
         logging.basicConfig(format="%(levelname)s:%(name)s:%(message)s")
+        # Use a new sender for each test.
+        self.addCleanup(self._close_event_sender)
+        self._spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._spool_dir)
+        patcher = mock.patch.dict(
+            os.environ, {"SGDAEMON_SGJIRA_SPOOL_DIR": self._spool_dir}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Bridges accept all events unless a test publishes another manifest.
+        patcher = mock.patch(
+            "requests.Session.get",
+            side_effect=lambda url, **kwargs: mocked_requests_get(url, None),
+        )
+        self._mocked_get = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Use a new manifest cache for each test.
+        self.addCleanup(self._reset_manifest_cache)
+
+    def _reset_manifest_cache(self):
+        """
+        Wait for manifests being retrieved by the trigger, if any, and reset
+        its manifest cache.
+        """
+        for thread in threading.enumerate():
+            if thread.name == "sg_jira_manifest":
+                thread.join(5)
+        sg_jira_event_trigger._manifest_cache = None
+
+    def _close_event_sender(self):
+        """
+        Close the sender used by the trigger, if any, and reset it.
+        """
+        if sg_jira_event_trigger._event_sender:
+            sg_jira_event_trigger._event_sender.close(5)
+            sg_jira_event_trigger._event_sender = None
 
     def test_project_sync_url_base_schema(self):
         """
@@ -97,7 +153,7 @@ class TestSGTrigger(TestBase):
         )
         self.assertTrue(PROJECT["id"] in routing)
 
-    @mock.patch("requests.post", side_effect=mocked_requests_post)
+    @mock.patch("requests.Session.post", side_effect=mocked_requests_post)
     def test_project_sync_url(self, mocked):
         """
         Test retrieving the dispatch url for a Project.
@@ -143,8 +199,10 @@ class TestSGTrigger(TestBase):
         )
         self.assertTrue(PROJECT["id"] in routing)
         self.assertTrue(routing[PROJECT["id"]].startswith(url))
+        self.assertTrue(sg_jira_event_trigger.get_event_sender(logger).flush(5))
         mocked.assert_called_once()
         self.assertTrue(mocked.call_args[0][0].startswith(url))
+        self.assertTrue(mocked.call_args[0][0].endswith("/batch"))
         # Check the trigger clears its routing cache if the sync url is changed
         project_event = {
             "event_type": "Shotgun_Project_Change",
@@ -185,5 +243,235 @@ class TestSGTrigger(TestBase):
         )
         self.assertTrue(PROJECT["id"] in routing)
         self.assertTrue(routing[PROJECT["id"]].startswith(url))
+        self.assertTrue(sg_jira_event_trigger.get_event_sender(logger).flush(5))
         mocked.assert_called()
         self.assertTrue(mocked.call_args[0][0].startswith(url))
+
+    @mock.patch("requests.Session.post", side_effect=mocked_requests_post)
+    def test_batched_events(self, mocked):
+        """
+        Test events are posted in batches, in order.
+        """
+        sender = sg_jira_event_trigger.EventSender(logger, batch_size=2, batch_delay=60)
+        for i in range(2):
+            sender.send("http://localhost/sg2jira/default", {"id": i})
+        sender.send("http://other/sg2jira/default", {"id": 10})
+        # Full batches are posted right away.
+        for i in range(50):
+            if mocked.called:
+                break
+            time.sleep(0.1)
+        mocked.assert_called_once()
+        self.assertEqual(mocked.call_args[0][0], "http://localhost/sg2jira/default/batch")
+        self.assertEqual(mocked.call_args[1]["json"], [{"id": 0}, {"id": 1}])
+        for i in range(2, 5):
+            sender.send("http://localhost/sg2jira/default", {"id": i})
+        self.assertTrue(sender.flush(5))
+        batches = dict()
+        for call in mocked.call_args_list:
+            batches.setdefault(call[0][0], []).append(
+                [event["id"] for event in call[1]["json"]]
+            )
+        self.assertEqual(
+            batches,
+            {
+                "http://localhost/sg2jira/default/batch": [[0, 1], [2, 3], [4]],
+                "http://other/sg2jira/default/batch": [[10]],
+            }
+        )
+        sender.close(5)
+        # Pending events are posted after the batch delay.
+        sender = sg_jira_event_trigger.EventSender(logger, batch_delay=0.1)
+        sender.send("http://localhost/sg2jira/default", {"id": 5})
+        for i in range(50):
+            if mocked.call_count == 5:
+                break
+            time.sleep(0.1)
+        self.assertEqual(mocked.call_count, 5)
+        self.assertEqual(mocked.call_args[1]["json"], [{"id": 5}])
+        sender.close(5)
+        self.assertRaises(
+            RuntimeError, sender.send, "http://localhost/sg2jira/default", {"id": 6}
+        )
+
+    def _wait_for(self, predicate, timeout=5):
+        """
+        Wait for the given callable to return `True`.
+
+        :returns: `True` if it did before the timeout, `False` otherwise.
+        """
+        end = time.time() + timeout
+        while time.time() < end:
+            if predicate():
+                return True
+            time.sleep(0.05)
+        return False
+
+    @mock.patch.object(sg_jira_event_trigger, "SPOOL_RETRY_DELAY", 0.1)
+    @mock.patch("requests.Session.post")
+    def test_spooled_events(self, mocked):
+        """
+        Test events which can't be posted are spooled and posted again in order.
+        """
+        sync_url = "http://localhost/sg2jira/default"
+        mocked.side_effect = requests.ConnectionError("Bridge is down")
+        sender = sg_jira_event_trigger.EventSender(
+            logger, batch_size=2, batch_delay=60, spool_dir=self._spool_dir
+        )
+        for i in range(3):
+            sender.send(sync_url, {"id": i})
+        self.assertTrue(sender.flush(5))
+        # Events sent while events are spooled are spooled after them.
+        sender.send(sync_url, {"id": 3})
+        self.assertTrue(sender.flush(5))
+        sender.close(5)
+        spool = sg_jira_event_trigger.EventSpool(self._spool_dir, logger)
+        self.assertEqual(spool.get_sync_urls(), [sync_url])
+        events, _ = spool.read(sync_url, 10)
+        self.assertEqual(events, [{"id": 0}, {"id": 1}, {"id": 2}, {"id": 3}])
+        # Spooled events are posted by a new sender once the bridge is back,
+        # after failures.
+        mocked.reset_mock()
+        mocked.side_effect = [
+            requests.ConnectionError("Bridge is still down"),
+        ] + [mocked_requests_post(sync_url, json=[{}] * 2)] * 2 + [
+            mocked_requests_post(sync_url, json=[{}]),
+        ]
+        sender = sg_jira_event_trigger.EventSender(
+            logger, batch_size=2, batch_delay=0.1, spool_dir=self._spool_dir
+        )
+        self.assertTrue(self._wait_for(lambda: not spool.has_events(sync_url)))
+        self.assertEqual(
+            [[event["id"] for event in call[1]["json"]] for call in mocked.call_args_list],
+            [[0, 1], [0, 1], [2, 3]],
+        )
+        self.assertEqual(os.listdir(self._spool_dir), [])
+        # New events are posted directly once all spooled events were posted.
+        sender.send(sync_url, {"id": 4})
+        self.assertTrue(sender.flush(5))
+        self.assertEqual(mocked.call_args[1]["json"], [{"id": 4}])
+        sender.close(5)
+
+    @mock.patch.object(sg_jira_event_trigger, "SPOOL_RETRY_DELAY", 0.1)
+    @mock.patch("requests.Session.post")
+    def test_retried_events(self, mocked):
+        """
+        Test events the bridge failed to process because of a transient error
+        are spooled, with the events following them, and posted again in order.
+        """
+        sync_url = "http://localhost/sg2jira/default"
+
+        def post_results(statuses):
+            response = mocked_requests_post(sync_url, json=[])
+            response._content = _json.dumps({
+                "results": [{"status": status} for status in statuses]
+            })
+            return response
+
+        mocked.side_effect = [
+            post_results([200, 422, 503, 200]),
+            post_results([200, 429]),
+            post_results([200]),
+        ]
+        sender = sg_jira_event_trigger.EventSender(
+            logger, batch_size=4, batch_delay=60, spool_dir=self._spool_dir
+        )
+        for i in range(4):
+            sender.send(sync_url, {"id": i})
+        self.assertTrue(sender.flush(5))
+        spool = sg_jira_event_trigger.EventSpool(self._spool_dir, logger)
+        self.assertTrue(self._wait_for(lambda: not spool.has_events(sync_url)))
+        sender.close(5)
+        self.assertEqual(
+            [[event["id"] for event in call[1]["json"]] for call in mocked.call_args_list],
+            [[0, 1, 2, 3], [2, 3], [3]],
+        )
+        self.assertEqual(os.listdir(self._spool_dir), [])
+
+    @mock.patch("requests.Session.post")
+    def test_rejected_events(self, mocked):
+        """
+        Test events rejected by the bridge are not spooled.
+        """
+        response = requests.Response()
+        response.status_code = 400
+        mocked.return_value = response
+        sender = sg_jira_event_trigger.EventSender(
+            logger, spool_dir=self._spool_dir
+        )
+        sender.send("http://localhost/sg2jira/default", {"id": 1})
+        self.assertTrue(sender.flush(5))
+        sender.close(5)
+        mocked.assert_called_once()
+        self.assertEqual(os.listdir(self._spool_dir), [])
+
+    def test_spool_file(self):
+        """
+        Test reading events from a spool file.
+        """
+        sync_url = u"http://localhost/sg2jira/unicode_😀"
+        spool = sg_jira_event_trigger.EventSpool(
+            os.path.join(self._spool_dir, "spool"), logger
+        )
+        self.assertFalse(spool.has_events(sync_url))
+        spool.append(sync_url, [{"id": i} for i in range(3)])
+        self.assertTrue(spool.has_events(sync_url))
+        events, offset = spool.read(sync_url, 2)
+        self.assertEqual(events, [{"id": 0}, {"id": 1}])
+        # Events are read again until they are acknowledged.
+        self.assertEqual(spool.read(sync_url, 2), (events, offset))
+        spool.ack(sync_url, offset)
+        # Invalid or incomplete events are discarded.
+        path, _ = spool._get_paths(sync_url)
+        with open(path, "ab") as f:
+            f.write("not json\n{\"sync_url\": ")
+        spool.append(sync_url, [{"id": 3}])
+        events, offset = spool.read(sync_url, 10)
+        self.assertEqual(events, [{"id": 2}])
+        spool.ack(sync_url, offset)
+        self.assertFalse(spool.has_events(sync_url))
+        self.assertEqual(spool.get_sync_urls(), [])
+
+    @mock.patch("requests.Session.post", side_effect=mocked_requests_post)
+    def test_manifest(self, mocked):
+        """
+        Test events for fields not accepted by the bridge are discarded.
+        """
+        self.set_sg_mock_schema(os.path.join(
+            os.path.dirname(__file__),
+            "fixtures", "schemas", "sg-jira",
+        ))
+        shotgun = mockgun.Shotgun(
+            "http://unit_test_mock_sg",
+            "mock_user", "mock_key"
+        )
+        sync_url = "http://localhost/sg2jira/default"
+        routing = {PROJECT["id"]: sync_url}
+        self._mocked_get.side_effect = lambda url, **kwargs: mocked_requests_get(
+            url, {"Task": ["sg_status_list"]}
+        )
+        # Events are accepted until the manifest is retrieved.
+        sg_jira_event_trigger.process_event(shotgun, logger, EVENT, routing)
+        self._reset_manifest_cache()
+        self.assertEqual(
+            self._mocked_get.call_args[0][0], "%s/manifest" % sync_url
+        )
+        self.assertTrue(sg_jira_event_trigger.get_event_sender(logger).flush(5))
+        self.assertEqual(mocked.call_count, 1)
+        manifests = sg_jira_event_trigger.get_manifest_cache(logger)
+        manifests.refresh(sync_url)
+        self.assertTrue(manifests.accept_event(sync_url, "Task", "sg_status_list"))
+        self.assertFalse(manifests.accept_event(sync_url, "Task", "content"))
+        self.assertFalse(manifests.accept_event(sync_url, "Note", "content"))
+        sg_jira_event_trigger.process_event(shotgun, logger, EVENT, routing)
+        event = dict(EVENT)
+        event["meta"] = dict(EVENT["meta"], attribute_name="content")
+        sg_jira_event_trigger.process_event(shotgun, logger, event, routing)
+        self.assertTrue(sg_jira_event_trigger.get_event_sender(logger).flush(5))
+        self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(mocked.call_args[1]["json"][0]["meta"], EVENT["meta"])
+        # All events are accepted if the manifest can't be retrieved.
+        self._mocked_get.side_effect = requests.ConnectionError("Bridge is down")
+        manifests.refresh(sync_url)
+        self.assertTrue(manifests.accept_event(sync_url, "Note", "content"))
+        self._reset_manifest_cache()
@@ -7,13 +7,20 @@
 #
 
 import os
+import json
+import shutil
+import tempfile
+import threading
+import time
 import mock
 
 from test_sync_base import TestSyncBase
 from mock_jira import JIRA_PROJECT_KEY, JIRA_PROJECT, JIRA_USER, JIRA_USER_2
+from mock_jira import MockedIssue, MockedJira
 import sg_jira
 from sg_jira.constants import SHOTGUN_JIRA_ID_FIELD, SHOTGUN_SYNC_IN_JIRA_FIELD
 from sg_jira.handlers.note_comment_handler import COMMENT_BODY_TEMPLATE
+from sg_jira.rate_limit import RateLimitedAdapter
 
 # A list of Shotgun Projects
 SG_PROJECTS = [
@@ -332,6 +339,46 @@ class TestJiraSyncer(TestSyncBase):
             }
         )
 
+    def test_warm_up(self, mocked_sg):
+        """
+        Test all syncers are setup when warming up a bridge.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        # Fixture settings include a syncer failing in its setup.
+        self.assertRaisesRegexp(
+            RuntimeError,
+            "Unable to setup syncers for bad_setup: Sorry, I'm bad!",
+            bridge.warm_up,
+        )
+        with mock.patch.object(
+            bridge, "_create_syncer", wraps=bridge._create_syncer
+        ) as mocked_create_syncer:
+            # Valid syncers were setup
+            for name in ["task_issue", "asset_hierarchy", "bad_sg_sync"]:
+                bridge.get_syncer(name)
+            self.assertEqual(mocked_create_syncer.call_count, 0)
+
+    def test_manifest(self, mocked_sg):
+        """
+        Test the Shotgun fields events are accepted for are published in the
+        bridge manifests.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        manifest = bridge.get_manifest("task_issue")
+        self.assertEqual(manifest.keys(), ["shotgun_fields"])
+        shotgun_fields = manifest["shotgun_fields"]
+        self.assertEqual(sorted(shotgun_fields.keys()), ["Note", "Task"])
+        for entity_type, fields in shotgun_fields.iteritems():
+            self.assertEqual(fields, sorted(fields))
+        self.assertIn("sg_status_list", shotgun_fields["Task"])
+        self.assertIn("sg_sync_in_jira", shotgun_fields["Task"])
+        self.assertIn("content", shotgun_fields["Note"])
+        shotgun_fields = bridge.get_manifest("asset_hierarchy")["shotgun_fields"]
+        self.assertEqual(sorted(shotgun_fields.keys()), ["Asset", "Note", "Task"])
+        self.assertIn("sg_status_list", shotgun_fields["Asset"])
+        # Syncers with handlers accepting any field don't restrict events.
+        self.assertIsNone(bridge.get_manifest("bad_sg_sync")["shotgun_fields"])
+
     @mock.patch(
         "sg_jira.Bridge.current_shotgun_user",
         new_callable=mock.PropertyMock
@@ -529,6 +576,8 @@ class TestJiraSyncer(TestSyncBase):
                     "meta": SG_EVENT_META
                 }
             )
+        # Create meta data is cached, so the faked one needs to be cleared
+        bridge.clear_caches()
         # Test valid values in data
         bridge.sync_in_jira(
             "task_issue",
@@ -541,6 +590,582 @@ class TestJiraSyncer(TestSyncBase):
             }
         )
 
+    def test_jira_connection_settings(self, mocked_sg):
+        """
+        Test Jira connection settings are applied.
+        """
+        mocked_sg.return_value = self._get_mocked_sg_handle()
+        with mock.patch.object(
+            MockedJira, "__init__", autospec=True, side_effect=MockedJira.__init__
+        ) as mocked_init:
+            bridge = sg_jira.Bridge(
+                "https://sg.faked.com",
+                "faked",
+                "xxxxxxx",
+                "https://jira.faked.com",
+                "faked",
+                "xxxxxxx",
+                jira_pool_size=20,
+                jira_max_retries=1,
+                jira_read_timeout=30,
+                jira_keep_alive=False,
+                jira_rate_limit=5,
+                jira_rate_limit_retries=2,
+            )
+            kwargs = mocked_init.call_args[1]
+        self.assertEqual(kwargs["max_retries"], 1)
+        self.assertEqual(kwargs["timeout"], (None, 30))
+        adapter = bridge.jira._session.get_adapter("https://jira.faked.com")
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertIsInstance(adapter, RateLimitedAdapter)
+        self.assertIs(adapter, bridge.jira._session.get_adapter("http://jira.faked.com"))
+        self.assertEqual(adapter._bucket._rate, 5)
+        self.assertEqual(adapter._max_retries_on_429, 2)
+        self.assertEqual(bridge.jira._session.headers["Connection"], "close")
+
+    def test_schema_cache(self, mocked_sg):
+        """
+        Test Jira fields and Shotgun schemas are saved to and loaded from a
+        schema cache file.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        schema_cache_file = os.path.join(tmp_dir, "schema_cache.json")
+
+        def get_bridge():
+            mocked_sg.return_value = self._get_mocked_sg_handle()
+            return sg_jira.Bridge(
+                "https://sg.faked.com",
+                "faked",
+                "xxxxxxx",
+                "https://jira.faked.com",
+                "faked",
+                "xxxxxxx",
+                {"task_issue": {"syncer": "sg_jira.TaskIssueSyncer"}},
+                schema_cache_file=schema_cache_file,
+            )
+
+        bridge = get_bridge()
+        self.assertTrue(os.path.exists(schema_cache_file))
+        bridge.get_syncer("task_issue")
+        jira_fields_map = bridge.jira.jira_fields_map
+        field_schemas = bridge.shotgun.field_schemas
+        self.assertIn("Task", field_schemas)
+        # Values are loaded from the snapshot
+        with mock.patch.object(
+            MockedJira, "fields", autospec=True, side_effect=MockedJira.fields
+        ) as mocked_fields:
+            with mock.patch.object(
+                sg_jira.Bridge, "revalidate_schema_cache"
+            ) as mocked_revalidate:
+                bridge = get_bridge()
+                for thread in threading.enumerate():
+                    if thread.name == "sg_jira_schema_cache":
+                        thread.join(5)
+                self.assertEqual(mocked_revalidate.call_count, 1)
+            self.assertEqual(mocked_fields.call_count, 0)
+            self.assertEqual(bridge.jira.jira_fields_map, jira_fields_map)
+            self.assertEqual(
+                sorted(bridge.shotgun.field_schemas.keys()),
+                sorted(field_schemas.keys())
+            )
+            # And revalidated
+            bridge.revalidate_schema_cache()
+            self.assertEqual(mocked_fields.call_count, 1)
+        # Outdated values are replaced
+        with open(schema_cache_file, "r") as f:
+            snapshot = json.load(f)
+        snapshot["jira_fields"]["faked"] = "customfield_faked"
+        with open(schema_cache_file, "w") as f:
+            json.dump(snapshot, f)
+        with mock.patch.object(sg_jira.Bridge, "revalidate_schema_cache"):
+            bridge = get_bridge()
+        self.assertEqual(bridge.jira.get_jira_issue_field_id("faked"), "customfield_faked")
+        bridge.revalidate_schema_cache()
+        self.assertIsNone(bridge.jira.get_jira_issue_field_id("faked"))
+        with open(schema_cache_file, "r") as f:
+            self.assertNotIn("faked", json.load(f)["jira_fields"])
+        # Snapshots for other sites are ignored
+        snapshot["jira_site"] = "https://other.faked.com"
+        with open(schema_cache_file, "w") as f:
+            json.dump(snapshot, f)
+        with mock.patch.object(
+            MockedJira, "fields", autospec=True, side_effect=MockedJira.fields
+        ) as mocked_fields:
+            get_bridge()
+            self.assertEqual(mocked_fields.call_count, 1)
+
+    def test_shotgun_connection_pool(self, mocked_sg):
+        """
+        Test Shotgun connections are not shared between threads.
+        """
+        mocked_sg.side_effect = lambda *args, **kwargs: mock.MagicMock()
+        shotgun = sg_jira.shotgun_session.ShotgunSession(
+            "https://sg.faked.com",
+            "faked",
+            api_key="xxxxxxx",
+            pool_size=2,
+        )
+        shotgun.add_user_agent("sg_jira_sync")
+        self.assertEqual(mocked_sg.call_count, 1)
+        checked_out = threading.Event()
+        release = threading.Event()
+
+        held = []
+
+        def hold_connection():
+            shotgun.set_session_uuid("holder")
+            with shotgun._checkout_connection() as connection:
+                held.append(connection)
+                checked_out.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_connection)
+        holder.start()
+        self.assertTrue(checked_out.wait(5))
+        # A second connection is created for a concurrent call.
+        shotgun.set_session_uuid("caller")
+        shotgun.find("Task", [])
+        self.assertEqual(mocked_sg.call_count, 2)
+        shotgun._connections[1].set_session_uuid.assert_called_once_with("caller")
+        shotgun._connections[1].find.assert_called_once_with("Task", [])
+        # Other Shotgun methods are called on a checked out connection as well.
+        shotgun.summarize("Task", [], [])
+        shotgun._connections[1].summarize.assert_called_once_with("Task", [], [])
+        self.assertFalse(shotgun._connections[0].summarize.called)
+        release.set()
+        holder.join(5)
+        self.assertFalse(holder.is_alive())
+        self.assertIs(held[0], shotgun._connections[0])
+        held[0].set_session_uuid.assert_called_with("holder")
+        # Idle connections are reused.
+        shotgun.find("Task", [])
+        self.assertEqual(mocked_sg.call_count, 2)
+        for connection in shotgun._connections:
+            connection.add_user_agent.assert_called_once_with("sg_jira_sync")
+        self.assertRaisesRegexp(
+            ValueError,
+            "Invalid Shotgun connection pool size -1",
+            sg_jira.shotgun_session.ShotgunSession,
+            "https://sg.faked.com",
+            "faked",
+            api_key="xxxxxxx",
+            pool_size=-1,
+        )
+
+    def test_shotgun_schema_refresh(self, mocked_sg):
+        """
+        Test cached Shotgun schemas are refreshed.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        shotgun = bridge.shotgun
+        self.assertTrue(shotgun.get_field_schema("Task", "content"))
+        with mock.patch.object(
+            shotgun._shotgun,
+            "schema_field_read",
+            wraps=shotgun._shotgun.schema_field_read
+        ) as mocked_schema_field_read:
+            # Only the given field is read again
+            shotgun.refresh_cached_field_schema("Task", "content")
+            mocked_schema_field_read.assert_called_once_with("Task", "content")
+            self.assertTrue(shotgun.get_field_schema("Task", "content"))
+            self.assertTrue(shotgun.get_field_schema("Task", "task_assignees"))
+            self.assertEqual(mocked_schema_field_read.call_count, 1)
+            # Stale schemas are read again in the background
+            shotgun._shotgun_schemas_refresh_times["Task"] = 0
+            self.assertTrue(shotgun.get_field_schema("Task", "content"))
+            for thread in threading.enumerate():
+                if thread.name == "sg_jira_schema_Task":
+                    thread.join(5)
+            self.assertEqual(mocked_schema_field_read.call_count, 2)
+            mocked_schema_field_read.assert_called_with("Task")
+            self.assertTrue(shotgun.get_field_schema("Task", "content"))
+            self.assertEqual(mocked_schema_field_read.call_count, 2)
+        # Cached schemas are unicode, like retrieved schemas, so they can be
+        # compared.
+        schema = {
+            "sg_status_list": {
+                "name": {"value": "Statut \xc3\xa9tape"},
+                "properties": {
+                    "valid_values": {"value": ["wtg", "\xc3\xa9t\xc3\xa9"]},
+                },
+            },
+        }
+        with mock.patch.object(
+            shotgun._shotgun, "schema_field_read", return_value=schema
+        ):
+            shotgun.clear_cached_field_schema("Task")
+            field_schema = shotgun.get_field_schema("Task", "sg_status_list")
+            self.assertIsInstance(field_schema["name"]["value"], unicode)
+            shotgun.refresh_cached_field_schema("Task", "sg_status_list")
+            self.assertEqual(
+                shotgun.retrieve_field_schemas(["Task"])["Task"],
+                shotgun.field_schemas["Task"],
+            )
+
+    def test_jira_project_cache(self, mocked_sg):
+        """
+        Test Jira Projects are cached.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        other_project = dict(JIRA_PROJECT)
+        other_project["key"] = "OTHER"
+        other_project["id"] = "54321"
+        bridge.jira.set_projects([JIRA_PROJECT, other_project])
+        with mock.patch.object(
+            bridge.jira, "projects", wraps=bridge.jira.projects
+        ) as mocked_projects:
+            with mock.patch.object(
+                bridge.jira, "project", wraps=bridge.jira.project
+            ) as mocked_project:
+                for i in range(3):
+                    self.assertEqual(
+                        syncer.get_jira_project(JIRA_PROJECT_KEY).key,
+                        JIRA_PROJECT_KEY
+                    )
+                self.assertIsNone(syncer.get_jira_project("UNKNOWN"))
+                self.assertEqual(mocked_projects.call_count, 1)
+                self.assertEqual(mocked_project.call_count, 1)
+                # Cleared Projects are retrieved individually
+                bridge.jira.clear_cached_jira_projects(JIRA_PROJECT_KEY)
+                self.assertEqual(
+                    syncer.get_jira_project(JIRA_PROJECT_KEY).key,
+                    JIRA_PROJECT_KEY
+                )
+                self.assertEqual(mocked_projects.call_count, 1)
+                self.assertEqual(mocked_project.call_count, 2)
+                # Projects are all retrieved again if the cache is empty
+                bridge.jira.clear_cached_jira_projects()
+                syncer.get_jira_project(JIRA_PROJECT_KEY)
+                self.assertEqual(mocked_projects.call_count, 2)
+
+    def test_jira_meta_cache(self, mocked_sg):
+        """
+        Test Jira create and edit meta data are cached.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        bridge.jira.set_projects([JIRA_PROJECT])
+        issue = bridge.jira.create_issue({})
+        with mock.patch.object(
+            bridge.jira, "editmeta", wraps=bridge.jira.editmeta
+        ) as mocked_editmeta:
+            for i in range(3):
+                self.assertTrue(bridge.jira.get_jira_issue_edit_meta(issue))
+            self.assertEqual(mocked_editmeta.call_count, 1)
+            bridge.clear_caches()
+            bridge.jira.get_jira_issue_edit_meta(issue)
+            self.assertEqual(mocked_editmeta.call_count, 2)
+        jira_project = syncer.get_jira_project(JIRA_PROJECT_KEY)
+        jira_issue_type = bridge.jira.issue_type_by_name("Task")
+        with mock.patch.object(
+            bridge.jira, "createmeta", wraps=bridge.jira.createmeta
+        ) as mocked_createmeta:
+            for i in range(3):
+                self.assertTrue(
+                    bridge.jira.get_jira_issue_create_meta(jira_project, jira_issue_type)
+                )
+            self.assertEqual(mocked_createmeta.call_count, 1)
+
+    def test_jira_transitions_cache(self, mocked_sg):
+        """
+        Test Jira workflow transitions are cached.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        bridge.jira.set_projects([JIRA_PROJECT])
+        issue = bridge.jira.create_issue({})
+        resolution = {"id": "1", "name": "Done"}
+        transitions = [{
+            "id": "31",
+            "name": "Close",
+            "to": {"name": "Closed"},
+            "fields": {
+                "resolution": {
+                    "required": True,
+                    "schema": {"type": "resolution"},
+                    "allowedValues": [resolution],
+                },
+            },
+        }]
+        with mock.patch.object(
+            bridge.jira, "transitions", return_value=transitions
+        ) as mocked_transitions:
+            with mock.patch.object(
+                bridge.jira, "transition_issue", create=True
+            ) as mocked_transition_issue:
+                for i in range(3):
+                    self.assertTrue(
+                        bridge.jira.set_jira_issue_status(issue, "Closed", "Closing")
+                    )
+                    mocked_transition_issue.assert_called_with(
+                        issue, "31", comment="Closing", fields={"resolution": resolution}
+                    )
+                self.assertFalse(
+                    bridge.jira.set_jira_issue_status(issue, "Blocked", "Blocking")
+                )
+                self.assertEqual(mocked_transition_issue.call_count, 3)
+            self.assertEqual(mocked_transitions.call_count, 1)
+            bridge.clear_caches()
+            bridge.jira.get_jira_issue_transitions(issue)
+            self.assertEqual(mocked_transitions.call_count, 2)
+
+    def test_jira_user_cache(self, mocked_sg):
+        """
+        Test Jira users matched from email addresses are cached, failed
+        lookups included, and that assignable users are indexed per Project.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        bridge.jira.set_projects([JIRA_PROJECT])
+        jira_project = syncer.get_jira_project(JIRA_PROJECT_KEY)
+        with mock.patch.object(
+            bridge.jira,
+            "search_assignable_users_for_issues",
+            wraps=bridge.jira.search_assignable_users_for_issues
+        ) as mocked_search:
+            for i in range(3):
+                jira_user = bridge.jira.find_jira_user(
+                    JIRA_USER["emailAddress"].upper(),
+                    jira_project=jira_project,
+                )
+                self.assertEqual(jira_user.accountId, JIRA_USER["accountId"])
+            # A direct search and three pages of users to build the index
+            self.assertEqual(mocked_search.call_count, 4)
+            # Different lookup parameters are not shared, but the index of
+            # assignable users is.
+            bridge.jira.find_jira_user(
+                JIRA_USER["emailAddress"],
+                jira_project=jira_project,
+                for_assignment=True,
+            )
+            self.assertEqual(mocked_search.call_count, 5)
+            jira_user = bridge.jira.find_jira_user(
+                JIRA_USER_2["emailAddress"],
+                jira_project=jira_project,
+            )
+            self.assertEqual(jira_user.accountId, JIRA_USER_2["accountId"])
+            self.assertEqual(mocked_search.call_count, 6)
+            # Lookups for Issues share the cache of their Project.
+            for i in range(2):
+                jira_issue = bridge.jira.create_issue({})
+                jira_user = bridge.jira.find_jira_user(
+                    JIRA_USER_2["emailAddress"],
+                    jira_issue=jira_issue,
+                )
+                self.assertEqual(jira_user.accountId, JIRA_USER_2["accountId"])
+            self.assertEqual(mocked_search.call_count, 6)
+        with mock.patch.object(
+            bridge.jira, "search_assignable_users_for_issues", return_value=[]
+        ) as mocked_search:
+            for i in range(3):
+                self.assertIsNone(bridge.jira.find_jira_user(
+                    "unknown@weefree.com",
+                    jira_project=jira_project,
+                ))
+            # Only the direct search, the current index is used
+            self.assertEqual(mocked_search.call_count, 1)
+            bridge.clear_caches()
+            bridge.jira.find_jira_user(
+                "unknown@weefree.com",
+                jira_project=jira_project,
+            )
+            # The direct search and the index being rebuilt
+            self.assertEqual(mocked_search.call_count, 3)
+
+    def test_jira_user_index_single_build(self, mocked_sg):
+        """
+        Test concurrent first lookups for a Jira Project wait for a single
+        build of its index of assignable users.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        bridge.jira.set_projects([JIRA_PROJECT])
+        jira_project = syncer.get_jira_project(JIRA_PROJECT_KEY)
+        search_assignable_users = bridge.jira.search_assignable_users_for_issues
+
+        def slow_search(name, *args, **kwargs):
+            if not name:
+                # Leave time to other lookups to start while indexing.
+                time.sleep(0.1)
+            return search_assignable_users(name, *args, **kwargs)
+
+        results = []
+        with mock.patch.object(
+            bridge.jira,
+            "search_assignable_users_for_issues",
+            side_effect=slow_search
+        ) as mocked_search:
+            threads = [
+                threading.Thread(
+                    target=lambda email: results.append(
+                        bridge.jira.find_jira_user(email, jira_project=jira_project)
+                    ),
+                    args=(user["emailAddress"],),
+                ) for user in [JIRA_USER, JIRA_USER_2] * 2
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+            self.assertEqual(len(results), 4)
+            self.assertEqual(
+                sorted(jira_user.accountId for jira_user in results),
+                sorted([JIRA_USER["accountId"], JIRA_USER_2["accountId"]] * 2)
+            )
+            index_queries = [
+                call for call in mocked_search.call_args_list if not call[0][0]
+            ]
+            # Three pages of users for a single build of the index.
+            self.assertEqual(len(index_queries), 3)
+
+    def test_shotgun_entity_cache(self, mocked_sg):
+        """
+        Test Shotgun Entities consolidated from Shotgun are cached.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        self.add_to_sg_mock_db(bridge.shotgun, {
+            "status": "act",
+            "valid": "valid",
+            "type": "HumanUser",
+            "name": "Ford Prefect",
+            "id": 1,
+            "email": JIRA_USER["emailAddress"]
+        })
+        sg_user = {"type": "HumanUser", "id": 1}
+        with mock.patch.object(
+            bridge.shotgun, "find_one", wraps=bridge.shotgun.find_one
+        ) as mocked_find_one:
+            for i in range(3):
+                consolidated = bridge.shotgun.consolidate_entity(dict(sg_user))
+                self.assertEqual(consolidated["email"], JIRA_USER["emailAddress"])
+                self.assertEqual(consolidated["name"], "Ford Prefect")
+                # Changing the returned value does not change cached values
+                consolidated["email"] = None
+            self.assertEqual(mocked_find_one.call_count, 1)
+            # Missing fields are retrieved
+            bridge.shotgun.consolidate_entity(dict(sg_user), fields=["status"])
+            self.assertEqual(mocked_find_one.call_count, 2)
+            bridge.shotgun.consolidate_entity(dict(sg_user), fields=["status"])
+            self.assertEqual(mocked_find_one.call_count, 2)
+            # Updates invalidate cached values
+            bridge.shotgun.update("HumanUser", 1, {"email": "ford@prefect.com"})
+            consolidated = bridge.shotgun.consolidate_entity(dict(sg_user))
+            self.assertEqual(consolidated["email"], "ford@prefect.com")
+            self.assertEqual(mocked_find_one.call_count, 3)
+            bridge.clear_caches()
+            bridge.shotgun.consolidate_entity(dict(sg_user))
+            self.assertEqual(mocked_find_one.call_count, 4)
+        # Values read before the Entity was invalidated are not cached.
+        find_one = bridge.shotgun.find_one
+
+        def find_one_and_invalidate(*args, **kwargs):
+            result = find_one(*args, **kwargs)
+            bridge.shotgun.invalidate_cached_entity("HumanUser", 1)
+            return result
+
+        with mock.patch.object(
+            bridge.shotgun, "find_one", side_effect=find_one_and_invalidate
+        ) as mocked_find_one:
+            bridge.shotgun.consolidate_entity(dict(sg_user), fields=["status"])
+            bridge.shotgun.consolidate_entity(dict(sg_user), fields=["status"])
+            self.assertEqual(mocked_find_one.call_count, 2)
+        self.assertEqual(bridge.shotgun._invalidated_entities, {})
+        with mock.patch.object(
+            bridge.shotgun, "find_one", wraps=bridge.shotgun.find_one
+        ) as mocked_find_one:
+            for i in range(2):
+                bridge.shotgun.consolidate_entity(dict(sg_user), fields=["status"])
+            self.assertEqual(mocked_find_one.call_count, 1)
+
+    def test_shotgun_entity_cache_manifest(self, mocked_sg):
+        """
+        Test values of Shotgun fields events are not forwarded for, because
+        they are not in the manifest, are not served from the cache.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        self.add_to_sg_mock_db(bridge.shotgun, SG_PROJECTS)
+        self.add_to_sg_mock_db(bridge.shotgun, SG_TASKS)
+        shotgun_fields = bridge.get_manifest("task_issue")["shotgun_fields"]
+        self.assertNotIn(SHOTGUN_JIRA_ID_FIELD, shotgun_fields["Task"])
+        self.assertNotIn("Project", shotgun_fields)
+        sg_task = {"type": "Task", "id": 2}
+        task_fields = [
+            "content",
+            SHOTGUN_JIRA_ID_FIELD,
+            "project.Project.%s" % SHOTGUN_JIRA_ID_FIELD,
+        ]
+        consolidated = bridge.shotgun.consolidate_entity(
+            dict(sg_task), fields=task_fields
+        )
+        self.assertIsNone(consolidated[SHOTGUN_JIRA_ID_FIELD])
+        # Link the Task and change its Project without the bridge being
+        # notified, like when events are discarded by the trigger.
+        self.add_to_sg_mock_db(bridge.shotgun, [
+            dict(SG_TASKS[1], **{SHOTGUN_JIRA_ID_FIELD: "UTest-1"}),
+            dict(SG_PROJECTS[1], **{SHOTGUN_JIRA_ID_FIELD: "UTest2"}),
+        ])
+        with mock.patch.object(
+            bridge.shotgun, "find_one", wraps=bridge.shotgun.find_one
+        ) as mocked_find_one:
+            consolidated = bridge.shotgun.consolidate_entity(
+                dict(sg_task), fields=task_fields
+            )
+            self.assertEqual(consolidated[SHOTGUN_JIRA_ID_FIELD], "UTest-1")
+            self.assertEqual(
+                consolidated["project.Project.%s" % SHOTGUN_JIRA_ID_FIELD],
+                "UTest2"
+            )
+            self.assertEqual(mocked_find_one.call_count, 1)
+            # Other values are still cached.
+            bridge.shotgun.consolidate_entity(dict(sg_task), fields=["content"])
+            self.assertEqual(mocked_find_one.call_count, 1)
+
+    def test_shotgun_match_entities(self, mocked_sg):
+        """
+        Test matching multiple Shotgun Entities by name.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        self.add_to_sg_mock_db(bridge.shotgun, SG_PROJECTS)
+        self.add_to_sg_mock_db(bridge.shotgun, [{
+            "type": "Tag",
+            "id": 1,
+            "name": "foo",
+        }, {
+            "type": "Tag",
+            "id": 2,
+            "name": "bar",
+        }, {
+            "status": "act",
+            "valid": "valid",
+            "type": "HumanUser",
+            "name": "foo",
+            "id": 1,
+            "email": JIRA_USER["emailAddress"]
+        }, {
+            "status": "act",
+            "valid": "valid",
+            "type": "HumanUser",
+            "name": "Ford Prefect",
+            "id": 2,
+            "email": JIRA_USER_2["emailAddress"]
+        }])
+        with mock.patch.object(
+            bridge.shotgun, "find", wraps=bridge.shotgun.find
+        ) as mocked_find:
+            matches = bridge.shotgun.match_entities_by_name(
+                ["foo", "bar", "Ford Prefect", "unknown"],
+                ["Tag", "HumanUser"],
+                SG_PROJECTS[0],
+            )
+            self.assertEqual(mocked_find.call_count, 2)
+        self.assertEqual(sorted(matches.keys()), ["Ford Prefect", "bar", "foo"])
+        # Entity types are considered in the given order
+        self.assertEqual(matches["foo"]["type"], "Tag")
+        self.assertEqual(matches["Ford Prefect"]["type"], "HumanUser")
+        # Matched Entities are consolidated
+        self.assertEqual(matches["Ford Prefect"]["email"], JIRA_USER_2["emailAddress"])
+        self.assertEqual(
+            bridge.shotgun.match_entity_by_name("bar", ["Tag"], SG_PROJECTS[0])["id"],
+            2
+        )
+
     def test_shotgun_assignee(self, mocked_sg):
         """
         Test matching Shotgun assignment to Jira.
@@ -796,6 +1421,261 @@ class TestJiraSyncer(TestSyncBase):
         # The invalid tag should be reject, only the valid one should be there
         self.assertEqual(issue.fields.labels, ["foo"])
 
+    def test_shotgun_coalesced_changes(self, mocked_sg):
+        """
+        Test multiple Shotgun changes are synced with a single Jira update.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        bridge.jira.set_projects([JIRA_PROJECT])
+        issue = bridge.jira.create_issue({})
+        self.add_to_sg_mock_db(bridge.shotgun, SG_PROJECTS)
+        sg_tags = [{
+            "type": "Tag",
+            "id": 1,
+            "name": "foo",
+        }, {
+            "type": "Tag",
+            "id": 2,
+            "name": "bar",
+        }]
+        self.add_to_sg_mock_db(bridge.shotgun, sg_tags)
+        synced_task = {
+            "type": "Task",
+            "id": 3,
+            "content": "Task One/2",
+            "tags": [],
+            "project": SG_PROJECTS[1],
+            SHOTGUN_JIRA_ID_FIELD: issue.key,
+            SHOTGUN_SYNC_IN_JIRA_FIELD: True,
+        }
+        self.add_to_sg_mock_db(bridge.shotgun, SG_TASKS + [synced_task])
+        events = []
+        for added, removed in [(sg_tags, []), ([], [sg_tags[0]])]:
+            events.append({
+                "user": {"type": "HumanUser", "id": 1},
+                "project": {"type": "Project", "id": 2},
+                "meta": {
+                    "entity_id": 3,
+                    "removed": removed,
+                    "attribute_name": "tags",
+                    "entity_type": "Task",
+                    "field_data_type": "multi_entity",
+                    "added": added,
+                    "type": "attribute_change",
+                }
+            })
+        for content in ["Task One/2 v2", "Task One/2 v3"]:
+            events.append({
+                "user": {"type": "HumanUser", "id": 1},
+                "project": {"type": "Project", "id": 2},
+                "meta": {
+                    "entity_id": 3,
+                    "attribute_name": "content",
+                    "entity_type": "Task",
+                    "field_data_type": "text",
+                    "new_value": content,
+                    "type": "attribute_change",
+                }
+            })
+        with mock.patch.object(
+            MockedIssue, "update", autospec=True, side_effect=MockedIssue.update
+        ) as mocked_update:
+            self.assertTrue(
+                bridge.sync_events_in_jira("task_issue", "Task", 3, events)
+            )
+            self.assertEqual(mocked_update.call_count, 1)
+        issue = bridge.jira.issue(synced_task[SHOTGUN_JIRA_ID_FIELD])
+        self.assertEqual(issue.fields.labels, ["bar"])
+        self.assertEqual(issue.fields.summary, "Task One/2 v3")
+
+    def test_shotgun_coalesced_status_change(self, mocked_sg):
+        """
+        Test coalesced Shotgun changes are applied in order around status
+        changes.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        bridge.jira.set_projects([JIRA_PROJECT])
+        issue = bridge.jira.create_issue({})
+        self.add_to_sg_mock_db(bridge.shotgun, SG_PROJECTS)
+        synced_task = {
+            "type": "Task",
+            "id": 3,
+            "content": "Task One/2",
+            "project": SG_PROJECTS[1],
+            SHOTGUN_JIRA_ID_FIELD: issue.key,
+            SHOTGUN_SYNC_IN_JIRA_FIELD: True,
+        }
+        self.add_to_sg_mock_db(bridge.shotgun, SG_TASKS + [synced_task])
+        events = []
+        for field, data_type, value in [
+            ("sg_status_list", "status_list", "ip"),
+            ("content", "text", "Task One/2 v2"),
+        ]:
+            events.append({
+                "user": {"type": "HumanUser", "id": 1},
+                "project": {"type": "Project", "id": 2},
+                "meta": {
+                    "entity_id": 3,
+                    "attribute_name": field,
+                    "entity_type": "Task",
+                    "field_data_type": data_type,
+                    "new_value": value,
+                    "type": "attribute_change",
+                }
+            })
+        calls = []
+
+        def set_jira_issue_status(*args, **kwargs):
+            calls.append("set_jira_issue_status")
+            return True
+
+        def get_jira_issue_edit_meta(jira_issue):
+            calls.append("get_jira_issue_edit_meta")
+            return edit_meta(jira_issue)
+
+        def update(jira_issue, *args, **kwargs):
+            calls.append("update")
+            return issue_update(jira_issue, *args, **kwargs)
+
+        edit_meta = bridge.jira.get_jira_issue_edit_meta
+        issue_update = MockedIssue.update
+        with mock.patch.object(
+            bridge.jira, "set_jira_issue_status", side_effect=set_jira_issue_status
+        ):
+            with mock.patch.object(
+                bridge.jira,
+                "get_jira_issue_edit_meta",
+                side_effect=get_jira_issue_edit_meta,
+            ):
+                with mock.patch.object(
+                    MockedIssue, "update", autospec=True, side_effect=update
+                ):
+                    self.assertTrue(
+                        bridge.sync_events_in_jira("task_issue", "Task", 3, events)
+                    )
+        # The status is changed first, and the edit meta data retrieved after
+        # it was changed.
+        self.assertEqual(
+            calls,
+            ["set_jira_issue_status", "get_jira_issue_edit_meta", "update"],
+        )
+        issue = bridge.jira.issue(synced_task[SHOTGUN_JIRA_ID_FIELD])
+        self.assertEqual(issue.fields.summary, "Task One/2 v2")
+
+    def test_shotgun_full_sync_edit_meta(self, mocked_sg):
+        """
+        Test Jira edit meta data is retrieved once when all fields are synced.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        bridge.jira.set_projects([JIRA_PROJECT])
+        issue = bridge.jira.create_issue({})
+        self.add_to_sg_mock_db(bridge.shotgun, SG_PROJECTS)
+        synced_task = {
+            "type": "Task",
+            "id": 3,
+            "content": "Task One/2",
+            "task_assignees": [],
+            "tags": [],
+            "project": SG_PROJECTS[1],
+            SHOTGUN_JIRA_ID_FIELD: issue.key,
+            SHOTGUN_SYNC_IN_JIRA_FIELD: True,
+        }
+        self.add_to_sg_mock_db(bridge.shotgun, SG_TASKS + [synced_task])
+        with mock.patch.object(
+            bridge.jira,
+            "get_jira_issue_edit_meta",
+            wraps=bridge.jira.get_jira_issue_edit_meta
+        ) as mocked_edit_meta:
+            self.assertTrue(bridge.sync_in_jira(
+                "task_issue",
+                "Task",
+                3,
+                {
+                    "user": {"type": "HumanUser", "id": 1},
+                    "project": {"type": "Project", "id": 2},
+                    "meta": {
+                        "entity_id": 3,
+                        "attribute_name": SHOTGUN_SYNC_IN_JIRA_FIELD,
+                        "entity_type": "Task",
+                        "field_data_type": "checkbox",
+                        "new_value": True,
+                        "type": "attribute_change",
+                    }
+                }
+            ))
+            self.assertEqual(mocked_edit_meta.call_count, 1)
+        issue = bridge.jira.issue(issue.key)
+        self.assertEqual(issue.fields.summary, "Task One/2")
+
+    def test_coalesced_dispatch(self, mocked_sg):
+        """
+        Test Shotgun events dispatched within the coalescing window are
+        processed together.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        bridge.start_dispatcher(2, coalesce_window=0.5)
+        self.addCleanup(bridge.stop_dispatcher)
+        with mock.patch.object(
+            bridge, "sync_events_in_jira", return_value=True
+        ) as mocked_sync_events:
+            with mock.patch.object(
+                bridge, "sync_in_jira", return_value=True
+            ) as mocked_sync:
+                calls = [
+                    bridge.dispatch_in_jira("task_issue", "Task", 3, {"order": i})
+                    for i in range(3)
+                ]
+                # A different Entity is not coalesced
+                other = bridge.dispatch_in_jira("task_issue", "Task", 4, {"order": 3})
+                # Nor are calls with different keyword arguments, which are
+                # still performed in order.
+                forced = bridge.dispatch_in_jira(
+                    "task_issue", "Task", 3, {"order": 4}, force=True
+                )
+                for call in calls + [other, forced]:
+                    self.assertTrue(call.result(5))
+        mocked_sync_events.assert_called_once_with(
+            "task_issue", "Task", 3, [{"order": 0}, {"order": 1}, {"order": 2}]
+        )
+        self.assertEqual(
+            sorted(mocked_sync.call_args_list),
+            sorted([
+                mock.call("task_issue", "Task", 4, {"order": 3}),
+                mock.call("task_issue", "Task", 3, {"order": 4}, force=True),
+            ])
+        )
+
+    def test_coalesced_dispatch_latency(self, mocked_sg):
+        """
+        Test Shotgun events for different Entities sharing a lane are coalesced
+        concurrently.
+        """
+        syncer, bridge = self._get_syncer(mocked_sg)
+        # A single lane for all the Entities.
+        bridge.start_dispatcher(1, coalesce_window=0.5)
+        self.addCleanup(bridge.stop_dispatcher)
+        with mock.patch.object(
+            bridge, "sync_events_in_jira", return_value=True
+        ) as mocked_sync_events:
+            start = time.time()
+            calls = []
+            for i in range(2):
+                for entity_id in [3, 4, 5]:
+                    calls.append(bridge.dispatch_in_jira(
+                        "task_issue", "Task", entity_id, {"order": i}
+                    ))
+            for call in calls:
+                self.assertTrue(call.result(5))
+            # All Entities were synced after a single window.
+            self.assertLess(time.time() - start, 0.9)
+        self.assertEqual(
+            mocked_sync_events.call_args_list,
+            [
+                mock.call("task_issue", "Task", entity_id, [{"order": 0}, {"order": 1}])
+                for entity_id in [3, 4, 5]
+            ]
+        )
+
     def test_jira_assignment(self, mocked_sg):
         """
         Test syncing Jira assignment to Shotgun
@@ -8,6 +8,13 @@
 #
 
 import re
+import socket
+import threading
+import time
+
+from jira import JIRAError
+import requests
+import shotgun_api3
 
 from test_base import TestBase
 import sg_jira
@@ -261,3 +268,73 @@ class TestUtils(TestBase):
             res,
             encoded
         )
+
+    def test_run_in_parallel(self):
+        """
+        Test running callables concurrently.
+        """
+        barrier = threading.Semaphore(0)
+
+        def first():
+            # Wait for the second callable to be running.
+            self.assertTrue(barrier.acquire())
+            return 1
+
+        def second():
+            barrier.release()
+            return 2
+
+        self.assertEqual(sg_jira.utils.run_in_parallel([first, second]), [1, 2])
+
+        def bad():
+            raise RuntimeError("Sorry, I'm bad!")
+
+        def slow():
+            time.sleep(0.1)
+            done.append(True)
+
+        done = []
+        self.assertRaisesRegexp(
+            RuntimeError,
+            "Sorry, I'm bad!",
+            sg_jira.utils.run_in_parallel,
+            [bad, slow],
+        )
+        # All callables completed
+        self.assertEqual(done, [True])
+        # Threads are named after the given prefix.
+        self.assertEqual(
+            sg_jira.utils.run_in_parallel(
+                [lambda: threading.current_thread().name] * 2,
+                thread_name="sg_jira_test",
+            ),
+            ["sg_jira_test_0", "sg_jira_test_1"],
+        )
+
+    def test_is_transient_error(self):
+        """
+        Test detecting errors which are worth retrying.
+        """
+        response = requests.Response()
+        response.status_code = 502
+        for error in [
+            requests.ConnectionError("Jira is down"),
+            requests.Timeout("Jira is slow"),
+            requests.HTTPError("Bad gateway", response=response),
+            socket.error("Shotgun is down"),
+            JIRAError(status_code=503),
+            JIRAError(status_code=429),
+            shotgun_api3.ProtocolError("https://shotgun", 502, "Bad gateway", {}),
+        ]:
+            self.assertTrue(sg_jira.utils.is_transient_error(error), error)
+        response = requests.Response()
+        response.status_code = 404
+        for error in [
+            ValueError("Sorry, I'm bad!"),
+            RuntimeError("Sorry, I'm bad!"),
+            requests.HTTPError("Not found", response=response),
+            JIRAError(status_code=400),
+            shotgun_api3.ProtocolError("https://shotgun", 403, "Forbidden", {}),
+            shotgun_api3.Fault("Sorry, I'm bad!"),
+        ]:
+            self.assertFalse(sg_jira.utils.is_transient_error(error), error)
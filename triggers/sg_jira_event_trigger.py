@@ -6,7 +6,13 @@
 #
 
 import os
+import atexit
+import hashlib
+import json
 import logging
+import tempfile
+import threading
+import time
 import requests
 
 """
@@ -14,8 +20,679 @@ A simple Shotgun event daemon plugin which sends all events to the SG/Jira bridg
 
 Shotgun Projects are associated with a Jira sync server by specifying an url in the
 custom `sg_jira_sync_url` field.
+
+Events are posted in batches from a background thread, so the event daemon
+is not slowed down by the bridge. The maximum number of events in a batch and
+the maximum number of seconds an event waits for other events before being
+posted can be set with the `SGDAEMON_SGJIRA_BATCH_SIZE` and
+`SGDAEMON_SGJIRA_BATCH_DELAY` environment variables.
+
+Events which can't be posted, e.g. because the bridge is down, are spooled in
+local files and posted again later, in order. The directory where these files
+are stored can be set with the `SGDAEMON_SGJIRA_SPOOL_DIR` environment variable.
+
+Events for Shotgun fields which are not synced are discarded, using the
+manifest published by the bridge for each sync url.
 """
 
+# Default maximum number of events posted in a single request.
+DEFAULT_BATCH_SIZE = 50
+# Default maximum number of seconds an event waits for other events.
+DEFAULT_BATCH_DELAY = 0.5
+# Number of seconds to wait for a response from the bridge.
+POST_TIMEOUT = 300
+# Default directory where events which couldn't be posted are spooled.
+DEFAULT_SPOOL_DIR = os.path.join(tempfile.gettempdir(), "sg_jira_event_trigger")
+# Number of seconds to wait before posting spooled events again, doubled after
+# each failure up to the maximum delay.
+SPOOL_RETRY_DELAY = 1
+SPOOL_MAX_RETRY_DELAY = 300
+# Number of seconds a manifest retrieved from the bridge is used before being
+# retrieved again.
+MANIFEST_TTL = 300
+# Number of seconds to wait before retrieving a manifest again after a failure.
+MANIFEST_RETRY_DELAY = 60
+# Number of seconds to wait for a manifest from the bridge.
+MANIFEST_TIMEOUT = 10
+
+
+class EventSpool(object):
+    """
+    Store events which couldn't be posted in local files, so they can be
+    posted later in the order they were sent.
+
+    Events are appended to a file per sync url. The offset of the first event
+    which was not posted yet is stored in a companion file, and both files are
+    removed once all events were posted.
+    """
+    def __init__(self, directory, logger):
+        """
+        Instantiate a new spool, creating its directory if needed.
+
+        :param str directory: Full path to the directory where events are spooled.
+        :param logger: A standard logger.
+        """
+        super(EventSpool, self).__init__()
+        self._directory = directory
+        self._logger = logger
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _get_paths(self, sync_url):
+        """
+        Return the paths of the files used to spool events for the given url.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        :returns: A tuple with the path of the events file and the path of the
+                  offset file.
+        """
+        if isinstance(sync_url, unicode):
+            sync_url = sync_url.encode("utf-8")
+        base_path = os.path.join(self._directory, hashlib.sha1(sync_url).hexdigest())
+        return "%s.jsonl" % base_path, "%s.offset" % base_path
+
+    def get_sync_urls(self):
+        """
+        Return the sync urls for which events are spooled.
+
+        :returns: A list of urls.
+        """
+        sync_urls = []
+        for name in sorted(os.listdir(self._directory)):
+            if not name.endswith(".jsonl"):
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                with open(path, "rb") as f:
+                    sync_urls.append(json.loads(f.readline())["sync_url"])
+            except (IOError, ValueError, KeyError) as e:
+                self._logger.warning("Ignoring invalid spool file %s: %s" % (path, e))
+        return sync_urls
+
+    def has_events(self, sync_url):
+        """
+        Return `True` if events are spooled for the given url.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        """
+        return os.path.exists(self._get_paths(sync_url)[0])
+
+    def append(self, sync_url, events):
+        """
+        Spool the given events for the given url.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        :param events: A list of event payloads.
+        """
+        path, _ = self._get_paths(sync_url)
+        with open(path, "ab") as f:
+            for event in events:
+                f.write("%s\n" % json.dumps({"sync_url": sync_url, "event": event}))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read(self, sync_url, count):
+        """
+        Read spooled events for the given url, from the first event which was
+        not posted yet.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        :param int count: The maximum number of events to read.
+        :returns: A tuple with a list of event payloads and the offset to
+                  acknowledge once they were posted.
+        """
+        path, offset_path = self._get_paths(sync_url)
+        offset = 0
+        if os.path.exists(offset_path):
+            with open(offset_path, "r") as f:
+                offset = int(f.read() or 0)
+        events = []
+        with open(path, "rb") as f:
+            f.seek(offset)
+            while len(events) < count:
+                line = f.readline()
+                if not line:
+                    break
+                if not line.endswith("\n"):
+                    # An incomplete line, e.g. interrupted while writing it.
+                    self._logger.warning(
+                        "Discarding incomplete spooled event %s" % line
+                    )
+                    offset = f.tell()
+                    break
+                offset = f.tell()
+                try:
+                    events.append(json.loads(line)["event"])
+                except (ValueError, KeyError) as e:
+                    self._logger.warning(
+                        "Discarding invalid spooled event %s: %s" % (line.strip(), e)
+                    )
+        return events, offset
+
+    def ack(self, sync_url, offset):
+        """
+        Acknowledge events read from the spool were posted.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        :param int offset: The offset returned by :meth:`read`.
+        """
+        path, offset_path = self._get_paths(sync_url)
+        if offset >= os.path.getsize(path):
+            # The events file is removed last, so events are still spooled if
+            # we're interrupted.
+            if os.path.exists(offset_path):
+                os.remove(offset_path)
+            os.remove(path)
+            return
+        # Write to a temporary file and rename it, so an interrupted write
+        # can't leave an invalid offset.
+        tmp_path = "%s.tmp" % offset_path
+        with open(tmp_path, "w") as f:
+            f.write("%d" % offset)
+        if os.name == "nt" and os.path.exists(offset_path):
+            # Renaming to an existing file is not allowed on Windows.
+            os.remove(offset_path)
+        os.rename(tmp_path, offset_path)
+
+
+class EventSender(object):
+    """
+    Post events to SG Jira Bridge servers in batches from a background thread.
+
+    Events are grouped by sync url and posted in the order they were sent with
+    a pooled HTTP session.
+
+    If a spool is used, events which can't be posted are spooled and posted
+    again with an exponential backoff. Until all spooled events for a sync url
+    are posted, new events for this url are spooled after them.
+    """
+    def __init__(
+        self, logger, batch_size=DEFAULT_BATCH_SIZE, batch_delay=DEFAULT_BATCH_DELAY, spool_dir=None
+    ):
+        """
+        Instantiate a new sender and start its background thread.
+
+        :param logger: A standard logger.
+        :param int batch_size: The maximum number of events posted in a single
+                               request.
+        :param float batch_delay: The maximum number of seconds an event waits
+                                  for other events before being posted.
+        :param str spool_dir: Optional full path to a directory where events
+                              which can't be posted are spooled. Such events
+                              are discarded if not set.
+        """
+        super(EventSender, self).__init__()
+        self._logger = logger
+        self._batch_size = max(1, batch_size)
+        self._batch_delay = batch_delay
+        # A single session is used so connections to the bridge are reused.
+        self._session = requests.Session()
+        # Pending events indexed by sync url, with the time they must be
+        # posted at.
+        self._pending = {}
+        self._deadlines = {}
+        # Sync urls with spooled events, with the time spooled events should
+        # be posted at, `None` while they are being posted, and the delay to
+        # use if this fails. Only used from the background thread.
+        self._spool = EventSpool(spool_dir, logger) if spool_dir else None
+        self._retry_times = {}
+        self._retry_delays = {}
+        if self._spool:
+            for sync_url in self._spool.get_sync_urls():
+                self._logger.info("Found spooled events for %s" % sync_url)
+                self._retry_times[sync_url] = time.time()
+                self._retry_delays[sync_url] = SPOOL_RETRY_DELAY
+        # The number of batches being posted.
+        self._posting = 0
+        self._flushing = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._post_events,
+            name="sg_jira_event_sender",
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def send(self, sync_url, payload):
+        """
+        Queue the given event payload for the given sync url.
+
+        :param str sync_url: A SG Jira Bridge sync url, e.g.
+                             http://localhost:9090/sg2jira/default
+        :param payload: A dictionary with the event payload.
+        :raises RuntimeError: if the sender was closed.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Can't send events with a closed sender")
+            if sync_url not in self._pending:
+                self._pending[sync_url] = []
+                self._deadlines[sync_url] = time.time() + self._batch_delay
+            self._pending[sync_url].append(payload)
+            self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Post all pending events and wait for them to be posted or spooled.
+
+        :param float timeout: Optional maximum number of seconds to wait.
+        :returns: `True` if all events were posted or spooled, `False`
+                  otherwise.
+        """
+        end = time.time() + timeout if timeout is not None else None
+        with self._condition:
+            self._flushing = True
+            self._condition.notify_all()
+            try:
+                while self._pending or self._posting:
+                    remaining = None
+                    if end is not None:
+                        remaining = end - time.time()
+                        if remaining <= 0:
+                            return False
+                    self._condition.wait(remaining)
+            finally:
+                self._flushing = False
+        return True
+
+    def close(self, timeout=None):
+        """
+        Post all pending events and stop the background thread.
+
+        Spooled events are kept in the spool and posted by the next sender.
+
+        :param float timeout: Optional maximum number of seconds to wait.
+        """
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _get_ready_batch(self):
+        """
+        Return a batch of events which should be posted now, if any.
+
+        Must be called with the condition acquired.
+
+        :returns: A tuple with a sync url and a list of events, or `None`.
+        """
+        now = time.time()
+        for sync_url, events in self._pending.iteritems():
+            if (
+                self._flushing or self._closed
+                or len(events) >= self._batch_size
+                or self._deadlines[sync_url] <= now
+            ):
+                batch = events[:self._batch_size]
+                if len(events) > len(batch):
+                    del events[:self._batch_size]
+                else:
+                    del self._pending[sync_url]
+                    del self._deadlines[sync_url]
+                return sync_url, batch
+        return None
+
+    def _get_ready_spool(self):
+        """
+        Return a sync url whose spooled events should be posted now, if any.
+
+        Must be called with the condition acquired.
+
+        :returns: A sync url or `None`.
+        """
+        if self._closed:
+            return None
+        now = time.time()
+        for sync_url, retry_time in self._retry_times.iteritems():
+            if retry_time is not None and retry_time <= now:
+                return sync_url
+        return None
+
+    def _get_wait_timeout(self):
+        """
+        Return the number of seconds to wait for new events before a batch or
+        spooled events should be posted.
+
+        Must be called with the condition acquired.
+
+        :returns: A number of seconds or `None`.
+        """
+        times = self._deadlines.values()
+        if not self._closed:
+            times.extend([x for x in self._retry_times.values() if x is not None])
+        if not times:
+            return None
+        return max(0, min(times) - time.time())
+
+    def _post_events(self):
+        """
+        Post batches of events and spooled events until the sender is closed.
+        """
+        while True:
+            with self._condition:
+                while True:
+                    ready = self._get_ready_batch()
+                    if ready:
+                        work = self._send_batch
+                        break
+                    ready = self._get_ready_spool()
+                    if ready:
+                        work = self._post_spooled_events
+                        self._retry_times[ready] = None
+                        ready = (ready,)
+                        break
+                    if self._closed:
+                        return
+                    self._condition.wait(self._get_wait_timeout())
+                self._posting += 1
+            try:
+                work(*ready)
+            except Exception as e:
+                # Make sure the thread is not stopped by an unexpected error.
+                self._logger.exception(e)
+            finally:
+                with self._condition:
+                    self._posting -= 1
+                    self._condition.notify_all()
+
+    def _send_batch(self, sync_url, events):
+        """
+        Post the given events to the given sync url, or spool them if they
+        can't be posted.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        :param events: A list of event payloads.
+        """
+        if sync_url in self._retry_times:
+            # Keep events in order: they can only be posted after events
+            # already spooled.
+            self._spool_events(sync_url, events)
+            return
+        retry_events = self._post_batch(sync_url, events)
+        if retry_events and self._spool:
+            self._spool_events(sync_url, retry_events)
+            self._retry_times[sync_url] = time.time() + SPOOL_RETRY_DELAY
+            self._retry_delays[sync_url] = SPOOL_RETRY_DELAY * 2
+
+    def _spool_events(self, sync_url, events):
+        """
+        Spool the given events for the given sync url.
+
+        Errors are logged and not raised.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        :param events: A list of event payloads.
+        """
+        try:
+            self._spool.append(sync_url, events)
+        except Exception as e:
+            self._logger.error(
+                "Unable to spool %d events for %s: %s" % (len(events), sync_url, e)
+            )
+            self._logger.debug("%s" % e, exc_info=True)
+            return
+        self._logger.info("Spooled %d events for %s" % (len(events), sync_url))
+
+    def _post_spooled_events(self, sync_url):
+        """
+        Post the first spooled events for the given sync url.
+
+        If this fails, spooled events are posted again after a delay which is
+        doubled after each failure.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        """
+        try:
+            events, offset = self._spool.read(sync_url, self._batch_size)
+            retry_events = self._post_batch(sync_url, events) if events else []
+            if retry_events:
+                posted = len(events) - len(retry_events)
+                if posted:
+                    # Acknowledge the events posted before the first one to
+                    # post again.
+                    _, posted_offset = self._spool.read(sync_url, posted)
+                    self._spool.ack(sync_url, posted_offset)
+                delay = self._retry_delays[sync_url]
+                self._retry_times[sync_url] = time.time() + delay
+                self._retry_delays[sync_url] = min(delay * 2, SPOOL_MAX_RETRY_DELAY)
+                return
+            self._spool.ack(sync_url, offset)
+        except Exception as e:
+            self._logger.error(
+                "Unable to read spooled events for %s: %s" % (sync_url, e)
+            )
+            self._logger.debug("%s" % e, exc_info=True)
+            self._retry_times[sync_url] = time.time() + SPOOL_MAX_RETRY_DELAY
+            return
+        if self._spool.has_events(sync_url):
+            # Post the next spooled events right away.
+            self._retry_times[sync_url] = time.time()
+            self._retry_delays[sync_url] = SPOOL_RETRY_DELAY
+        else:
+            self._logger.info("All spooled events posted to %s" % sync_url)
+            del self._retry_times[sync_url]
+            del self._retry_delays[sync_url]
+
+    def _post_batch(self, sync_url, events):
+        """
+        Post the given events to the given sync url.
+
+        Errors are logged and not raised.
+
+        Events the bridge could not process because of a transient error are
+        posted again later, with all the events following them to keep events
+        in order.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        :param events: A list of event payloads.
+        :returns: A list with the events which should be posted again later,
+                  all of them if the bridge is unavailable, an empty list if
+                  all events were handled.
+        """
+        batch_url = "%s/batch" % sync_url
+        self._logger.debug("Posting %d events to %s" % (len(events), batch_url))
+        try:
+            response = self._session.post(batch_url, json=events, timeout=POST_TIMEOUT)
+            response.raise_for_status()
+            results = response.json()["results"]
+        except Exception as e:
+            self._logger.error(
+                "Unable to post %d events to %s: %s" % (len(events), batch_url, e)
+            )
+            self._logger.debug("%s" % e, exc_info=True)
+            # The bridge is unreachable or unavailable, while other errors
+            # wouldn't be fixed by posting the events again.
+            status_code = getattr(getattr(e, "response", None), "status_code", None)
+            if (
+                isinstance(e, (requests.ConnectionError, requests.Timeout))
+                or _is_retryable_status(status_code)
+            ):
+                return events
+            return []
+        for index, (event, result) in enumerate(zip(events, results)):
+            status_code = result.get("status", 500)
+            if _is_retryable_status(status_code):
+                self._logger.warning(
+                    "Event %s could not be processed by %s, posting it and %d "
+                    "following events again later: %s" % (
+                        event.get("meta"),
+                        sync_url,
+                        len(events) - index - 1,
+                        result.get("error"),
+                    )
+                )
+                return events[index:]
+            if status_code >= 400:
+                self._logger.warning(
+                    "Event %s was not processed by %s: %s" % (
+                        event.get("meta"), sync_url, result.get("error"),
+                    )
+                )
+        self._logger.debug("Events successfully posted.")
+        return []
+
+
+class ManifestCache(object):
+    """
+    Cache manifests published by SG Jira Bridge servers, listing the Shotgun
+    fields events are accepted for.
+
+    Manifests are retrieved in the background, so the event daemon is never
+    blocked by the bridge. All events are accepted for a sync url until its
+    manifest is available.
+    """
+    def __init__(self, logger):
+        """
+        Instantiate a new manifest cache.
+
+        :param logger: A standard logger.
+        """
+        super(ManifestCache, self).__init__()
+        self._logger = logger
+        self._session = requests.Session()
+        # Accepted fields indexed by sync url, with the time they should be
+        # retrieved again. Accepted fields are a dictionary where keys are
+        # Entity types and values sets of field names, or `None` if all events
+        # are accepted.
+        self._manifests = {}
+        # Sync urls whose manifest is being retrieved in the background.
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def accept_event(self, sync_url, entity_type, field):
+        """
+        Return `True` if an event for the given Entity type and field should be
+        posted to the given sync url, `False` otherwise.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        :param str entity_type: A Shotgun Entity type.
+        :param str field: A Shotgun field name.
+        """
+        with self._lock:
+            cached = self._manifests.get(sync_url)
+            if (
+                (cached is None or cached[0] <= time.time())
+                and sync_url not in self._refreshing
+            ):
+                self._refreshing.add(sync_url)
+                thread = threading.Thread(
+                    target=self._refresh_manifest,
+                    args=(sync_url,),
+                    name="sg_jira_manifest",
+                )
+                thread.daemon = True
+                thread.start()
+        if cached is None or cached[1] is None:
+            return True
+        return field in cached[1].get(entity_type, ())
+
+    def _refresh_manifest(self, sync_url):
+        """
+        Retrieve the manifest for the given sync url, from a background thread.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        """
+        try:
+            self.refresh(sync_url)
+        finally:
+            with self._lock:
+                self._refreshing.discard(sync_url)
+
+    def refresh(self, sync_url):
+        """
+        Retrieve the manifest for the given sync url.
+
+        Errors are logged and not raised: all events are accepted until the
+        manifest is successfully retrieved.
+
+        :param str sync_url: A SG Jira Bridge sync url.
+        """
+        manifest_url = "%s/manifest" % sync_url
+        try:
+            response = self._session.get(manifest_url, timeout=MANIFEST_TIMEOUT)
+            response.raise_for_status()
+            shotgun_fields = response.json()["shotgun_fields"]
+        except Exception as e:
+            self._logger.warning(
+                "Unable to retrieve manifest from %s, all events will be posted: %s" % (
+                    manifest_url, e
+                )
+            )
+            self._logger.debug("%s" % e, exc_info=True)
+            with self._lock:
+                self._manifests[sync_url] = (time.time() + MANIFEST_RETRY_DELAY, None)
+            return
+        accepted_fields = None
+        if shotgun_fields is not None:
+            accepted_fields = dict(
+                (entity_type, set(fields)) for entity_type, fields in shotgun_fields.iteritems()
+            )
+        self._logger.debug("Retrieved manifest %s from %s" % (shotgun_fields, manifest_url))
+        with self._lock:
+            self._manifests[sync_url] = (time.time() + MANIFEST_TTL, accepted_fields)
+
+
+# The sender used to post events, created when the first event is processed.
+_event_sender = None
+_event_sender_lock = threading.Lock()
+# The manifests used to filter events, created when the first event is
+# processed.
+_manifest_cache = None
+_manifest_cache_lock = threading.Lock()
+
+
+def _is_retryable_status(status_code):
+    """
+    Return `True` if a request failing with the given HTTP status code should
+    be sent again later.
+
+    :param status_code: A HTTP status code or `None`.
+    """
+    return status_code == 429 or (status_code is not None and status_code >= 500)
+
+
+def get_event_sender(logger):
+    """
+    Return the :class:`EventSender` used to post events, creating it if needed.
+
+    Pending events are posted when the process exits.
+
+    :param logger: A standard logger, used if the sender is created.
+    :returns: A :class:`EventSender` instance.
+    """
+    global _event_sender
+    with _event_sender_lock:
+        if _event_sender is None:
+            _event_sender = EventSender(
+                logger,
+                batch_size=int(
+                    os.environ.get("SGDAEMON_SGJIRA_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+                ),
+                batch_delay=float(
+                    os.environ.get("SGDAEMON_SGJIRA_BATCH_DELAY", DEFAULT_BATCH_DELAY)
+                ),
+                spool_dir=os.environ.get("SGDAEMON_SGJIRA_SPOOL_DIR", DEFAULT_SPOOL_DIR),
+            )
+            atexit.register(_event_sender.close, POST_TIMEOUT)
+        return _event_sender
+
+
+def get_manifest_cache(logger):
+    """
+    Return the :class:`ManifestCache` used to filter events, creating it if
+    needed.
+
+    :param logger: A standard logger, used if the cache is created.
+    :returns: A :class:`ManifestCache` instance.
+    """
+    global _manifest_cache
+    with _manifest_cache_lock:
+        if _manifest_cache is None:
+            _manifest_cache = ManifestCache(logger)
+        return _manifest_cache
+
 
 def registerCallbacks(reg):
     """
@@ -54,7 +731,7 @@ def registerCallbacks(reg):
 
 def process_event(sg, logger, event, dispatch_routes):
     """
-    A callback which posts Jira sync requests.
+    A callback which sends Jira sync requests.
 
     :param sg: Shotgun API handle.
     :param logger: Logger instance.
@@ -136,10 +813,19 @@ def process_event(sg, logger, event, dispatch_routes):
     if not entity_type or not entity_id:
         logger.debug("Ignoring event %s without valid Entity meta data.")
         return
-    # Just send a POST request with the event meta data as payload.
-    sync_url = "%s/%s/%d" % (sync_server_url, entity_type, entity_id)
-    logger.debug("Posting event %s to %s" % (meta, sync_url))
-    # Post application/json request
+    # Discard events the bridge would reject, e.g. for fields which are not
+    # synced.
+    field = meta.get("attribute_name")
+    if not get_manifest_cache(logger).accept_event(sync_server_url, entity_type, field):
+        logger.debug(
+            "Ignoring event %s for %s %s not accepted by %s" % (
+                meta, entity_type, field, sync_server_url
+            )
+        )
+        return
+    # Just queue the event meta data as payload, it is posted in a batch with
+    # other events by the sender.
+    logger.debug("Sending event %s to %s" % (meta, sync_server_url))
     # We should mimic the payload send by Shotgun webhooks
 #    {
 #      "id": 5,
@@ -168,9 +854,4 @@ def process_event(sg, logger, event, dispatch_routes):
         "entity_type": entity_type,
         "entity_id": entity_id,
     }
-    response = requests.post(
-        sync_url,
-        json=payload,
-    )
-    response.raise_for_status()
-    logger.debug("Event successfully processed.")
+    get_event_sender(logger).send(sync_server_url, payload)
@@ -7,8 +7,13 @@
 
 import re
 import argparse
+import select
+import time
 import urlparse
 import BaseHTTPServer
+import SocketServer
+import Queue
+import threading
 import json
 import ssl
 import logging
@@ -45,27 +50,316 @@ HMTL_TEMPLATE = """
 logger = logging.getLogger("webapp")
 
 
-class Server(BaseHTTPServer.HTTPServer):
+class Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
     """
-    A web server
+    A web server handling requests with a pool of worker threads.
+
+    With a single worker thread, which is the default, requests are processed
+    one at a time in the order they were received.
     """
+    # Don't let worker threads prevent the process from exiting.
+    daemon_threads = True
+    # The maximum number of events retrieved from the queue in asynchronous
+    # mode waiting to be processed, per worker.
+    _MAX_EVENTS_IN_FLIGHT_PER_WORKER = 10
+    # The default number of seconds persistent connections are kept open
+    # without receiving a request.
+    _DEFAULT_IDLE_TIMEOUT = 30
+
     def __init__(self, settings, *args, **kwargs):
+        """
+        :param str settings: Path to settings file.
+        :param int max_threads: Optional maximum number of requests which can
+                                be processed concurrently, 1 by default.
+        :param int async_workers: Optional number of background workers used to
+                                  process events asynchronously. If not set,
+                                  events are processed before a response is
+                                  sent for a request.
+        :param str queue_file: Optional full path to a file used to persist
+                               events queued in asynchronous mode, allowing
+                               to process them after a restart.
+        :param float coalesce_window: Optional number of seconds to wait for
+                                      other changes to a Shotgun Entity before
+                                      syncing it, allowing to sync multiple
+                                      changes at once.
+        :param bool warm_up: Optional, if `True` all syncers are setup before
+                             the server starts listening.
+        :param float idle_timeout: Optional number of seconds persistent
+                                   connections are kept open without receiving
+                                   a request, 30 by default. Connections are
+                                   closed after each request if 0.
+        :raises RuntimeError: if warming up the bridge failed.
+        """
+        max_threads = kwargs.pop("max_threads", 1)
+        if max_threads < 1:
+            raise ValueError(
+                "Invalid maximum number of threads %s, it must be at least 1" % max_threads
+            )
+        async_workers = kwargs.pop("async_workers", 0)
+        if async_workers < 0:
+            raise ValueError(
+                "Invalid number of asynchronous workers %s" % async_workers
+            )
+        queue_file = kwargs.pop("queue_file", None)
+        coalesce_window = kwargs.pop("coalesce_window", 0)
+        warm_up = kwargs.pop("warm_up", False)
+        self.idle_timeout = kwargs.pop("idle_timeout", self._DEFAULT_IDLE_TIMEOUT)
+        if self.idle_timeout < 0:
+            raise ValueError(
+                "Invalid idle timeout %s, it must be positive" % self.idle_timeout
+            )
+        self._sg_jira = sg_jira.Bridge.get_bridge(settings)
+        if warm_up:
+            self._sg_jira.warm_up()
         # Note: BaseHTTPServer.HTTPServer is not a new style class so we can't use
         # super here
         BaseHTTPServer.HTTPServer.__init__(self, *args, **kwargs)
-        self._sg_jira = sg_jira.Bridge.get_bridge(settings)
+        # Accepted requests are queued and processed by the worker threads.
+        self._requests = Queue.Queue()
+        self._workers = self._start_workers(
+            max_threads, self._process_requests, "webapp_worker"
+        )
+        # Sync events are dispatched to the bridge worker threads: events for
+        # a given Shotgun Entity or Jira resource are processed in order,
+        # events for different Entities or resources are processed in parallel.
+        self._sg_jira.start_dispatcher(
+            async_workers or max_threads,
+            coalesce_window=coalesce_window,
+        )
+        # Events accepted in asynchronous mode are queued and fed to the
+        # bridge dispatcher by a dedicated thread.
+        self._events = None
+        self._event_feeders = []
+        if async_workers:
+            # Events pending from a previous run, if any, are processed first.
+            self._events = sg_jira.EventQueue(queue_file)
+            # Limit the number of events retrieved from the queue which are
+            # waiting to be processed.
+            self._events_in_flight = threading.BoundedSemaphore(
+                async_workers * self._MAX_EVENTS_IN_FLIGHT_PER_WORKER
+            )
+            self._event_feeders = self._start_workers(
+                1, self._feed_events, "webapp_event_feeder"
+            )
+
+    def _start_workers(self, count, target, name):
+        """
+        Start the given number of worker threads running the given callable.
+
+        :param int count: The number of threads to start.
+        :param target: A callable run by each thread.
+        :param str name: A base name for the threads.
+        :returns: A list of :class:`threading.Thread` instances.
+        """
+        workers = []
+        for i in range(count):
+            worker = threading.Thread(
+                target=target,
+                name="%s_%d" % (name, i),
+            )
+            worker.daemon = self.daemon_threads
+            worker.start()
+            workers.append(worker)
+        return workers
+
+    def process_request(self, request, client_address):
+        """
+        Override :class:`SocketServer.ThreadingMixIn` method to queue the
+        request for the worker threads instead of starting a new thread.
+        """
+        self._requests.put((request, client_address))
+
+    def _process_requests(self):
+        """
+        Process queued requests until a `None` request is retrieved.
+        """
+        while True:
+            queued = self._requests.get()
+            if queued is None:
+                return
+            # Errors are handled and the request is always shut down by this
+            # SocketServer.ThreadingMixIn method.
+            self.process_request_thread(*queued)
+
+    @property
+    def has_pending_requests(self):
+        """
+        Return `True` if some accepted requests are waiting for a worker thread,
+        `False` otherwise.
+        """
+        return not self._requests.empty()
+
+    @property
+    def is_asynchronous(self):
+        """
+        Return `True` if events are processed asynchronously, `False` otherwise.
+        """
+        return self._events is not None
+
+    def queue_event(self, direction, settings_name, entity_type, entity_key, event, parameters):
+        """
+        Queue the given event for asynchronous processing.
+
+        :param str direction: The sync direction, "sg2jira" or "jira2sg".
+        :param str settings_name: The name of the sync settings to use.
+        :param str entity_type: A Shotgun Entity type or a Jira resource type.
+        :param str entity_key: A Shotgun Entity id or a Jira resource key.
+        :param event: A dictionary with the event payload.
+        :param parameters: A dictionary with additional query parameters.
+        :raises RuntimeError: if the server does not process events asynchronously.
+        """
+        if not self.is_asynchronous:
+            raise RuntimeError("Events are not processed asynchronously")
+        self._events.put({
+            "direction": direction,
+            "settings_name": settings_name,
+            "entity_type": entity_type,
+            "entity_key": entity_key,
+            "event": event,
+            "parameters": parameters,
+        })
+
+    def _feed_events(self):
+        """
+        Dispatch queued events until a `None` event is retrieved.
+        """
+        while True:
+            self._events_in_flight.acquire()
+            queued = self._events.get()
+            if queued is None:
+                return
+            event_id, event = queued
+            self._dispatch_event(event_id, event)
+
+    def _dispatch_event(self, event_id, queued):
+        """
+        Dispatch the given queued event to the bridge.
+
+        Errors are logged and not propagated, since a response was already
+        sent for the request. Events which failed with a transient error, e.g.
+        Jira being unreachable, are not acknowledged: they are kept in the
+        queue and processed again when the server is restarted.
+
+        :param int event_id: The id of the event in the queue.
+        :param queued: A dictionary, as built by :meth:`queue_event`.
+        """
+        def event_processed(result, error):
+            try:
+                if error and sg_jira.utils.is_transient_error(error):
+                    # Keep the event in the queue, it is processed again after
+                    # a restart.
+                    logger.error(
+                        "Unable to process %s event for %s %s, keeping it for "
+                        "a later retry: %s" % (
+                            queued["direction"],
+                            queued["entity_type"],
+                            queued["entity_key"],
+                            error,
+                        )
+                    )
+                    return
+                if error:
+                    logger.error(
+                        "Unable to process %s event for %s %s: %s" % (
+                            queued["direction"],
+                            queued["entity_type"],
+                            queued["entity_key"],
+                            error,
+                        )
+                    )
+                # Events are only removed from the queue once they were
+                # processed, or failed for reasons which retrying them won't
+                # fix, so they are processed again after a restart if we're
+                # interrupted.
+                self._events.ack(event_id)
+            finally:
+                self._events_in_flight.release()
+
+        try:
+            self.dispatch_event(
+                queued["direction"],
+                queued["settings_name"],
+                queued["entity_type"],
+                queued["entity_key"],
+                queued["event"],
+                queued["parameters"],
+                callback=event_processed,
+            )
+        except Exception as e:
+            event_processed(None, e)
+
+    def dispatch_event(
+        self, direction, settings_name, entity_type, entity_key, event, parameters, callback=None
+    ):
+        """
+        Dispatch a sync for the given event to the SG Jira Bridge.
+
+        :param str direction: The sync direction, "sg2jira" or "jira2sg".
+        :param str settings_name: The name of the sync settings to use.
+        :param str entity_type: A Shotgun Entity type or a Jira resource type.
+        :param str entity_key: A Shotgun Entity id or a Jira resource key.
+        :param event: A dictionary with the event payload.
+        :param parameters: A dictionary with additional query parameters.
+        :param callback: Optional callable called with the result of the sync
+                         and the error, if any, once the sync completed.
+        :returns: A :class:`sg_jira.bridge.DispatchedCall` instance.
+        """
+        if direction == "sg2jira":
+            return self._sg_jira.dispatch_in_jira(
+                settings_name,
+                entity_type,
+                int(entity_key),
+                event=event,
+                callback=callback,
+                **parameters
+            )
+        return self._sg_jira.dispatch_in_shotgun(
+            settings_name,
+            entity_type,
+            entity_key,
+            event=event,
+            callback=callback,
+            **parameters
+        )
+
+    def server_close(self):
+        """
+        Stop the worker threads and close the server.
+        """
+        for worker in self._workers:
+            self._requests.put(None)
+        # Pending events are kept in the queue file, if any, and processed
+        # after a restart.
+        if self._events:
+            self._events.close()
+        self._sg_jira.stop_dispatcher()
+        BaseHTTPServer.HTTPServer.server_close(self)
 
     def sync_in_jira(self, *args, **kwargs):
         """
-        Just pass the given parameters to the SG Jira Brige method.
+        Dispatch a sync with the given parameters to the SG Jira Bridge and
+        wait for its result.
         """
-        return self._sg_jira.sync_in_jira(*args, **kwargs)
+        return self._sg_jira.dispatch_in_jira(*args, **kwargs).result()
 
     def sync_in_shotgun(self, *args, **kwargs):
         """
-        Just pass the given parameters to the SG Jira Brige method.
+        Dispatch a sync with the given parameters to the SG Jira Bridge and
+        wait for its result.
+        """
+        return self._sg_jira.dispatch_in_shotgun(*args, **kwargs).result()
+
+    def clear_caches(self):
+        """
+        Just pass the call to the SG Jira Bridge method.
+        """
+        self._sg_jira.clear_caches()
+
+    def get_manifest(self, settings_name):
+        """
+        Just pass the call to the SG Jira Bridge method.
         """
-        return self._sg_jira.sync_in_shotgun(*args, **kwargs)
+        return self._sg_jira.get_manifest(settings_name)
 
     @property
     def sync_settings_names(self):
@@ -76,25 +370,112 @@ class Server(BaseHTTPServer.HTTPServer):
 
 
 class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
-    request_version = "HTTP/1.0"  # TODO: support HTTP/1.1
+    """
+    Handle requests sent to the server.
+
+    HTTP/1.1 persistent connections are supported: connections are kept open
+    between requests until they are idle for the server idle timeout.
+    """
+    protocol_version = "HTTP/1.1"
+    # Read requests from the socket without buffering them, so a new request
+    # sent on a persistent connection can always be detected by checking the
+    # socket. Only the request and header lines are read byte per byte.
+    rbufsize = 0
+    # The number of seconds between checks for other connections waiting for a
+    # worker thread while a persistent connection is idle.
+    _IDLE_POLL_INTERVAL = 0.1
+
+    def setup(self):
+        """
+        Override :class:`SocketServer.StreamRequestHandler` method to not let a
+        stalled client hold a worker thread longer than the idle timeout.
+        """
+        self.timeout = self.server.idle_timeout or None
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+
+    def handle(self):
+        """
+        Override :class:`BaseHTTPServer.BaseHTTPRequestHandler` method to
+        close persistent connections when they are idle.
+        """
+        self.close_connection = 1
+        self.handle_one_request()
+        while not self.close_connection and self._wait_for_request():
+            self.handle_one_request()
+
+    def _wait_for_request(self):
+        """
+        Wait for a new request on a persistent connection.
+
+        An idle connection holds a worker thread, so it is closed when the idle
+        timeout is reached, or as soon as other connections are waiting for a
+        worker thread.
+
+        :returns: `True` if a request can be read, `False` if the connection
+                  should be closed.
+        """
+        idle_timeout = self.server.idle_timeout
+        if not idle_timeout:
+            return False
+        # Data read from the socket might already be buffered by the SSL layer.
+        pending = getattr(self.connection, "pending", None)
+        if pending and pending():
+            return True
+        end = time.time() + idle_timeout
+        while not self.server.has_pending_requests:
+            remaining = end - time.time()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select(
+                [self.connection], [], [], min(remaining, self._IDLE_POLL_INTERVAL)
+            )
+            if readable:
+                return True
+        return False
+
+    def _send_response(self, code, message, content=None, content_type="text/html"):
+        """
+        Send a response with the given code and message, and the given
+        content, if any.
+
+        A Content-Length header is always sent, allowing clients to send other
+        requests on the same connection.
+
+        :param int code: A HTTP status code.
+        :param str message: A message sent with the status code.
+        :param str content: Optional content.
+        :param str content_type: The type of the content, html by default.
+        """
+        self.send_response(code, message)
+        if content:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", len(content or ""))
+        if not self.server.idle_timeout:
+            self.send_header("Connection", "close")
+            self.close_connection = 1
+        self.end_headers()
+        if content:
+            self.wfile.write(content)
 
     def do_GET(self):
         """
         Handle a GET request.
+
+        The manifest of the syncer for a settings name, listing the Shotgun
+        fields it accepts events for, can be retrieved as JSON with the
+        sg2jira/Settings name/manifest url path.
         """
-        # Note: all responses must
-        # - send the response or error code first.
-        # - then, if there is some data, call end_headers to add a blank line.
-        # - then write the data, if any, with self.wfile.write
+        # Note: all responses must be sent with _send_response or send_error,
+        # so their length is known by clients.
 
         # Extract path components from the path, ignore leading '/' and
         # discard empty values coming from '/' at the end or multiple
         # contiguous '/'
         path_parts = [x for x in self.path[1:].split("/") if x]
         if not path_parts:
-            self.send_response(200, "The server is alive")
-            self.end_headers()
-            self.wfile.write(
+            self._send_response(
+                200,
+                "The server is alive",
                 HMTL_TEMPLATE % (
                     "The server is alive",
                     "The server is alive",
@@ -116,10 +497,13 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
         if settings_name not in self.server.sync_settings_names:
             self.send_error(400, "Invalid settings name %s" % settings_name)
             return
+        if len(path_parts) == 3 and path_parts[2] == "manifest":
+            self._send_manifest(settings_name)
+            return
         # Success, send a basic html page
-        self.send_response(200, "Syncing with %s settings." % settings_name)
-        self.end_headers()
-        self.wfile.write(
+        self._send_response(
+            200,
+            "Syncing with %s settings." % settings_name,
             HMTL_TEMPLATE % (
                 title,
                 title,
@@ -127,6 +511,24 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
             )
         )
 
+    def _send_manifest(self, settings_name):
+        """
+        Send the manifest of the syncer for the given settings name as JSON.
+
+        :param str settings_name: A settings name.
+        """
+        try:
+            manifest = self.server.get_manifest(settings_name)
+        except Exception as e:
+            self.send_error(500, "%s" % e)
+            return
+        self._send_response(
+            200,
+            "Manifest for %s settings." % settings_name,
+            json.dumps(manifest),
+            content_type="application/json",
+        )
+
     def do_POST(self):
         """
         Handle a POST request.
@@ -134,6 +536,9 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
         Post url paths need to have the forms:
           sg2jira/Settings name[/SG Entity type/SG Entity id]
           jira2sg/Settings name/Jira Resource type/Jira Resource key
+          sg2jira/Settings name/batch
+          jira2sg/Settings name/batch
+          admin/clear_caches
 
         If the SG Entity is not specified in the path, it must be specified in
         the provided payload.
@@ -148,6 +553,23 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
             # discard empty values coming from '/' at the end or multiple
             # contiguous '/'
             path_parts = [x for x in parsed.path[1:].split("/") if x]
+            # Read the body to get the payload. It must always be read, even if
+            # it is not used, to not be mistaken for a new request on a
+            # persistent connection.
+            body = self._read_body()
+            if body is None:
+                return
+            if path_parts and path_parts[0] == "admin":
+                self._handle_admin_request(path_parts[1:])
+                return
+            if len(path_parts) == 3 and path_parts[2] == "batch":
+                self._handle_batch_request(
+                    path_parts[0],
+                    path_parts[1],
+                    body,
+                    self._get_parameters(parsed),
+                )
+                return
             if len(path_parts) == 4:
                 direction, settings_name, entity_type, entity_key = path_parts
             elif len(path_parts) == 2:
@@ -155,12 +577,7 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
             else:
                 self.send_error(400, "Invalid request path %s" % self.path)
                 return
-            # Extract additional query parameters
-            # what they could be is still TBD, may be things like `dry_run=1`?
-            parameters = {}
-            if parsed.query:
-                parameters = urlparse.parse_qs(parsed.query, True, True)
-            # Read the body to get the payload
+            parameters = self._get_parameters(parsed)
             content_type = self.headers.getheader("content-type")
             # Check the content type, if not set we assume json.
             # We can have a charset just after the content type, e.g.
@@ -171,36 +588,36 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
                     "Invalid content %s, it must be 'application/json'" % content_type
                 )
                 return
-            content_len = int(self.headers.getheader("content-length", 0))
-            body = self.rfile.read(content_len)
             payload = {}
             if body:
                 payload = json.loads(body)
 
             # Basic routing: extract the synch direction and additional values
             # from the path
-            if direction == "sg2jira":
-                if not entity_type or not entity_key:
-                    # We need to retrieve this from the payload
-                    entity_type = payload.get("entity_type")
-                    entity_key = payload.get("entity_id")
-                if not entity_type or not entity_key:
-                    self.send_error(
-                        400,
-                        "Invalid request payload %s, unable to retrieve "
-                        "a Shotgun Entity type and its id." % (payload)
-                    )
-                    return
-                if not entity_key.isdigit():
-                    self.send_error(
-                        400,
-                        "Invalid Shotgun %s id %s, it must be a number." % (
-                            entity_type,
-                            entity_key,
-                        )
-                    )
+            try:
+                entity_type, entity_key = self._get_event_target(
+                    direction, entity_type, entity_key, payload
+                )
+            except ValueError as e:
+                self.send_error(400, "%s" % e)
+                return
+            if self.server.is_asynchronous:
+                # Check what we can before accepting the event, errors
+                # happening when the event is processed can't be reported.
+                if settings_name not in self.server.sync_settings_names:
+                    self.send_error(400, "Invalid settings name %s" % settings_name)
                     return
-
+                self.server.queue_event(
+                    direction,
+                    settings_name,
+                    entity_type,
+                    entity_key,
+                    payload,
+                    parameters,
+                )
+                self._send_response(202, "POST request accepted")
+                return
+            if direction == "sg2jira":
                 self.server.sync_in_jira(
                     settings_name,
                     entity_type,
@@ -208,17 +625,7 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
                     event=payload,
                     **parameters
                 )
-            elif direction == "jira2sg":
-                if not entity_type or not entity_key:
-                    # We can't retrieve this easily from the webhook payload without
-                    # hard coding a list of supported resource types, so we require
-                    # it to be specified in the path for the time being.
-                    self.send_error(
-                        400,
-                        "Invalid request path %s, it must include a Jira resource "
-                        "type and its key" % self.path
-                    )
-                    return
+            else:
                 # Settings name/Jira Resource type/Jira Resource key
                 self.server.sync_in_shotgun(
                     settings_name,
@@ -227,20 +634,267 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
                     event=payload,
                     **parameters
                 )
-            else:
-                self.send_error(
-                    400,
-                    "Invalid request path %s, don't know how to handle %s" % (
-                        self.path,
-                        direction
-                    )
-                )
-                return
-            self.send_response(200, "POST request successful")
-            self.end_headers()
+            self._send_response(200, "POST request successful")
         except Exception as e:
             self.send_error(500, e.message)
 
+    def _read_body(self):
+        """
+        Read the body of the current request, decoding it if it was sent with
+        the chunked transfer encoding.
+
+        If the body can't be read, an error is sent and the connection is
+        closed, since the next request on the connection can't be found.
+
+        :returns: The body as a string, or `None` if it can't be read.
+        """
+        transfer_encoding = self.headers.getheader("transfer-encoding")
+        if not transfer_encoding:
+            content_len = self.headers.getheader("content-length", "0")
+            if not content_len.strip().isdigit():
+                self.close_connection = 1
+                self.send_error(400, "Invalid Content-Length %s" % content_len)
+                return None
+            return self.rfile.read(int(content_len))
+        if transfer_encoding.strip().lower() != "chunked":
+            self.close_connection = 1
+            self.send_error(
+                411,
+                "Unsupported Transfer-Encoding %s, a Content-Length or the "
+                "chunked encoding is required" % transfer_encoding
+            )
+            return None
+        chunks = []
+        while True:
+            # Chunk extensions, if any, are ignored.
+            line = self.rfile.readline(65537)
+            try:
+                chunk_size = int(line.split(";", 1)[0].strip(), 16)
+            except ValueError:
+                self.close_connection = 1
+                self.send_error(400, "Invalid chunk size %s" % line.strip())
+                return None
+            if not chunk_size:
+                break
+            chunks.append(self.rfile.read(chunk_size))
+            # Discard the CRLF ending the chunk.
+            self.rfile.readline(65537)
+        # Discard trailer fields, up to the empty line ending the request.
+        while self.rfile.readline(65537) not in ["\r\n", "\n", ""]:
+            pass
+        return "".join(chunks)
+
+    def _get_parameters(self, parsed):
+        """
+        Return additional query parameters from the given parsed url.
+
+        What they could be is still TBD, may be things like `dry_run=1`?
+
+        :param parsed: A :class:`urlparse.ParseResult` instance.
+        :returns: A dictionary where keys are parameter names and values lists
+                  of values.
+        """
+        if not parsed.query:
+            return {}
+        return urlparse.parse_qs(parsed.query, True, True)
+
+    def _get_event_target(self, direction, entity_type, entity_key, payload):
+        """
+        Return the Shotgun Entity or Jira resource an event should be synced
+        for.
+
+        :param str direction: The sync direction, "sg2jira" or "jira2sg".
+        :param str entity_type: A Shotgun Entity type or a Jira resource type,
+                                or `None`.
+        :param str entity_key: A Shotgun Entity id or a Jira resource key, or
+                               `None`.
+        :param payload: A dictionary with the event payload, used to retrieve
+                        the Shotgun Entity if not specified.
+        :returns: A tuple with an Entity or resource type and an Entity id or
+                  resource key.
+        :raises ValueError: if the Entity or resource can't be retrieved.
+        """
+        if direction == "sg2jira":
+            if not entity_type or not entity_key:
+                # We need to retrieve this from the payload
+                entity_type = payload.get("entity_type")
+                entity_key = payload.get("entity_id")
+            if not entity_type or not entity_key:
+                raise ValueError(
+                    "Invalid request payload %s, unable to retrieve "
+                    "a Shotgun Entity type and its id." % (payload)
+                )
+            # Ids retrieved from the payload can be numbers.
+            entity_key = "%s" % entity_key
+            if not entity_key.isdigit():
+                raise ValueError(
+                    "Invalid Shotgun %s id %s, it must be a number." % (
+                        entity_type,
+                        entity_key,
+                    )
+                )
+        elif direction == "jira2sg":
+            if not entity_type or not entity_key:
+                # We can't retrieve this easily from the webhook payload without
+                # hard coding a list of supported resource types, so we require
+                # it to be specified in the path for the time being.
+                raise ValueError(
+                    "Invalid request path %s, it must include a Jira resource "
+                    "type and its key" % self.path
+                )
+        else:
+            raise ValueError(
+                "Invalid request path %s, don't know how to handle %s" % (
+                    self.path,
+                    direction
+                )
+            )
+        return entity_type, entity_key
+
+    def _read_batch(self, body):
+        """
+        Return the list of events posted in a batch.
+
+        Events can be posted as a JSON array, or as newline delimited JSON
+        with the "application/x-ndjson" content type.
+
+        :param str body: The request body.
+        :returns: A list of events.
+        :raises ValueError: if the events can't be read.
+        """
+        content_type = self.headers.getheader("content-type")
+        if content_type and re.search(r"\s*application/x-ndjson\s*;?", content_type):
+            return [json.loads(line) for line in body.splitlines() if line.strip()]
+        if content_type and not re.search(r"\s*application/json\s*;?", content_type):
+            raise ValueError(
+                "Invalid content %s, it must be 'application/json' or "
+                "'application/x-ndjson'" % content_type
+            )
+        events = json.loads(body) if body else []
+        if not isinstance(events, list):
+            raise ValueError("Invalid batch, it must be a list of events")
+        return events
+
+    def _handle_batch_request(self, direction, settings_name, body, parameters):
+        """
+        Handle a request posting a batch of events.
+
+        Each event is a dictionary with the same payload as events posted
+        individually, and must include the targeted Shotgun Entity with
+        "entity_type" and "entity_id" keys, or the targeted Jira resource with
+        "entity_type" and "entity_key" keys.
+
+        Events are validated with the same rules as events posted individually
+        and processed in order, invalid events don't prevent other events from
+        being processed. A JSON response is sent with a result for each event:
+        a dictionary with a HTTP like "status" code and an "error" message if
+        the event was not successfully processed. Events which failed because
+        of a transient error, e.g. Jira being unavailable, have a 503 status
+        and can be posted again, other failures have a 422 status.
+
+        :param str direction: The sync direction, "sg2jira" or "jira2sg".
+        :param str settings_name: The name of the settings to use.
+        :param str body: The request body.
+        :param parameters: A dictionary with additional query parameters.
+        """
+        if direction not in ["sg2jira", "jira2sg"]:
+            self.send_error(
+                400,
+                "Invalid request path %s, don't know how to handle %s" % (
+                    self.path,
+                    direction
+                )
+            )
+            return
+        if settings_name not in self.server.sync_settings_names:
+            self.send_error(400, "Invalid settings name %s" % settings_name)
+            return
+        try:
+            events = self._read_batch(body)
+        except ValueError as e:
+            self.send_error(400, "%s" % e)
+            return
+        results = []
+        dispatched = []
+        for event in events:
+            if not isinstance(event, dict):
+                results.append({
+                    "status": 400,
+                    "error": "Invalid event %s, it must be a dictionary" % (event,)
+                })
+                continue
+            entity_type = None
+            entity_key = None
+            if direction == "jira2sg":
+                entity_type = event.get("entity_type")
+                entity_key = event.get("entity_key")
+            try:
+                entity_type, entity_key = self._get_event_target(
+                    direction, entity_type, entity_key, event
+                )
+            except ValueError as e:
+                results.append({"status": 400, "error": "%s" % e})
+                continue
+            if self.server.is_asynchronous:
+                self.server.queue_event(
+                    direction,
+                    settings_name,
+                    entity_type,
+                    entity_key,
+                    event,
+                    parameters,
+                )
+                results.append({"status": 202})
+                continue
+            # Dispatch all events before waiting for their results, so events
+            # for different Entities or resources are processed in parallel.
+            result = {"status": 200}
+            try:
+                dispatched.append((
+                    result,
+                    self.server.dispatch_event(
+                        direction,
+                        settings_name,
+                        entity_type,
+                        entity_key,
+                        event,
+                        parameters,
+                    )
+                ))
+            except Exception as e:
+                result = {"status": 500, "error": "%s" % e}
+            results.append(result)
+        for result, call in dispatched:
+            try:
+                call.result()
+            except Exception as e:
+                # Senders post events again if their status is 429 or >= 500,
+                # which would be pointless for errors which are not transient.
+                if sg_jira.utils.is_transient_error(e):
+                    result["status"] = 503
+                else:
+                    result["status"] = 422
+                result["error"] = "%s" % e
+        self._send_response(
+            200,
+            "Batch processed",
+            json.dumps({"results": results}),
+            content_type="application/json",
+        )
+
+    def _handle_admin_request(self, path_parts):
+        """
+        Handle an administration request.
+
+        :param path_parts: A list of path components, without the leading
+                           "admin" component.
+        """
+        if path_parts == ["clear_caches"]:
+            self.server.clear_caches()
+            self._send_response(200, "Caches cleared")
+            return
+        self.send_error(400, "Invalid admin request %s" % self.path)
+
     def log_message(self, format, *args):
         """
         Override :class:`BaseHTTPServer.BaseHTTPRequestHandler` method to use a
@@ -264,7 +918,10 @@ class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
         logger.error(message)
 
 
-def run_server(port, settings, keyfile=None, certfile=None):
+def run_server(
+    port, settings, keyfile=None, certfile=None, max_threads=1, async_workers=0,
+    queue_file=None, coalesce_window=0, warm_up=False, idle_timeout=30
+):
     """
     Run the server until a shutdown is requested.
 
@@ -272,10 +929,27 @@ def run_server(port, settings, keyfile=None, certfile=None):
     :param str settings: Path to settings file.
     :param str keyfile: Optional path to a PEM key file to run in https mode.
     :param str certfile:  Optional path to a PEM certificate file to run in https mode.
+    :param int max_threads: Maximum number of requests to process concurrently.
+    :param int async_workers: Optional number of background workers to process
+                              events asynchronously.
+    :param str queue_file: Optional full path to a file used to persist events
+                           queued in asynchronous mode.
+    :param float coalesce_window: Optional number of seconds to wait for other
+                                  changes to a Shotgun Entity before syncing it.
+    :param bool warm_up: Optional, if `True` all syncers are setup before the
+                         server starts listening.
+    :param float idle_timeout: Optional number of seconds persistent connections
+                               are kept open without receiving a request.
     """
     httpd = Server(
         settings,
-        ("localhost", port), RequestHandler
+        ("localhost", port), RequestHandler,
+        max_threads=max_threads,
+        async_workers=async_workers,
+        queue_file=queue_file,
+        coalesce_window=coalesce_window,
+        warm_up=warm_up,
+        idle_timeout=idle_timeout,
     )
     if keyfile and certfile:
         # Activate https
@@ -311,6 +985,43 @@ def main():
         help="A key and certificate file pair to run the server in https mode.",
         nargs=2,
     )
+    parser.add_argument(
+        "--max_threads",
+        type=int,
+        default=1,
+        help="The maximum number of requests to process concurrently.",
+    )
+    parser.add_argument(
+        "--async_workers",
+        type=int,
+        default=0,
+        help="Accept events immediately and process them in the background "
+             "with the given number of workers.",
+    )
+    parser.add_argument(
+        "--queue_file",
+        help="Full path to a file where to persist events accepted in "
+             "asynchronous mode, so they can be processed after a restart.",
+    )
+    parser.add_argument(
+        "--coalesce_window",
+        type=float,
+        default=0,
+        help="A number of seconds to wait for other changes to a Shotgun Entity "
+             "before syncing it, allowing to sync multiple changes at once.",
+    )
+    parser.add_argument(
+        "--warm_up",
+        action="store_true",
+        help="Setup all syncers before accepting requests.",
+    )
+    parser.add_argument(
+        "--idle_timeout",
+        type=float,
+        default=30,
+        help="The number of seconds connections are kept open without "
+             "receiving a request, 0 to close them after each request.",
+    )
 
     args = parser.parse_args()
 
@@ -324,6 +1035,12 @@ def main():
         settings=args.settings,
         keyfile=keyfile,
         certfile=certfile,
+        max_threads=args.max_threads,
+        async_workers=args.async_workers,
+        queue_file=args.queue_file,
+        coalesce_window=args.coalesce_window,
+        warm_up=args.warm_up,
+        idle_timeout=args.idle_timeout,
     )
 
 